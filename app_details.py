@@ -0,0 +1,309 @@
+"""스토어 appdetails API로 검색 결과의 빠진 가격/메타데이터를 채웁니다.
+
+검색 결과 행에는 가격이 빠진 경우가 있어(예: Counter-Strike 2의 price가 N/A)
+appdetails API로 보완합니다.
+
+- 가격: `filters=price_overview`일 때만 appids에 여러 app_id를 쉼표로 넣을 수 있으므로
+  PRICE_BATCH_SIZE개씩 묶어 한 번에 요청합니다.
+- 메타데이터(무료 여부, 장르, 출시일. 장르는 tags가 아닌 genres 필드): 다른 필터는 app_id 하나씩만 받으므로 details=True일 때만,
+  가격 단계 뒤에도 가격이나 출시일이 빠진 게임만 개별로 요청합니다.
+- 결과는 app_id별로 SQLite 캐시에 TTL과 함께 저장해, 묶음 구성이 달라져도 다시 요청하지 않습니다.
+
+사용 예:
+    enricher = AppDetailsEnricher()
+    enricher.enrich(games_data)   # games_data의 dict를 제자리에서 채웁니다
+"""
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import http_client
+from rate_limit import TokenBucket, run_jobs
+
+DEFAULT_BASE_URL = "https://store.steampowered.com"
+DEFAULT_CACHE_PATH = "./.cache/app_details.sqlite"
+
+# 요청 하나에 넣을 app_id 수 (URL 길이를 고려한 값)
+PRICE_BATCH_SIZE = 100
+# 가격은 자주 바뀌고, 장르/출시일은 거의 바뀌지 않습니다.
+PRICE_TTL = 3600
+DETAILS_TTL = 7 * 24 * 3600
+DETAIL_FILTERS = "basic,genres,release_date"
+
+# 검색 결과에서 값이 없을 때 쓰는 표시
+MISSING = ("N/A", "", None)
+
+
+class AppDetailsCache:
+    """app_id별 appdetails 결과를 저장하는 SQLite 캐시입니다.
+
+    같은 app_id라도 종류(kind: 'price', 'details')와 지역(region)이 다르면 따로 저장합니다.
+    API가 데이터를 주지 않은 게임(판매 종료 등)도 None으로 저장해 TTL 동안 다시 묻지 않습니다.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttls=None):
+        self.path = path
+        self.ttls = {"price": PRICE_TTL, "details": DETAILS_TTL, **(ttls or {})}
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS app_details (
+                app_id INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                region TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                data TEXT,
+                PRIMARY KEY (app_id, kind, region)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+
+    def get_many(self, app_ids, kind, region, now=None):
+        """TTL 안에 저장된 결과를 {app_id: 데이터(없으면 None)}로 반환합니다."""
+        app_ids = [int(app_id) for app_id in app_ids]
+        fresh_after = (now or time.time()) - self.ttls[kind]
+        found = {}
+        with self._lock:
+            # SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회합니다.
+            for i in range(0, len(app_ids), 500):
+                chunk = app_ids[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT app_id, data FROM app_details WHERE kind = ? AND region = ? "
+                    f"AND fetched_at >= ? AND app_id IN ({', '.join('?' * len(chunk))})",
+                    [kind, region, fresh_after, *chunk],
+                ).fetchall()
+                for app_id, data in rows:
+                    found[app_id] = json.loads(data) if data is not None else None
+        return found
+
+    def put_many(self, results, kind, region, now=None):
+        """{app_id: 데이터}를 트랜잭션 하나로 저장합니다."""
+        now = now or time.time()
+        rows = [(int(app_id), kind, region, now, json.dumps(data) if data is not None else None)
+                for app_id, data in results.items()]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO app_details (app_id, kind, region, fetched_at, data) "
+                "VALUES (?, ?, ?, ?, ?)", rows,
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _app_id(game):
+    """게임 정보의 app_id를 정수로 반환합니다. 없거나 숫자가 아니면 None입니다."""
+    try:
+        return int(game.get("app_id"))
+    except (TypeError, ValueError):
+        return None
+
+
+def needs_price(game):
+    return game.get("price") in MISSING
+
+
+def needs_details(game):
+    # 검색 결과 행에는 태그가 거의 없으므로 태그로 판단하면 거의 모든 게임을 개별 요청하게 됩니다.
+    return game.get("price") in MISSING or game.get("release_date") in MISSING
+
+
+class AppDetailsEnricher:
+    """
+    appdetails API로 게임 정보 dict의 빠진 값을 채웁니다.
+
+    Parameters:
+    -----------
+    base_url : str
+        스토어 주소 (로컬 테스트 서버를 쓸 때 바꿉니다)
+    region : str
+        가격 통화를 정하는 국가 코드 (기본값: 'US')
+    cache : AppDetailsCache
+        app_id별 결과 캐시 (기본값: AppDetailsCache())
+    batch_size : int
+        가격 요청 하나에 넣을 app_id 수 (기본값: PRICE_BATCH_SIZE)
+    max_concurrency : int
+        동시에 진행할 최대 요청 수 (기본값: 4)
+    rate : float
+        초당 허용할 요청 수 (기본값: 1.0)
+    bucket : TokenBucket
+        검색 수집 등과 요청 속도 한도를 함께 쓸 때 넘깁니다. (주면 rate는 무시)
+    """
+
+    def __init__(self, base_url=DEFAULT_BASE_URL, region="US", cache=None,
+                 batch_size=PRICE_BATCH_SIZE, max_concurrency=4, rate=1.0, bucket=None):
+        self.base_url = base_url
+        self.region = region
+        self.cache = cache or AppDetailsCache()
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.rate = rate
+        self.bucket = bucket or TokenBucket(rate=rate)
+        self.requests_sent = 0
+
+    def enrich(self, games, details=False):
+        """
+        게임 정보 dict 리스트의 빠진 가격/할인(과 details=True이면 출시일)을 제자리에서 채웁니다.
+
+        이미 값이 있는 필드는 바꾸지 않습니다.
+
+        Parameters:
+        -----------
+        games : list
+            SteamGameScraper가 반환한 게임 정보 리스트
+        details : bool
+            True이면 묶음 가격 요청 뒤에도 가격이나 출시일이 빠진 게임을 하나씩 더 요청합니다.
+            (게임마다 요청 하나이므로 기본값은 False)
+
+        Returns:
+        --------
+        dict: {"price": 가격을 채운 게임 수, "details": 메타데이터를 채운 게임 수,
+               "requests": 보낸 요청 수}
+        """
+        sent_before = self.requests_sent
+        filled = {"price": 0, "details": 0}
+
+        targets = [game for game in games if needs_price(game) and _app_id(game) is not None]
+        prices = self.fetch_prices({_app_id(game) for game in targets})
+        for game in targets:
+            overview = prices.get(_app_id(game))
+            if overview:
+                _apply_price(game, overview)
+                filled["price"] += 1
+
+        if details:
+            targets = [game for game in games if needs_details(game) and _app_id(game) is not None]
+            found = self.fetch_details({_app_id(game) for game in targets})
+            for game in targets:
+                data = found.get(_app_id(game))
+                if data and _apply_details(game, data):
+                    filled["details"] += 1
+
+        filled["requests"] = self.requests_sent - sent_before
+        return filled
+
+    def fetch_prices(self, app_ids):
+        """app_id들의 price_overview를 {app_id: price_overview(없으면 None)}로 반환합니다."""
+        app_ids = sorted(set(app_ids))
+        results = self.cache.get_many(app_ids, "price", self.region)
+        missing = [app_id for app_id in app_ids if app_id not in results]
+
+        batches = [missing[i:i + self.batch_size] for i in range(0, len(missing), self.batch_size)]
+        jobs = [(f"가격 {len(batch)}개 요청", lambda batch=batch: self._fetch_price_batch(batch))
+                for batch in batches]
+        fetched = {}
+        for batch_result in self._run_jobs(jobs):
+            fetched.update(batch_result)
+
+        self.cache.put_many(fetched, "price", self.region)
+        results.update(fetched)
+        return results
+
+    def fetch_details(self, app_ids):
+        """app_id들의 기본 정보/장르/출시일을 {app_id: data(없으면 None)}로 반환합니다."""
+        app_ids = sorted(set(app_ids))
+        results = self.cache.get_many(app_ids, "details", self.region)
+        missing = [app_id for app_id in app_ids if app_id not in results]
+
+        jobs = [(f"상세 정보 {app_id} 요청", lambda app_id=app_id: self._fetch_app_details(app_id))
+                for app_id in missing]
+        fetched = {}
+        for app_result in self._run_jobs(jobs):
+            fetched.update(app_result)
+
+        self.cache.put_many(fetched, "details", self.region)
+        results.update(fetched)
+        return results
+
+    def _request(self, params):
+        # 묶음 구성에 따라 URL이 달라지므로 URL 단위 HTTP 캐시 대신 app_id별 캐시를 씁니다.
+        response = http_client.get(f"{self.base_url}/api/appdetails", params=params,
+                                   language="en", use_cache=False)
+        response.raise_for_status()
+        return response.json() or {}
+
+    def _fetch_price_batch(self, app_ids):
+        data = self._request({
+            "appids": ",".join(str(app_id) for app_id in app_ids),
+            "filters": "price_overview",
+            "cc": self.region,
+        })
+        results = {}
+        for app_id in app_ids:
+            entry = data.get(str(app_id)) or {}
+            # 무료 게임이나 가격이 없는 게임은 data가 빈 리스트로 옵니다.
+            payload = entry.get("data") if entry.get("success") else None
+            results[app_id] = payload.get("price_overview") if isinstance(payload, dict) else None
+        return results
+
+    def _fetch_app_details(self, app_id):
+        data = self._request({
+            "appids": app_id,
+            "filters": DETAIL_FILTERS,
+            "cc": self.region,
+            "l": "english",
+        })
+        entry = data.get(str(app_id)) or {}
+        payload = entry.get("data") if entry.get("success") else None
+        return {app_id: payload if isinstance(payload, dict) and payload else None}
+
+    def _run_jobs(self, jobs):
+        """(이름, 함수) 작업들을 동시에 실행하고 성공한 작업의 결과만 반환합니다."""
+        if not jobs:
+            return []
+        self.requests_sent += len(jobs)
+
+        return asyncio.run(run_jobs(jobs, self.max_concurrency, self.bucket, default={}))
+
+
+def _apply_price(game, overview):
+    """price_overview 값으로 가격/정가/할인율을 채웁니다."""
+    final = overview.get("final_formatted")
+    if not final:
+        return
+    game["price"] = final
+    game["original_price"] = overview.get("initial_formatted") or final
+    game["discount"] = int(overview.get("discount_percent") or 0)
+
+
+def _apply_details(game, data):
+    """상세 정보로 빠진 값을 채우고, 하나라도 채웠으면 True를 반환합니다."""
+    changed = False
+    if game.get("price") in MISSING and data.get("is_free"):
+        game["price"] = "Free to Play"
+        changed = True
+    # 장르는 사용자 태그와 다른 분류이므로 tags에 섞지 않고 genres에 따로 둡니다.
+    if not game.get("genres") and data.get("genres"):
+        game["genres"] = [genre["description"] for genre in data["genres"] if genre.get("description")]
+        changed = True
+    release_date = (data.get("release_date") or {}).get("date")
+    if game.get("release_date") in MISSING and release_date:
+        game["release_date"] = release_date
+        changed = True
+    return changed
+
+
+def enrich(games, base_url=DEFAULT_BASE_URL, region="US", details=False, **options):
+    """AppDetailsEnricher를 만들어 games를 채우고 결과 요약을 출력합니다."""
+    owns_cache = "cache" not in options
+    enricher = AppDetailsEnricher(base_url=base_url, region=region, **options)
+    try:
+        filled = enricher.enrich(games, details=details)
+    finally:
+        if owns_cache:
+            enricher.cache.close()
+    print(f"🔎 appdetails 보완: 가격 {filled['price']}개, 메타데이터 {filled['details']}개 "
+          f"(요청 {filled['requests']}회)")
+    return filled
@@ -0,0 +1,57 @@
+"""appdetails 보완 단계의 요청 수와 시간을 로컬 서버로 측정합니다.
+
+사용법:
+    python benchmarks/bench_enrich.py [--games 500] [--batch-size 100]
+
+로컬 서버에서 games개를 수집한 뒤 빈 캐시로 한 번(콜드), 같은 캐시로 한 번 더(웜) 보완합니다.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import http_client  # noqa: E402
+import stand_in_server  # noqa: E402
+from app_details import AppDetailsCache, AppDetailsEnricher, needs_details, needs_price  # noqa: E402
+from rank3 import SteamGameScraper  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=50.0)
+    parser.add_argument("--details", action="store_true", help="개별 메타데이터 요청도 합니다")
+    args = parser.parse_args()
+
+    http_client.configure_cache(enabled=False)
+    server, base_url = stand_in_server.start(catalog_size=args.games)
+    scraper = SteamGameScraper()
+    scraper.base_url = base_url
+    games = scraper.get_top_games_bulk(total=args.games, rate=args.rate)
+    print(f"게임 {len(games)}개: 가격 없음 {sum(map(needs_price, games))}개, "
+          f"메타데이터 보완 필요 {sum(map(needs_details, games))}개")
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = AppDetailsCache(os.path.join(directory, "app_details.sqlite"))
+        for label in ("콜드", "웜"):
+            copies = [dict(game) for game in games]
+            enricher = AppDetailsEnricher(base_url=base_url, cache=cache,
+                                          batch_size=args.batch_size, rate=args.rate)
+            start = time.perf_counter()
+            filled = enricher.enrich(copies, details=args.details)
+            elapsed = time.perf_counter() - start
+            print(f"{label}: 요청 {filled['requests']}회, {elapsed * 1000:.0f}ms, "
+                  f"가격 {filled['price']}개 / 메타데이터 {filled['details']}개 보완, "
+                  f"남은 가격 없음 {sum(map(needs_price, copies))}개")
+        cache.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""HTML 파서 백엔드별 검색 결과 행 추출 속도를 비교합니다.
+
+사용법:
+    python benchmarks/bench_parser.py [--repeat 20] [fixture.html ...]
+
+fixture를 지정하지 않으면 benchmarks/fixtures/search_*.html을 사용합니다.
+각 백엔드는 html.parser와 같은 게임 정보를 만들어야 하며, 다르면 표시합니다.
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import html_backend  # noqa: E402
+from rank3 import SteamGameScraper  # noqa: E402
+
+FIXTURE_DIR = os.path.join(ROOT, "benchmarks", "fixtures")
+
+
+def run_backend(name, pages, repeat):
+    """파싱 + 행 추출을 repeat번 반복하고 (초당 행 수, 결과)를 반환합니다."""
+    scraper = SteamGameScraper(parser=name)
+    results = [scraper._parse_games(scraper.parser.parse(html)) for html in pages]
+
+    rows = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            rows += len(scraper._parse_games(scraper.parser.parse(html)))
+    elapsed = time.perf_counter() - start
+    return rows / elapsed, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("fixtures", nargs="*")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    paths = args.fixtures or sorted(glob.glob(os.path.join(FIXTURE_DIR, "search_*.html")))
+    if not paths:
+        print("벤치마크할 fixture가 없습니다.")
+        return
+    pages = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            pages.append(f.read())
+
+    print(f"fixture {len(pages)}개, 반복 {args.repeat}회")
+    baseline_rate, baseline_results = run_backend("html.parser", pages, args.repeat)
+    print(f"{'html.parser':<12} {baseline_rate:>10.0f} rows/s  x1.00")
+
+    for name in html_backend.available_backends():
+        if name == "html.parser":
+            continue
+        rate, results = run_backend(name, pages, args.repeat)
+        same = "같음" if results == baseline_results else "결과 다름!"
+        print(f"{name:<12} {rate:>10.0f} rows/s  x{rate / baseline_rate:.2f}  ({same})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""SteamDataAnalyzer._preprocess_data의 열 단위 처리와 이전 행 단위 처리 속도를 비교합니다.
+
+사용법:
+    python benchmarks/bench_preprocess.py [--rows 1000000]
+
+기록된 검색 결과 fixture의 행을 rows개가 될 때까지 반복해서 데이터를 만듭니다.
+"""
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from rank3 import REVIEW_SCORE_MAP, SteamDataAnalyzer, SteamGameScraper  # noqa: E402
+
+FIXTURE_DIR = os.path.join(ROOT, "benchmarks", "fixtures")
+
+
+def build_frame(rows):
+    """fixture에서 추출한 게임들을 rows개로 늘린 DataFrame을 만듭니다."""
+    scraper = SteamGameScraper()
+    games = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "search_*.html"))):
+        with open(path, encoding="utf-8") as f:
+            games.extend(scraper._parse_games(scraper.parser.parse(f.read())))
+    base = pd.DataFrame(games)
+    repeat = -(-rows // len(base))
+    return pd.concat([base] * repeat, ignore_index=True).head(rows)
+
+
+def legacy_clean_price(price_str):
+    """이전 SteamDataAnalyzer._clean_price입니다. (가격 문자열 하나를 정규식으로 숫자로 변환)"""
+    if pd.isna(price_str) or price_str in ["N/A", "Free to Play"] or "Free" in str(price_str):
+        return 0
+
+    price_match = re.search(r'[\d,.]+', str(price_str))
+    if price_match:
+        return float(price_match.group().replace(',', ''))
+    return 0
+
+
+def legacy_preprocess(analyzer):
+    """행마다 파이썬 함수를 호출하던 이전 전처리 방식입니다."""
+    analyzer.df['rank'] = range(1, len(analyzer.df) + 1)
+    analyzer.df['price_numeric'] = analyzer.df['price'].apply(legacy_clean_price)
+    analyzer.df['original_price_numeric'] = analyzer.df['original_price'].apply(legacy_clean_price)
+    analyzer.df['review_score_numeric'] = analyzer.df['review_score'].map(
+        lambda x: REVIEW_SCORE_MAP.get(x, 0)
+    )
+
+
+def run(frame, preprocess):
+    analyzer = SteamDataAnalyzer.__new__(SteamDataAnalyzer)
+    analyzer.df = frame.copy()
+    start = time.perf_counter()
+    preprocess(analyzer)
+    return time.perf_counter() - start, analyzer.df
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    frame = build_frame(args.rows)
+    print(f"{len(frame):,}행")
+
+    legacy_time, legacy_df = run(frame, legacy_preprocess)
+    print(f"이전 방식 (apply/map)  {legacy_time:8.3f}초")
+
+    vector_time, vector_df = run(frame, SteamDataAnalyzer._preprocess_data)
+    print(f"열 단위 처리           {vector_time:8.3f}초  x{legacy_time / vector_time:.1f}")
+
+    for column in ("price_numeric", "original_price_numeric", "review_score_numeric"):
+        same = np.array_equal(legacy_df[column].to_numpy(dtype=float),
+                              vector_df[column].to_numpy(dtype=float))
+        print(f"- {column}: {'같음' if same else '다름!'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""차트 페이지와 featuredcategories 응답 fixture를 만듭니다.
+
+차트 페이지(/charts/topselling, /charts/mostplayed)는 브라우저에서 그려지므로 원본 HTML에는
+행이 없습니다. 여기서는 기록된 검색 결과 행의 게임 정보로, rank4/rank6의 선택자가 가리키는
+렌더링 후 DOM 구조와 featuredcategories JSON 구조를 그대로 만들어 benchmarks/fixtures에 저장합니다.
+
+사용법:
+    python benchmarks/make_fixtures.py [--rows 100]
+"""
+import argparse
+import html
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from stand_in_server import FIXTURE_DIR, build_app_index, build_catalog  # noqa: E402
+
+TOP_SELLING_ROW = """<tr class="weeklytopsellers_TableRow_2-RN6">
+<td class="weeklytopsellers_RankCell_34h48">{rank}</td>
+<td class="weeklytopsellers_CapsuleCell_18A-0"><a href="https://store.steampowered.com/app/{app_id}/"><img class="weeklytopsellers_CapsuleArt_2dODJ" src="https://shared.fastly.steamstatic.com/store_item_assets/steam/apps/{app_id}/capsule_231x87.jpg" alt="{title}"><div class="weeklytopsellers_GameName_1n_4-">{title}</div></a></td>
+<td class="weeklytopsellers_PriceCell_3cv3g"><div class="salepreviewwidgets_StoreSalePriceBox_Wh0L8">{price}</div></td>
+<td class="weeklytopsellers_ChangeCell_3fJ8y">{change}</td>
+<td class="weeklytopsellers_WeeksCell_2CzRq">{weeks}</td>
+</tr>"""
+
+# rank4(해시 클래스)와 rank6(dailyglobaltopsellers_ 접두사) 선택자가 모두 가리키는 행
+MOST_PLAYED_ROW = """<tr class="dailyglobaltopsellers_TableRow_2-RN6 _3sNv_-650xY1R0X-wD-J_">
+<td class="dailyglobaltopsellers_RankCell_34h48">{rank}</td>
+<td class="dailyglobaltopsellers_CapsuleCell_18A-0"><a href="https://store.steampowered.com/app/{app_id}/"><div class="dailyglobaltopsellers_GameName_1n_4- XFdLdY_1c1G9a-i_2gUz_">{title}</div></a></td>
+<td class="dailyglobaltopsellers_ConcurrentCell_3L0CD"><div class="C5X6j2e_uTYG6_S7dI5nU">{current}</div></td>
+<td class="dailyglobaltopsellers_ConcurrentCell_3L0CD">{peak}</td>
+</tr>"""
+
+PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title></head>
+<body><div id="application_root"><div class="{table_class}"><table><tbody>
+{rows}
+</tbody></table></div></div></body></html>
+"""
+
+
+def _krw(cents):
+    return "무료" if cents == 0 else f"₩ {cents * 13:,}"
+
+
+def build_fixtures(rows=100):
+    """(파일 이름, 내용) 목록을 반환합니다."""
+    catalog = build_catalog(rows)
+    apps = list(build_app_index(catalog).items())[:rows]
+
+    top_selling = []
+    most_played = []
+    for rank, (app_id, app) in enumerate(apps, 1):
+        title = html.escape(app["name"])
+        overview = app["price_overview"]
+        top_selling.append(TOP_SELLING_ROW.format(
+            rank=rank, app_id=app_id, title=title, price=_krw(overview["final"] if overview else 0),
+            change="NEW" if rank % 7 == 0 else f"{rank % 5}", weeks=rank % 30 + 1,
+        ))
+        current = 1_500_000 // rank
+        most_played.append(MOST_PLAYED_ROW.format(
+            rank=rank, app_id=app_id, title=title, current=f"{current:,}", peak=f"{current * 3 // 2:,}",
+        ))
+
+    def items(selected):
+        result = []
+        for app_id, app in selected:
+            overview = app["price_overview"] or {"initial": 0, "final": 0, "discount_percent": 0}
+            result.append({
+                "id": app_id,
+                "type": 0,
+                "name": app["name"],
+                "discounted": overview["discount_percent"] > 0,
+                "discount_percent": overview["discount_percent"],
+                "original_price": overview["initial"],
+                "final_price": overview["final"],
+                "currency": "USD",
+                "large_capsule_image": f"https://shared.fastly.steamstatic.com/store_item_assets/steam/apps/{app_id}/capsule_616x353.jpg",
+                "small_capsule_image": f"https://shared.fastly.steamstatic.com/store_item_assets/steam/apps/{app_id}/capsule_184x69.jpg",
+                "windows_available": True,
+                "mac_available": False,
+                "linux_available": False,
+                "streamingvideo_available": False,
+                "header_image": f"https://shared.fastly.steamstatic.com/store_item_assets/steam/apps/{app_id}/header.jpg",
+                "controller_support": "full",
+            })
+        return result
+
+    featured = {
+        "specials": {"id": "cat_specials", "name": "Specials",
+                     "items": items([app for app in apps
+                                     if app[1]["price_overview"]
+                                     and app[1]["price_overview"]["discount_percent"]])},
+        "coming_soon": {"id": "cat_comingsoon", "name": "Coming Soon", "items": items(apps[-10:])},
+        "top_sellers": {"id": "cat_topsellers", "name": "Top Sellers", "items": items(apps)},
+        "new_releases": {"id": "cat_newreleases", "name": "New Releases", "items": items(apps[:30])},
+        "genres": {"id": "cat_genres", "name": "Genres"},
+        "trailerslideshow": {"id": "cat_trailerslideshow", "name": "Trailer Slideshow"},
+        "status": 1,
+    }
+
+    return [
+        ("charts_topselling_KR.html", PAGE.format(title="Steam Charts: Top Sellers",
+                                                  table_class="weeklytopsellers_ChartTable_3arZn",
+                                                  rows="\n".join(top_selling))),
+        ("charts_mostplayed.html", PAGE.format(title="Steam Charts: Most Played",
+                                               table_class="dailyglobaltopsellers_ChartTable_3arZn",
+                                               rows="\n".join(most_played))),
+        ("featuredcategories.json", json.dumps(featured, ensure_ascii=False)),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    args = parser.parse_args()
+
+    for name, content in build_fixtures(args.rows):
+        path = os.path.join(FIXTURE_DIR, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        print(f"{path} 저장 ({len(content.encode('utf-8')):,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+"""스토어 대신 응답하는 로컬 서버입니다.
+
+benchmarks/fixtures의 기록된 응답을 돌려주므로, 실제 스토어에 요청하지 않고
+수집기를 실행하거나 벤치마크할 수 있습니다.
+appdetails API(/api/appdetails)는 기록된 검색 행의 가격/태그/출시일로 응답을 만듭니다.
+검색 결과 엔드포인트는 cc(국가 코드)에 따라 가격을 그 나라 통화 표기로 바꿔 돌려줍니다.
+리뷰 API(/appreviews/<app_id>)는 app_id마다 정해진 가짜 리뷰를 최신순으로 커서 페이지에 나눠 줍니다.
+
+사용법:
+    python benchmarks/stand_in_server.py [--port 8080] [--catalog-size 1000]
+
+그 다음 수집기의 base_url을 http://127.0.0.1:<port> 로 바꿔서 실행합니다.
+"""
+import argparse
+import base64
+import glob
+import json
+import os
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from search_stream import iter_row_html  # noqa: E402
+
+FIXTURE_DIR = os.path.join(ROOT, "benchmarks", "fixtures")
+
+
+def load_fixture(name, mode="r"):
+    with open(os.path.join(FIXTURE_DIR, name), mode, **({} if "b" in mode else {"encoding": "utf-8"})) as f:
+        return f.read()
+
+
+def build_catalog(size):
+    """기록된 검색 행들을 반복해서 size개의 행을 만듭니다. 반복분에는 새 app_id를 붙입니다."""
+    rows = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "search_*.html"))):
+        with open(path, encoding="utf-8") as f:
+            rows.extend(iter_row_html([f.read()]))
+
+    seen = set()
+    unique_rows = []
+    for row in rows:
+        app_id = re.search(r"/app/(\d+)/", row).group(1)
+        if app_id not in seen:
+            seen.add(app_id)
+            unique_rows.append(row)
+
+    catalog = []
+    cycle = 0
+    while len(catalog) < size:
+        for row in unique_rows:
+            if len(catalog) >= size:
+                break
+            if cycle:
+                row = re.sub(r"(/apps?/|data-ds-appid=\"|App_|&quot;id&quot;:)(\d+)",
+                             lambda m: f"{m.group(1)}{int(m.group(2)) + cycle * 10_000_000}", row)
+            catalog.append(row)
+        cycle += 1
+    return catalog
+
+
+def _format_price(cents):
+    return f"${cents / 100:.2f}"
+
+
+def _european(amount, symbol):
+    """1.234,56€처럼 천 단위에 점, 소수점에 쉼표를 쓰는 표기입니다."""
+    return f"{amount:,.2f}".translate(str.maketrans(",.", ".,")) + symbol
+
+
+# 국가 코드 → (달러 대비 환율, 가격 표기). 목록에 없는 국가는 미국 가격을 그대로 씁니다.
+REGION_PRICES = {
+    "US": (1.0, lambda amount: f"${amount:,.2f}"),
+    "KR": (1300.0, lambda amount: f"₩ {round(amount, -2):,.0f}"),
+    "JP": (150.0, lambda amount: f"¥ {round(amount):,}"),
+    "DE": (0.92, lambda amount: _european(amount, "€")),
+    "FR": (0.92, lambda amount: _european(amount, "€")),
+    "GB": (0.8, lambda amount: f"£{amount:,.2f}"),
+    "BR": (5.0, lambda amount: "R$ " + _european(amount, "")),
+}
+
+
+def localize_catalog(catalog, region):
+    """검색 행의 달러 가격을 region의 통화 표기로 바꾼 새 목록을 반환합니다."""
+    rate, format_price = REGION_PRICES.get(region.upper(), REGION_PRICES["US"])
+    if rate == 1.0:
+        return catalog
+    dollars = re.compile(r"\$(\d[\d,]*\.\d\d)")
+    return [dollars.sub(lambda m: format_price(float(m.group(1).replace(",", "")) * rate), row)
+            for row in catalog]
+
+
+def build_app_index(catalog):
+    """검색 행들에서 appdetails 응답을 만드는 데 쓸 app_id별 정보를 뽑습니다."""
+    apps = {}
+    for row in catalog:
+        app_id = int(re.search(r'data-ds-appid="(\d+)"', row).group(1))
+        title = re.search(r'<span class="title">([^<]*)</span>', row)
+        final = re.search(r'data-price-final="(\d+)"', row)
+        discount = re.search(r'data-discount="(\d+)"', row)
+        released = re.search(r'search_released[^>]*>\s*([^<]*?)\s*<', row)
+        final = int(final.group(1)) if final else 0
+        discount = int(discount.group(1)) if discount else 0
+        initial = round(final * 100 / (100 - discount)) if discount < 100 else final
+        apps[app_id] = {
+            "name": title.group(1) if title else "",
+            "is_free": final == 0,
+            "price_overview": None if final == 0 else {
+                "currency": "USD",
+                "initial": initial,
+                "final": final,
+                "discount_percent": discount,
+                "initial_formatted": _format_price(initial) if discount else "",
+                "final_formatted": _format_price(final),
+            },
+            "genres": [{"id": str(i + 1), "description": tag}
+                       for i, tag in enumerate(re.findall(r'class="search_tag">([^<]*)<', row)[:3])]
+                      or [{"id": "1", "description": "Action"}],
+            "release_date": {"coming_soon": False, "date": released.group(1) if released else ""},
+        }
+    return apps
+
+
+# 가짜 리뷰의 작성 시각 기준점과 간격(초)
+REVIEW_EPOCH = 1_750_000_000
+REVIEW_SPACING = 600
+
+
+def build_reviews(app_id, extra=0):
+    """app_id의 가짜 리뷰를 오래된 것부터 반환합니다. extra개는 기본 리뷰보다 나중에 작성된 리뷰입니다."""
+    positive_pct = 60 + app_id % 40
+    reviews = []
+    for k in range(30 + app_id % 170 + extra):
+        voted_up = (k * 37 + app_id) % 100 < positive_pct
+        reviews.append({
+            "recommendationid": str(app_id * 100_000 + k),
+            "author": {"steamid": str(76561197960265728 + app_id * 1000 + k), "num_games_owned": k % 50,
+                       "num_reviews": k % 7 + 1, "playtime_forever": k * 13, "playtime_at_review": k * 11},
+            "language": ("english", "koreana", "schinese")[k % 3],
+            "review": f"Review {k} for {app_id}: " + ("great game " if voted_up else "not for me ") * (k % 5 + 1),
+            "timestamp_created": REVIEW_EPOCH + k * REVIEW_SPACING,
+            "timestamp_updated": REVIEW_EPOCH + k * REVIEW_SPACING,
+            "voted_up": voted_up,
+            "votes_up": k % 9,
+            "votes_funny": k % 4,
+            "weighted_vote_score": "0.5",
+            "comment_count": 0,
+            "steam_purchase": k % 4 != 0,
+            "received_for_free": k % 10 == 0,
+            "written_during_early_access": False,
+        })
+    return reviews
+
+
+def _encode_cursor(created):
+    return base64.b64encode(f"created:{created}".encode()).decode()
+
+
+def _decode_cursor(cursor):
+    if cursor in ("", "*"):
+        return None
+    return int(base64.b64decode(cursor).decode().split(":", 1)[1])
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    catalog = []
+    apps = {}
+    localized = {}
+    # app_id → 기본 리뷰 뒤에 새로 달린 리뷰 수 (증분 수집 테스트용)
+    extra_reviews = {}
+    request_counts = {}
+    max_results_count = 100
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, body, content_type, status=200):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        counts = type(self).request_counts
+        counts[url.path] = counts.get(url.path, 0) + 1
+
+        if url.path == "/search/results/":
+            return self._search_results(query)
+        if url.path == "/search/":
+            return self._search_page(query)
+        if url.path == "/api/appdetails":
+            return self._app_details(query)
+        if url.path.startswith("/appreviews/"):
+            return self._app_reviews(url.path.rsplit("/", 1)[-1], query)
+        self._send("not found", "text/plain", status=404)
+
+    def _search_page(self, query):
+        category = query.get("filter", "topsellers")
+        name = f"search_{category}_page1.html"
+        if not os.path.exists(os.path.join(FIXTURE_DIR, name)):
+            name = "search_topsellers_page1.html"
+        self._send(load_fixture(name, "rb"), "text/html; charset=UTF-8")
+
+    def _search_results(self, query):
+        start = int(query.get("start", 0))
+        count = min(int(query.get("count", 50)), self.max_results_count)
+        region = query.get("cc", "US").upper()
+        if region not in self.localized:
+            self.localized[region] = localize_catalog(self.catalog, region)
+        rows = self.localized[region][start:start + count]
+        body = {
+            "success": 1,
+            "results_html": "\n".join(rows),
+            "total_count": len(self.catalog),
+            "start": start,
+        }
+        self._send(json.dumps(body), "application/json; charset=utf-8")
+
+
+    def _app_details(self, query):
+        # 실제 API처럼 filters=price_overview일 때만 여러 app_id를 받습니다.
+        app_ids = [app_id for app_id in query.get("appids", "").split(",") if app_id]
+        filters = query.get("filters", "")
+        if len(app_ids) != 1 and filters != "price_overview":
+            return self._send("null", "application/json; charset=utf-8", status=400)
+
+        body = {}
+        for app_id in app_ids:
+            app = self.apps.get(int(app_id)) if app_id.isdigit() else None
+            if app is None:
+                body[app_id] = {"success": False}
+            elif filters == "price_overview":
+                # 무료 게임은 data가 빈 리스트입니다.
+                overview = app["price_overview"]
+                body[app_id] = {"success": True, "data": {"price_overview": overview} if overview else []}
+            else:
+                data = {"type": "game", "steam_appid": int(app_id), **app}
+                if not app["price_overview"]:
+                    del data["price_overview"]
+                body[app_id] = {"success": True, "data": data}
+        self._send(json.dumps(body), "application/json; charset=utf-8")
+
+
+    def _app_reviews(self, app_id, query):
+        # 실제 API처럼 filter=recent는 최신순이고, 커서는 마지막으로 준 리뷰 다음부터 이어집니다.
+        if not app_id.isdigit():
+            return self._send(json.dumps({"success": 2}), "application/json; charset=utf-8")
+        app_id = int(app_id)
+        reviews = build_reviews(app_id, self.extra_reviews.get(app_id, 0))[::-1]
+        cursor = query.get("cursor", "*")
+        before = _decode_cursor(cursor)
+        if before is not None:
+            reviews = [review for review in reviews if review["timestamp_created"] < before]
+        page = reviews[:min(int(query.get("num_per_page", 20)), 100)]
+        body = {
+            "success": 1,
+            "query_summary": {"num_reviews": len(page)},
+            "reviews": page,
+            # 끝에 닿으면 받은 커서를 그대로 돌려줍니다.
+            "cursor": _encode_cursor(page[-1]["timestamp_created"]) if page else cursor,
+        }
+        if before is None:
+            everything = build_reviews(app_id, self.extra_reviews.get(app_id, 0))
+            positive = sum(review["voted_up"] for review in everything)
+            body["query_summary"].update({
+                "review_score": 8,
+                "review_score_desc": "Very Positive",
+                "total_positive": positive,
+                "total_negative": len(everything) - positive,
+                "total_reviews": len(everything),
+            })
+        self._send(json.dumps(body), "application/json; charset=utf-8")
+
+
+def start(port=0, catalog_size=1000):
+    """백그라운드 스레드에서 서버를 시작하고 (서버, base_url)을 반환합니다."""
+    catalog = build_catalog(catalog_size)
+    handler = type("Handler", (StandInHandler,), {
+        "catalog": catalog,
+        "apps": build_app_index(catalog),
+        "localized": {},
+        "extra_reviews": {},
+        "request_counts": {},
+    })
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--catalog-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    server, base_url = start(args.port, args.catalog_size)
+    print(f"로컬 스토어 서버 실행 중: {base_url} (종료: Ctrl+C)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""기록된 fixture로 파싱/분석 단계별 속도를 재고 기준 결과와 비교합니다.
+
+측정 항목 (각각 --sizes의 행 수마다):
+- search.parse_games: 검색 결과 HTML 파싱 + SteamGameScraper._parse_games
+- search.extract_game_info: 파싱된 행마다 SteamGameScraper._extract_game_info
+- rank4.most_played / rank6.most_played / rank6.top_selling: 차트 페이지 파싱 + 행 추출
+- featured.top_sellers: featuredcategories JSON 파싱 + 게임 이름 추출 (rank5와 같은 처리)
+- prices.normalize: 여러 지역 통화 표기가 섞인 가격 열 정규화 (기억해 둔 결과 없이)
+- analyzer.preprocess / analyzer.get_statistics / analyzer.save_data
+- analyzer.create_visualizations: 캐시 없이(force=True) 모든 차트를 다시 그립니다.
+
+결과는 benchmarks/results/latest.json에 저장하고, baseline.json이 있으면 항목별 최소 시간을
+비교해 --threshold(기본 20%)보다 느려진 항목을 표시하고 종료 코드 1을 반환합니다.
+
+사용법:
+    python benchmarks/suite.py --save-baseline         # 기준 결과 저장
+    python benchmarks/suite.py                         # 기준 결과와 비교
+    python benchmarks/suite.py -k search --sizes 1000 --repeat 10
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import html_backend  # noqa: E402
+import rank4  # noqa: E402
+import rank6  # noqa: E402
+from rank3 import SteamGameScraper  # noqa: E402
+from stand_in_server import FIXTURE_DIR, REGION_PRICES, build_catalog, load_fixture, localize_catalog  # noqa: E402
+
+# 한글 글꼴이 없는 환경의 차트 경고는 측정과 관계없으므로 숨깁니다.
+warnings.filterwarnings("ignore", message="Glyph .* missing from font")
+
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+DEFAULT_SIZES = (100, 1000, 10000)
+DEFAULT_THRESHOLD = 0.20
+# 짧은 항목은 한 번의 측정이 이 시간(초) 이상이 되도록 여러 번 묶어서 실행합니다.
+MIN_SAMPLE_TIME = 0.05
+
+# 이름 → (준비 함수, 반복 횟수 상한). 준비 함수는 size를 받아 측정할 인자 없는 함수를 반환합니다.
+CASES = {}
+
+
+def case(name, max_repeat=None):
+    def register(setup):
+        CASES[name] = (setup, max_repeat)
+        return setup
+    return register
+
+
+def _repeat_rows(rows, size):
+    """행 목록을 size개가 될 때까지 반복합니다."""
+    return (rows * (-(-size // len(rows))))[:size]
+
+
+def _chart_document(fixture, size):
+    """차트 fixture의 행을 size개로 늘린 HTML을 만듭니다."""
+    page = load_fixture(fixture)
+    rows = re.findall(r"<tr\b.*?</tr>", page, flags=re.S)
+    body = "\n".join(_repeat_rows(rows, size))
+    return page.replace("\n".join(rows), body)
+
+
+_games_cache = {}
+
+
+def _games(size):
+    """검색 fixture에서 뽑은 게임 정보 size개를 반환합니다. (분석 항목 공용)"""
+    if size not in _games_cache:
+        scraper = SteamGameScraper()
+        html = f'<div id="search_resultsRows">{"".join(build_catalog(size))}</div>'
+        _games_cache[size] = scraper._parse_games(scraper.parser.parse(html))
+    return _games_cache[size]
+
+
+@case("search.parse_games")
+def _search_parse_games(size):
+    scraper = SteamGameScraper()
+    html = f'<div id="search_resultsRows">{"".join(build_catalog(size))}</div>'
+    return lambda: scraper._parse_games(scraper.parser.parse(html))
+
+
+@case("search.extract_game_info")
+def _search_extract_game_info(size):
+    scraper = SteamGameScraper()
+    html = f'<div id="search_resultsRows">{"".join(build_catalog(size))}</div>'
+    document = scraper.parser.parse(html)
+    rows = scraper.parser.select(document, "#search_resultsRows > a")
+    return lambda: [scraper._extract_game_info(row) for row in rows]
+
+
+def _chart_case(spec, fixture):
+    def setup(size):
+        parser = html_backend.get_backend()
+        html = _chart_document(fixture, size)
+        return lambda: spec.extract_all(parser.parse(html), parser)
+    return setup
+
+
+case("rank4.most_played")(_chart_case(rank4.MOST_PLAYED_SPEC, "charts_mostplayed.html"))
+case("rank6.most_played")(_chart_case(rank6.MOST_PLAYED_SPEC, "charts_mostplayed.html"))
+case("rank6.top_selling")(_chart_case(rank6.TOP_SELLING_SPEC, "charts_topselling_KR.html"))
+
+
+@case("featured.top_sellers")
+def _featured_top_sellers(size):
+    data = json.loads(load_fixture("featuredcategories.json"))
+    data["top_sellers"]["items"] = _repeat_rows(data["top_sellers"]["items"], size)
+    text = json.dumps(data, ensure_ascii=False)
+
+    def run():
+        items = json.loads(text).get("top_sellers", {}).get("items", [])
+        return [game["name"] for game in items]
+    return run
+
+
+@case("prices.normalize")
+def _prices_normalize(size):
+    import pandas as pd
+    import price_normalize
+
+    catalog = build_catalog(size)
+    regions = list(REGION_PRICES)
+    # 행마다 지역을 돌려 가며 그 지역 통화로 표시된 가격을 씁니다.
+    localized = {region: localize_catalog(catalog, region) for region in regions}
+    rows = [localized[regions[i % len(regions)]][i] for i in range(size)]
+    html = f'<div id="search_resultsRows">{"".join(rows)}</div>'
+    scraper = SteamGameScraper()
+    prices = pd.Series([game["price"] for game in scraper._parse_games(scraper.parser.parse(html))])
+
+    def run():
+        price_normalize._memo.clear()
+        return price_normalize.normalize_prices(prices)
+    return run
+
+
+@case("analyzer.preprocess")
+def _analyzer_preprocess(size):
+    import pandas as pd
+    from steam_analyzer import SteamDataAnalyzer
+
+    frame = pd.DataFrame(_games(size))
+
+    def run():
+        analyzer = SteamDataAnalyzer.__new__(SteamDataAnalyzer)
+        analyzer.df = frame.copy()
+        analyzer._preprocess_data()
+    return run
+
+
+@case("analyzer.get_statistics")
+def _analyzer_get_statistics(size):
+    from steam_analyzer import SteamDataAnalyzer
+
+    analyzer = SteamDataAnalyzer(_games(size))
+    return analyzer.get_statistics
+
+
+@case("analyzer.save_data")
+def _analyzer_save_data(size):
+    from steam_analyzer import SteamDataAnalyzer
+
+    analyzer = SteamDataAnalyzer(_games(size))
+    output_dir = tempfile.mkdtemp(prefix="bench_save_")
+    return lambda: analyzer.save_data("bench.csv", output_dir)
+
+
+@case("analyzer.create_visualizations", max_repeat=3)
+def _analyzer_create_visualizations(size):
+    from steam_analyzer import SteamDataAnalyzer
+
+    analyzer = SteamDataAnalyzer(_games(size))
+    output_dir = tempfile.mkdtemp(prefix="bench_charts_")
+    return lambda: analyzer.create_visualizations(output_dir=output_dir, force=True)
+
+
+def measure(run, repeat):
+    """
+    한 번 예열한 뒤 repeat번 측정해 1회당 실행 시간(초) 목록을 반환합니다. 출력은 버립니다.
+
+    예열 시간이 MIN_SAMPLE_TIME보다 짧으면 측정 한 번에 여러 번 실행하고 평균을 씁니다.
+    timeit처럼 측정 중에는 가비지 컬렉션을 끄고, 측정 사이에 한 번씩 정리합니다.
+    """
+    times = []
+    gc_was_enabled = gc.isenabled()
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        run()
+        warmup = time.perf_counter() - start
+        number = max(1, int(MIN_SAMPLE_TIME / warmup)) if warmup > 0 else 1
+        try:
+            for _ in range(repeat):
+                gc.collect()
+                gc.disable()
+                start = time.perf_counter()
+                for _ in range(number):
+                    run()
+                times.append((time.perf_counter() - start) / number)
+                gc.enable()
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    return times
+
+
+def run_suite(sizes, repeat, pattern=None):
+    """선택한 항목을 모두 측정해 {항목[행 수]: 결과} dict를 반환합니다."""
+    results = {}
+    for name, (setup, max_repeat) in CASES.items():
+        if pattern and pattern not in name:
+            continue
+        for size in sizes:
+            with contextlib.redirect_stdout(io.StringIO()):
+                run = setup(size)
+            times = measure(run, min(repeat, max_repeat or repeat))
+            best = min(times)
+            key = f"{name}[{size}]"
+            results[key] = {
+                "rows": size,
+                "min": best,
+                "median": statistics.median(times),
+                "rows_per_sec": size / best if best > 0 else None,
+                "repeat": len(times),
+            }
+            print(f"{key:<42} {best * 1000:10.2f}ms  {size / best:>12,.0f} rows/s")
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(results, baseline, threshold):
+    """기준 결과보다 threshold 넘게 느려진 항목의 (이름, 기준, 현재, 비율) 목록을 반환합니다."""
+    regressions = []
+    print(f"\n기준 결과 비교 (기준: {baseline.get('commit')} / {baseline.get('created_at')})")
+    for key, result in results.items():
+        base = baseline["results"].get(key)
+        if base is None:
+            print(f"{key:<42} (기준 없음)")
+            continue
+        ratio = result["min"] / base["min"]
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  ⚠️ 느려짐"
+            regressions.append((key, base["min"], result["min"], ratio))
+        elif ratio < 1 - threshold:
+            flag = "  빨라짐"
+        print(f"{key:<42} {base['min'] * 1000:9.2f}ms → {result['min'] * 1000:9.2f}ms  x{ratio:.2f}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("-k", dest="pattern", help="이름에 이 문자열이 들어간 항목만 측정합니다")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="이 비율보다 느려지면 표시합니다 (기본값: 0.2 = 20%%)")
+    parser.add_argument("--baseline", default=os.path.join(RESULTS_DIR, "baseline.json"))
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준 결과로 저장합니다")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(os.path.join(FIXTURE_DIR, "charts_mostplayed.html")):
+        print("차트 fixture가 없습니다. 먼저 python benchmarks/make_fixtures.py를 실행하세요.")
+        return 2
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "parser": html_backend.get_backend().name,
+        "results": run_suite(args.sizes, args.repeat, args.pattern),
+    }
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    with open(os.path.join(RESULTS_DIR, "latest.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n기준 결과를 {args.baseline}에 저장했습니다.")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("\n기준 결과가 없습니다. --save-baseline으로 먼저 저장하세요.")
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(report["results"], baseline, args.threshold)
+    if regressions:
+        print(f"\n⚠️ {len(regressions)}개 항목이 {args.threshold:.0%} 넘게 느려졌습니다.")
+        return 1
+    print("\n느려진 항목이 없습니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
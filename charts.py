@@ -0,0 +1,200 @@
+"""분석 결과 차트를 그리는 모듈입니다.
+
+차트마다 필요한 데이터만 뽑아 해시를 계산하고, 지난번 렌더링과 해시가 같으면
+다시 그리지 않습니다. 다시 그려야 하는 차트가 여러 개면 프로세스 풀에서 동시에 그립니다.
+matplotlib은 화면 출력이 없는 Agg 백엔드를 사용합니다.
+"""
+import hashlib
+import json
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# 차트 그리는 코드를 바꾸면 올려서 기존 캐시를 무효화합니다.
+CHART_VERSION = 2
+MANIFEST_NAME = ".chart_manifest.json"
+
+
+def chart_inputs(df):
+    """차트별로 그리는 데 필요한 데이터만 뽑아 반환합니다. (프로세스 간에 전달 가능한 값)"""
+    top_10 = df.head(10)
+    # 가격은 행마다 자기 통화의 금액이므로 가장 많은 통화의 유료 게임만 그립니다.
+    paid = df[df["price_numeric"] > 0]
+    currencies = paid["price_currency"].value_counts() if "price_currency" in paid else None
+    currency = currencies.index[0] if currencies is not None and len(currencies) else None
+    if currency is not None:
+        paid = paid[paid["price_currency"] == currency]
+    return {
+        "top_10_games": {
+            "titles": [str(title) for title in top_10["title"]],
+            "ranks": top_10["rank"].to_numpy(dtype=np.int64),
+        },
+        "price_distribution": {
+            "values": paid["price_numeric"].to_numpy(dtype=np.float64),
+            "currency": None if currency is None else str(currency),
+        },
+        "discount_distribution": {
+            "values": df.loc[df["discount"] > 0, "discount"].to_numpy(dtype=np.int64),
+        },
+        "review_score_distribution": {
+            "values": df.loc[df["review_score_numeric"] > 0, "review_score_numeric"].to_numpy(dtype=np.int64),
+        },
+    }
+
+
+def input_hash(name, payload, dpi, fmt):
+    """차트 이름, 데이터, 해상도, 형식으로 해시를 만듭니다."""
+    digest = hashlib.sha256()
+    digest.update(f"{name}|{CHART_VERSION}|{dpi}|{fmt}".encode("utf-8"))
+    for key in sorted(payload):
+        value = payload[key]
+        digest.update(key.encode("utf-8"))
+        if isinstance(value, np.ndarray):
+            digest.update(str(value.dtype).encode("utf-8"))
+            digest.update(np.ascontiguousarray(value).tobytes())
+        else:
+            digest.update(pickle.dumps(value))
+    return digest.hexdigest()
+
+
+def _draw_top_10_games(ax, payload):
+    titles, ranks = payload["titles"], payload["ranks"]
+    bars = ax.barh(range(len(titles)), ranks, color='steelblue')
+    ax.set_yticks(range(len(titles)))
+    ax.set_yticklabels(titles, fontsize=10)
+    ax.set_xlabel('랭킹')
+    ax.set_title('스팀 인기 게임 TOP 10', fontsize=14, fontweight='bold')
+    ax.invert_yaxis()
+
+    # 순위 표시
+    for bar in bars:
+        width = bar.get_width()
+        ax.text(width + 0.1, bar.get_y() + bar.get_height()/2,
+                f'#{int(width)}', ha='left', va='center')
+
+
+def _draw_price_distribution(ax, payload):
+    if len(payload["values"]) > 0:
+        ax.hist(payload["values"], bins=20, alpha=0.7, color='lightcoral')
+        currency = payload.get("currency")
+        ax.set_xlabel(f'가격 ({currency})' if currency else '가격')
+        ax.set_ylabel('게임 수')
+        ax.set_title('유료 게임 가격 분포')
+
+
+def _draw_discount_distribution(ax, payload):
+    if len(payload["values"]) > 0:
+        ax.hist(payload["values"], bins=15, alpha=0.7, color='lightgreen')
+        ax.set_xlabel('할인율 (%)')
+        ax.set_ylabel('게임 수')
+        ax.set_title('할인 중인 게임의 할인율 분포')
+
+
+def _draw_review_score_distribution(ax, payload):
+    if len(payload["values"]) > 0:
+        ax.hist(payload["values"], bins=10, alpha=0.7, color='gold')
+        ax.set_xlabel('리뷰 점수')
+        ax.set_ylabel('게임 수')
+        ax.set_title('게임 리뷰 점수 분포')
+
+
+# 차트 이름 → (그리는 함수, 그림 크기, tight_layout 여부)
+CHARTS = {
+    "top_10_games": (_draw_top_10_games, (12, 8), True),
+    "price_distribution": (_draw_price_distribution, (10, 6), False),
+    "discount_distribution": (_draw_discount_distribution, (10, 6), False),
+    "review_score_distribution": (_draw_review_score_distribution, (10, 6), False),
+}
+
+
+def render_chart(name, payload, path, dpi, fmt):
+    """차트 하나를 파일로 저장합니다. 프로세스 풀의 작업자에서도 실행됩니다."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    draw, figsize, tight = CHARTS[name]
+    plt.style.use('default')
+    fig, ax = plt.subplots(figsize=figsize)
+    try:
+        draw(ax, payload)
+        if tight:
+            fig.tight_layout()
+        fig.savefig(path, dpi=dpi, format=fmt, bbox_inches='tight')
+    finally:
+        plt.close(fig)
+    return path
+
+
+def _load_manifest(output_dir):
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(output_dir, manifest):
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+def render_charts(df, output_dir="./output", dpi=300, fmt="png", workers=None, force=False):
+    """
+    모든 차트를 그립니다. 입력 데이터가 지난번과 같은 차트는 건너뜁니다.
+
+    Parameters:
+    -----------
+    df : DataFrame
+        전처리된 게임 데이터
+    output_dir : str
+        저장할 폴더
+    dpi : int
+        해상도 (기본값: 300)
+    fmt : str
+        파일 형식 ('png', 'svg', 'pdf' 등)
+    workers : int
+        동시에 그릴 프로세스 수 (기본값: CPU 수, 1이면 현재 프로세스에서 그림)
+    force : bool
+        True이면 캐시와 관계없이 모두 다시 그립니다.
+
+    Returns:
+    --------
+    dict: 차트 이름 → {"path": 파일 경로, "rendered": 새로 그렸는지 여부}
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = _load_manifest(output_dir)
+    results = {}
+    pending = []
+
+    for name, payload in chart_inputs(df).items():
+        path = os.path.join(output_dir, f"{name}.{fmt}")
+        digest = input_hash(name, payload, dpi, fmt)
+        cached = manifest.get(os.path.basename(path), {})
+        if not force and cached.get("hash") == digest and os.path.exists(path):
+            results[name] = {"path": path, "rendered": False}
+            continue
+        pending.append((name, payload, path, digest))
+
+    if len(pending) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=min(len(pending), workers or os.cpu_count() or 1)) as pool:
+            futures = [pool.submit(render_chart, name, payload, path, dpi, fmt)
+                       for name, payload, path, _ in pending]
+            for future in futures:
+                future.result()
+    else:
+        for name, payload, path, _ in pending:
+            render_chart(name, payload, path, dpi, fmt)
+
+    for name, _, path, digest in pending:
+        manifest[os.path.basename(path)] = {"hash": digest, "chart": name}
+        results[name] = {"path": path, "rendered": True}
+    _save_manifest(output_dir, manifest)
+    return results
@@ -0,0 +1,233 @@
+"""여러 카테고리를 한 프로세스에서 동시에 수집하는 일괄 작업입니다.
+
+카테고리마다 프로세스를 따로 띄우지 않고, 모든 카테고리의 페이지 요청을 하나의 이벤트 루프에서
+같은 세션(연결 풀)과 같은 요청 속도 제한으로 처리합니다. 여러 카테고리에 동시에 올라 있는 게임은
+app_id 기준으로 한 번만 추출하고, 카테고리별 순위는 같은 게임 정보 dict를 가리킵니다.
+결과는 같은 captured_at을 가진 하나의 스냅샷/이력으로 저장합니다.
+
+사용법:
+    python collect_job.py topsellers specials popularnew free --pages 2
+"""
+import argparse
+import asyncio
+from datetime import datetime, timezone
+
+import metrics
+from rank3 import BULK_BATCH_SIZE, SteamGameScraper
+from rate_limit import TokenBucket
+
+CATEGORIES = ("topsellers", "specials", "popularnew", "free")
+
+
+class CollectionResult:
+    """한 번의 일괄 수집 결과입니다.
+
+    records는 app_id → 게임 정보 dict, rankings는 카테고리 → 순위순 게임 정보 리스트이며
+    rankings의 원소는 records의 dict를 그대로 참조합니다.
+    """
+
+    def __init__(self, captured_at, records, rankings):
+        self.captured_at = captured_at
+        self.records = records
+        self.rankings = rankings
+
+    @property
+    def total_rows(self):
+        return sum(len(games) for games in self.rankings.values())
+
+    def app_ids(self, category):
+        """카테고리의 순위순 app_id 목록을 반환합니다."""
+        return [game["app_id"] for game in self.rankings[category]]
+
+
+def collect(categories, page_count=1, total=None, parser="auto", max_concurrency=4, rate=1.0,
+            scraper=None, bucket=None):
+    """
+    여러 카테고리를 동시에 수집합니다.
+
+    Parameters:
+    -----------
+    categories : list
+        수집할 카테고리 목록
+    page_count : int
+        카테고리마다 가져올 검색 페이지 수 (기본값: 1)
+    total : int
+        지정하면 검색 결과 엔드포인트로 카테고리마다 최대 total개를 가져옵니다 (page_count 무시)
+    parser : str
+        HTML 파서 백엔드 (기본값: 'auto')
+    max_concurrency : int
+        모든 카테고리를 합쳐 동시에 진행할 최대 요청 수 (기본값: 4)
+    rate : float
+        모든 카테고리를 합쳐 초당 허용할 요청 수 (기본값: 1.0)
+    bucket : TokenBucket
+        다른 단계와 요청 속도 한도를 함께 쓸 때 넘깁니다. (주면 rate는 무시)
+
+    Returns:
+    --------
+    CollectionResult: 수집 결과
+    """
+    scraper = scraper or SteamGameScraper(parser=parser)
+    bucket = bucket or TokenBucket(rate=rate)
+    categories = list(dict.fromkeys(categories))
+    records = {}
+    captured_at = datetime.now(timezone.utc)
+
+    if total is None:
+        jobs, owners = [], []
+        for category in categories:
+            for page in range(page_count):
+                jobs.append((
+                    f"[{category}] 페이지 {page + 1}",
+                    lambda page=page, category=category:
+                        scraper._fetch_page_games(page, category, records),
+                ))
+                owners.append(category)
+        results = asyncio.run(scraper._run_jobs(jobs, max_concurrency, bucket=bucket))
+    else:
+        owners, results = _collect_bulk(scraper, categories, total, records, max_concurrency, bucket)
+
+    rankings = {category: [] for category in categories}
+    for category, games in zip(owners, results):
+        rankings[category].extend(games)
+    if total is not None:
+        rankings = {category: games[:total] for category, games in rankings.items()}
+    return CollectionResult(captured_at, records, rankings)
+
+
+def _collect_bulk(scraper, categories, total, records, max_concurrency, bucket):
+    """검색 결과 엔드포인트로 카테고리별 첫 구간을 받아 전체 수를 확인한 뒤 나머지를 받습니다."""
+    first_count = min(BULK_BATCH_SIZE, total)
+
+    def first_batch(category):
+        games, total_count = scraper._fetch_bulk_games(0, first_count, category, records)
+        return [(games, total_count)]
+
+    first_jobs = [(f"[{category}] 0 - {first_count}번째 게임",
+                   lambda category=category: first_batch(category))
+                  for category in categories]
+    firsts = asyncio.run(scraper._run_jobs(first_jobs, max_concurrency, bucket=bucket))
+
+    # 결과는 카테고리별 첫 구간들 다음에 나머지 구간들이 이어지는 순서입니다.
+    owners, results, jobs = list(categories), [], []
+    for category, first in zip(categories, firsts):
+        games, total_count = first[0] if first else ([], None)
+        results.append(games)
+        limit = min(total, total_count) if total_count is not None else total
+        for start in range(BULK_BATCH_SIZE, limit, BULK_BATCH_SIZE):
+            count = min(BULK_BATCH_SIZE, limit - start)
+            jobs.append((
+                f"[{category}] {start} - {start + count}번째 게임",
+                lambda start=start, count=count, category=category:
+                    scraper._fetch_bulk_games(start, count, category, records)[0],
+            ))
+            owners.append(category)
+
+    if jobs:
+        results.extend(asyncio.run(scraper._run_jobs(jobs, max_concurrency, bucket=bucket)))
+    return owners, results
+
+
+def save(result, region="US", snapshot_store=None, history=None, incremental=False, delta_store=None):
+    """
+    카테고리별로 전처리한 뒤 같은 captured_at의 스냅샷과 랭킹 이력으로 저장합니다.
+
+    incremental이 True이면 카테고리마다 지난 상태와 달라진 행만 delta_store에 저장합니다.
+    """
+    from history_db import RankingHistory
+    from steam_analyzer import SteamDataAnalyzer
+
+    analyzers = {category: SteamDataAnalyzer(games)
+                 for category, games in result.rankings.items() if games}
+    if not analyzers:
+        return {}
+
+    if incremental:
+        from delta_store import DeltaStore
+
+        delta_store = delta_store or DeltaStore(snapshots=snapshot_store)
+        for category, analyzer in analyzers.items():
+            print(f"[{category}] ", end="")
+            analyzer.save_delta(category, store=delta_store, captured_at=result.captured_at)
+    else:
+        from snapshot_store import SnapshotStore
+
+        snapshot_store = snapshot_store or SnapshotStore()
+        with metrics.span("save") as span:
+            paths = snapshot_store.append_many(
+                {category: analyzer.to_frame() for category, analyzer in analyzers.items()},
+                result.captured_at,
+            )
+            span.add(rows=sum(len(analyzer.df) for analyzer in analyzers.values()))
+        for category, path in paths.items():
+            print(f"[{category}] 스냅샷이 {path}에 저장되었습니다.")
+
+    history = history or RankingHistory()
+    with metrics.span("save") as span:
+        count = history.record_many({category: analyzer.df for category, analyzer in analyzers.items()},
+                                    region, result.captured_at)
+        span.add(rows=count)
+    print(f"랭킹 이력 {count}건이 {history.path}에 기록되었습니다.")
+    return analyzers
+
+
+def run(categories, page_count=1, total=None, parser="auto", max_concurrency=4, rate=1.0,
+        incremental=False, enrich=False, scraper=None):
+    """
+    수집과 저장을 한 번에 실행하고 요약을 출력합니다.
+
+    scraper를 넘기면 그 스크래퍼의 스토어 주소와 지역으로 수집하고 appdetails도 같은 곳에 요청합니다.
+    """
+    print(f"📊 {', '.join(categories)} 카테고리 동시 수집 시작...")
+    scraper = scraper or SteamGameScraper(parser=parser)
+    # 검색 수집과 appdetails 보완이 같은 초당 요청 수 한도를 나눠 씁니다.
+    bucket = TokenBucket(rate=rate)
+    result = collect(categories, page_count=page_count, total=total,
+                     max_concurrency=max_concurrency, scraper=scraper, bucket=bucket)
+
+    for category, games in result.rankings.items():
+        print(f"- {category}: {len(games)}개")
+    if not result.records:
+        print("❌ 데이터를 수집할 수 없습니다.")
+        return result
+
+    print(f"✅ 순위 {result.total_rows}건, 고유 게임 {len(result.records)}개 "
+          f"(중복 추출 {result.total_rows - len(result.records)}건 생략)")
+
+    if enrich:
+        # 순위는 records의 dict를 참조하므로 고유 게임만 보완하면 모든 카테고리에 반영됩니다.
+        import app_details
+        app_details.enrich(list(result.records.values()), base_url=scraper.base_url,
+                            region=scraper.region, max_concurrency=max_concurrency, bucket=bucket)
+
+    print("\n💾 데이터 저장 중...")
+    save(result, region=scraper.region, incremental=incremental)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="여러 카테고리의 스팀 랭킹을 동시에 수집합니다.")
+    parser.add_argument("categories", nargs="*", metavar="CATEGORY",
+                        help=f"수집할 카테고리 {CATEGORIES} (기본값: 전체)")
+    parser.add_argument("-p", "--pages", type=int, default=1,
+                        help="카테고리별 검색 페이지 수 (기본값: 1)")
+    parser.add_argument("--bulk", type=int, metavar="N",
+                        help="검색 결과 엔드포인트로 카테고리마다 N개를 수집합니다 (--pages 무시)")
+    parser.add_argument("--parser", default="auto", help="HTML 파서 백엔드")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 요청 수 (기본값: 4)")
+    parser.add_argument("--rate", type=float, default=1.0, help="초당 요청 수 (기본값: 1.0)")
+    parser.add_argument("--enrich", action="store_true",
+                        help="가격이 빠진 게임을 appdetails API로 묶어서 보완합니다")
+    parser.add_argument("--incremental", action="store_true",
+                        help="지난 상태와 달라진 행만 변경분으로 저장합니다")
+    args = parser.parse_args(argv)
+    unknown = [category for category in args.categories if category not in CATEGORIES]
+    if unknown:
+        parser.error(f"알 수 없는 카테고리: {', '.join(unknown)}")
+
+    run(args.categories or list(CATEGORIES), page_count=args.pages, total=args.bulk, parser=args.parser,
+        max_concurrency=args.concurrency, rate=args.rate, incremental=args.incremental,
+        enrich=args.enrich)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""차트, 검색 카테고리, featuredcategories를 계속 수집하는 상주 프로세스입니다.
+
+cron으로 매번 새 프로세스를 띄우면 import와 연결 설정 비용을 수집할 때마다 내야 하므로,
+한 프로세스가 소스마다 정해진 간격으로 수집합니다.
+
+- 소스마다 간격(interval)에 ±jitter 비율의 난수를 더해 요청이 한꺼번에 몰리지 않게 합니다.
+- 기한이 된 소스들은 스레드 풀에서 동시에 실행하고, 같은 URL을 동시에 요청하면
+  http_client가 요청 하나로 합칩니다.
+- 실패하면 간격보다 짧은 지수 백오프 뒤에 다시 시도합니다.
+- 소스별 다음 실행 시각과 최근 결과를 상태 파일에 저장해 재시작해도 일정이 이어집니다.
+
+사용법:
+    python collector_daemon.py                      # 기본 소스를 계속 수집
+    python collector_daemon.py --once               # 모든 소스를 한 번씩 수집하고 종료
+    python collector_daemon.py --sources charts_mostplayed featuredcategories
+"""
+import argparse
+import json
+import os
+import random
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import http_client
+import metrics
+
+DEFAULT_STATE_PATH = "./output/daemon_state.json"
+DEFAULT_OUTPUT_DIR = "./output/daemon"
+FEATURED_URL = "https://store.steampowered.com/api/featuredcategories/"
+
+# 실패한 소스를 다시 시도하기까지의 최초 대기 시간(초). 실패할 때마다 두 배가 됩니다.
+RETRY_BASE = 60
+# 상태 파일이 없을 때 처음 실행을 흩뜨리는 최대 시간(초)
+STARTUP_SPREAD = 30
+
+
+class Source:
+    """
+    주기적으로 수집할 대상 하나입니다.
+
+    Parameters:
+    -----------
+    name : str
+        소스 이름 (상태 파일과 저장 폴더 이름으로 씁니다)
+    interval : float
+        수집 간격(초)
+    run : callable
+        run(captured_at)을 호출하면 수집해서 저장하고 처리한 항목 수를 반환합니다.
+    jitter : float
+        간격에 더할 난수 비율 (0.1이면 간격의 ±10%)
+    """
+
+    def __init__(self, name, interval, run, jitter=0.1):
+        self.name = name
+        self.interval = interval
+        self.run = run
+        self.jitter = jitter
+
+    def next_delay(self, failures=0):
+        """다음 실행까지 기다릴 시간(초)입니다. 실패했으면 간격을 넘지 않는 백오프를 씁니다."""
+        delay = self.interval
+        if failures:
+            delay = min(self.interval, RETRY_BASE * 2 ** (failures - 1))
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+def _append_jsonl(output_dir, source, captured_at, items):
+    """수집 결과를 <output_dir>/<source>/<날짜>.jsonl에 한 줄로 추가합니다."""
+    directory = os.path.join(output_dir, source)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{captured_at.strftime('%Y-%m-%d')}.jsonl")
+    line = {"captured_at": captured_at.isoformat(timespec="seconds"), "source": source, "items": items}
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(line, ensure_ascii=False) + "\n")
+    return path
+
+
+def default_sources(output_dir=DEFAULT_OUTPUT_DIR, categories=("topsellers", "specials", "popularnew", "free"),
+                    pages=1):
+    """기본 소스 목록(차트 두 개, 검색 카테고리, featuredcategories)을 만듭니다."""
+
+    def top_selling(captured_at):
+        import rank6
+        games = rank6.get_top_selling_games()
+        if games is None:
+            raise RuntimeError("매출 순위 차트를 가져오지 못했습니다.")
+        _append_jsonl(output_dir, "charts_topselling", captured_at, games)
+        return len(games)
+
+    def most_played(captured_at):
+        import rank6
+        games = rank6.get_most_played_games()
+        if games is None:
+            raise RuntimeError("최다 플레이어 차트를 가져오지 못했습니다.")
+        _append_jsonl(output_dir, "charts_mostplayed", captured_at, games)
+        return len(games)
+
+    def search(captured_at):
+        import collect_job
+        result = collect_job.collect(categories, page_count=pages)
+        if not result.records:
+            raise RuntimeError("검색 결과를 가져오지 못했습니다.")
+        collect_job.save(result, incremental=True)
+        return result.total_rows
+
+    def featured(captured_at):
+        response = http_client.get(FEATURED_URL, language="ko")
+        response.raise_for_status()
+        data = response.json()
+        items = {name: [{"id": item.get("id"), "name": item.get("name"),
+                         "discount_percent": item.get("discount_percent"),
+                         "final_price": item.get("final_price"), "currency": item.get("currency")}
+                        for item in section.get("items", [])]
+                 for name, section in data.items()
+                 if isinstance(section, dict) and "items" in section}
+        _append_jsonl(output_dir, "featuredcategories", captured_at, items)
+        return sum(len(section) for section in items.values())
+
+    return [
+        Source("charts_topselling", 3600, top_selling),
+        Source("charts_mostplayed", 900, most_played),
+        Source("search", 1800, search),
+        Source("featuredcategories", 600, featured),
+    ]
+
+
+class ScheduleState:
+    """소스별 일정과 최근 결과를 JSON 파일에 저장합니다."""
+
+    def __init__(self, path=DEFAULT_STATE_PATH):
+        self.path = path
+        self.sources = {}
+        if os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self.sources = json.load(f).get("sources", {})
+            except (OSError, ValueError):
+                print(f"[!] 상태 파일 {path}을 읽을 수 없어 새로 시작합니다.")
+
+    def get(self, name):
+        return self.sources.setdefault(name, {"next_run": None, "last_run": None, "last_status": None,
+                                              "last_items": None, "runs": 0, "failures": 0})
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"saved_at": time.time(), "sources": self.sources}, f, ensure_ascii=False, indent=2)
+        os.replace(self.path + ".tmp", self.path)
+
+
+class CollectorDaemon:
+    """
+    소스들을 일정에 따라 실행하는 상주 수집기입니다.
+
+    Parameters:
+    -----------
+    sources : list
+        Source 목록
+    state_path : str
+        일정 상태 파일 경로
+    max_workers : int
+        동시에 실행할 최대 소스 수 (기본값: 소스 수)
+    metrics_dir : str
+        지정하면 소스가 끝날 때마다 metrics 보고서와 Prometheus textfile을 저장합니다.
+        (값은 프로세스 시작부터의 누적이고, Prometheus에는 `_total` counter로 내보냅니다)
+    """
+
+    def __init__(self, sources, state_path=DEFAULT_STATE_PATH, max_workers=None, metrics_dir=None):
+        self.sources = {source.name: source for source in sources}
+        self.state = ScheduleState(state_path)
+        self.max_workers = max_workers or len(self.sources)
+        self.metrics_dir = metrics_dir
+        self.stopping = threading.Event()
+        # 소스가 끝나거나 종료 요청이 오면 일정을 다시 계산하도록 대기 루프를 깨웁니다.
+        self._wakeup = threading.Event()
+        self._running = set()
+        self._lock = threading.Lock()
+
+        now = time.time()
+        for source in self.sources.values():
+            entry = self.state.get(source.name)
+            if entry["next_run"] is None:
+                # 처음 보는 소스는 시작 직후에 조금씩 흩어서 실행합니다.
+                entry["next_run"] = now + random.uniform(0, min(STARTUP_SPREAD, source.interval * source.jitter))
+
+    def due(self, now=None):
+        """지금 실행할 소스 이름 목록을 반환합니다. (이미 실행 중인 소스는 제외)"""
+        now = now or time.time()
+        with self._lock:
+            return [name for name in self.sources
+                    if name not in self._running and self.state.get(name)["next_run"] <= now]
+
+    def run_source(self, name):
+        """소스 하나를 실행하고 결과와 다음 실행 시각을 상태 파일에 기록합니다."""
+        source = self.sources[name]
+        captured_at = datetime.now(timezone.utc)
+        started = time.perf_counter()
+        try:
+            items = source.run(captured_at)
+            error = None
+        except Exception as e:
+            items, error = None, e
+
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            entry = self.state.get(name)
+            entry["last_run"] = captured_at.timestamp()
+            entry["runs"] += 1
+            if error is None:
+                entry["failures"] = 0
+                entry["last_status"] = "ok"
+                entry["last_items"] = items
+            else:
+                entry["failures"] += 1
+                entry["last_status"] = f"error: {error}"
+            entry["next_run"] = time.time() + source.next_delay(entry["failures"])
+            self._running.discard(name)
+            self.state.save()
+            next_run = entry["next_run"]
+        self._wakeup.set()
+
+        metrics.record(f"source:{name}", elapsed, rows=items or 0, errors=int(error is not None))
+        if self.metrics_dir:
+            # reset() 없이 프로세스가 끝날 때까지 쌓으므로 누적 counter로 내보냅니다.
+            metrics.export(self.metrics_dir, cumulative=True, job="collector_daemon")
+        status = f"{items}건" if error is None else f"실패 ({error})"
+        print(f"[{captured_at:%H:%M:%S}] {name}: {status}, {elapsed:.1f}초, "
+              f"다음 실행 {datetime.fromtimestamp(next_run):%H:%M:%S}")
+        return error is None
+
+    def run_forever(self):
+        """stop()이 호출될 때까지 기한이 된 소스를 실행합니다."""
+        print(f"🕒 상주 수집 시작: {', '.join(self.sources)}")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while not self.stopping.is_set():
+                for name in self.due():
+                    with self._lock:
+                        self._running.add(name)
+                    pool.submit(self.run_source, name)
+
+                with self._lock:
+                    waiting = [self.state.get(name)["next_run"] for name in self.sources
+                               if name not in self._running]
+                timeout = min(waiting, default=time.time() + 60) - time.time()
+                self._wakeup.wait(min(max(timeout, 0), 60))
+                self._wakeup.clear()
+        with self._lock:
+            self.state.save()
+        print("상주 수집을 종료합니다.")
+
+    def run_once(self):
+        """모든 소스를 동시에 한 번씩 실행하고 성공한 소스 수를 반환합니다."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return sum(pool.map(self.run_source, list(self.sources)))
+
+    def stop(self, *_):
+        self.stopping.set()
+        self._wakeup.set()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="스팀 차트와 검색 결과를 계속 수집합니다.")
+    parser.add_argument("--state", default=DEFAULT_STATE_PATH, help="일정 상태 파일 경로")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_DIR, help="차트/featuredcategories 저장 폴더")
+    parser.add_argument("--sources", nargs="+", metavar="NAME", help="실행할 소스 (기본값: 전체)")
+    parser.add_argument("-p", "--pages", type=int, default=1, help="검색 카테고리별 페이지 수 (기본값: 1)")
+    parser.add_argument("--metrics-dir", metavar="DIR", help="metrics 보고서를 저장할 폴더")
+    parser.add_argument("--once", action="store_true", help="모든 소스를 한 번씩 수집하고 종료합니다")
+    args = parser.parse_args(argv)
+
+    sources = default_sources(args.output, pages=args.pages)
+    if args.sources:
+        unknown = set(args.sources) - {source.name for source in sources}
+        if unknown:
+            parser.error(f"알 수 없는 소스: {', '.join(sorted(unknown))}")
+        sources = [source for source in sources if source.name in args.sources]
+
+    daemon = CollectorDaemon(sources, state_path=args.state, metrics_dir=args.metrics_dir)
+    if args.once:
+        succeeded = daemon.run_once()
+        return 0 if succeeded == len(sources) else 1
+
+    signal.signal(signal.SIGTERM, daemon.stop)
+    signal.signal(signal.SIGINT, daemon.stop)
+    try:
+        daemon.run_forever()
+    finally:
+        http_client.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,129 @@
+"""게임 DataFrame을 메모리를 적게 쓰는 형태로 바꾸고 되돌리는 함수들입니다.
+
+- 반복되는 문자열 열은 범주형(사전 인코딩)으로 저장
+- 정수 열은 값 범위에 맞는 가장 작은 타입으로 축소
+- tags는 행마다 리스트를 두지 않고 offsets + 태그 코드 배열로 저장
+- url은 app_id로 다시 만들 수 있으므로 저장하지 않고,
+  image_url은 앱 폴더 아래의 파일 경로만 범주형으로 저장
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+STORE_APP_URL = "https://store.steampowered.com/app/{app_id}/"
+IMAGE_BASE_URL = "https://shared.fastly.steamstatic.com/store_item_assets/steam/apps/{app_id}/"
+IMAGE_URL_PATTERN = re.compile(r"^https?://[^/]+/store_item_assets/steam/apps/(\d+)/([^?]*)")
+
+CATEGORY_COLUMNS = ("title", "price", "original_price", "release_date", "review_score")
+INTEGER_COLUMNS = ("rank", "discount", "review_count", "review_score_numeric")
+# 스크래퍼가 만드는 원래 열 순서
+COLUMN_ORDER = ("rank", "title", "price", "original_price", "discount", "release_date", "tags",
+                "review_score", "review_count", "app_id", "url", "image_url")
+
+
+class TagArray:
+    """행별 태그 리스트를 offsets/codes/vocabulary 세 배열로 저장합니다.
+
+    i번째 행의 태그는 vocabulary[codes[offsets[i]:offsets[i + 1]]] 입니다.
+    """
+
+    def __init__(self, offsets, codes, vocabulary):
+        self.offsets = offsets
+        self.codes = codes
+        self.vocabulary = vocabulary
+
+    @classmethod
+    def from_lists(cls, tags):
+        lists = [value if isinstance(value, (list, tuple)) else [] for value in tags]
+        lengths = np.fromiter((len(value) for value in lists), dtype=np.int64, count=len(lists))
+        offsets = np.zeros(len(lists) + 1, dtype=np.int32)
+        np.cumsum(lengths, out=offsets[1:])
+        flat = [tag for value in lists for tag in value]
+        codes, vocabulary = pd.factorize(pd.Series(flat, dtype=object))
+        dtype = np.int16 if len(vocabulary) < np.iinfo(np.int16).max else np.int32
+        return cls(offsets, codes.astype(dtype), pd.Index(vocabulary, dtype=object))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, row):
+        start, stop = self.offsets[row], self.offsets[row + 1]
+        return self.vocabulary[self.codes[start:stop]].tolist()
+
+    def to_lists(self):
+        values = self.vocabulary.to_numpy()[self.codes].tolist()
+        bounds = self.offsets.tolist()
+        return [values[bounds[i]:bounds[i + 1]] for i in range(len(self))]
+
+    @property
+    def nbytes(self):
+        vocabulary_bytes = int(self.vocabulary.memory_usage(deep=True))
+        return self.offsets.nbytes + self.codes.nbytes + vocabulary_bytes
+
+
+def compact_frame(df):
+    """DataFrame을 압축된 형태로 바꿔 (DataFrame, TagArray)를 반환합니다."""
+    compact = df.copy()
+
+    compact["app_id"] = pd.to_numeric(compact["app_id"], errors="coerce").astype("Int32")
+
+    tags = TagArray.from_lists(compact.pop("tags")) if "tags" in compact.columns else None
+
+    if "url" in compact.columns:
+        compact = compact.drop(columns="url")
+    if "image_url" in compact.columns:
+        image_urls = compact.pop("image_url")
+        paths = image_urls.str.extract(IMAGE_URL_PATTERN, expand=True)[1]
+        # 규칙에 맞지 않는 주소는 전체를 그대로 보관합니다.
+        compact["image_file"] = paths.where(paths.notna(), image_urls).astype("category")
+
+    for column in CATEGORY_COLUMNS:
+        if column in compact.columns:
+            compact[column] = compact[column].astype("category")
+
+    for column in INTEGER_COLUMNS:
+        if column in compact.columns:
+            compact[column] = pd.to_numeric(compact[column], downcast="integer")
+
+    return compact, tags
+
+
+def expand_frame(compact, tags=None):
+    """compact_frame의 결과를 원래 열 구성의 DataFrame으로 되돌립니다."""
+    df = compact.copy()
+
+    app_ids = df["app_id"]
+    df["app_id"] = app_ids.astype(object).where(app_ids.notna(), "N/A").astype(str)
+    df["url"] = [STORE_APP_URL.format(app_id=app_id) if app_id != "N/A" else "N/A"
+                 for app_id in df["app_id"]]
+
+    if "image_file" in df.columns:
+        files = df.pop("image_file").astype(object)
+        df["image_url"] = [
+            file if not isinstance(file, str) or file.startswith("http")
+            else IMAGE_BASE_URL.format(app_id=app_id) + file
+            for file, app_id in zip(files, df["app_id"])
+        ]
+
+    df["tags"] = tags.to_lists() if tags is not None else [[] for _ in range(len(df))]
+
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns and column != "review_score":
+            df[column] = df[column].astype(object)
+
+    ordered = [column for column in COLUMN_ORDER if column in df.columns]
+    return df[ordered + [column for column in df.columns if column not in ordered]]
+
+
+def memory_report(df, compact, tags=None):
+    """열별 메모리 사용량(바이트)을 압축 전후로 비교한 표를 반환합니다."""
+    before = df.memory_usage(deep=True, index=False)
+    after = compact.memory_usage(deep=True, index=False)
+    if tags is not None:
+        after["tags"] = tags.nbytes
+
+    report = pd.DataFrame({"before_bytes": before, "after_bytes": after}).fillna(0).astype("int64")
+    report.loc["total"] = report.sum()
+    report["ratio"] = (report["after_bytes"] / report["before_bytes"].replace(0, np.nan)).round(3)
+    return report
@@ -0,0 +1,256 @@
+"""랭킹 변경분(delta) 저장소입니다.
+
+수집할 때마다 전체 랭킹을 저장하는 대신, 마지막으로 저장된 상태와 app_id 기준으로 비교해
+바뀐 행만 저장합니다.
+
+- entered: 새로 순위에 들어온 게임
+- left: 순위에서 빠진 게임
+- updated: 순위(moved), 가격(price_changed), 할인율(discount_changed) 중 하나라도 바뀐 게임
+
+전체 스냅샷은 full_interval마다(또는 변경분이 max_deltas개 쌓이면) SnapshotStore에 저장하고,
+현재 상태는 마지막 전체 스냅샷에 그 뒤의 변경분을 시간순으로 적용해 만듭니다.
+리뷰 수처럼 추적하지 않는 열은 다음 전체 스냅샷 때 갱신됩니다.
+
+    <root>/category=<카테고리>/date=<YYYY-MM-DD>/delta-<HHMMSS>-<id>.parquet
+"""
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from snapshot_store import SNAPSHOT_SCHEMA, SnapshotStore, to_utc
+
+DEFAULT_ROOT = "./output/deltas"
+DEFAULT_FULL_INTERVAL = timedelta(hours=24)
+DEFAULT_MAX_DELTAS = 48
+
+CHANGE_KINDS = ("entered", "left", "updated")
+
+# 변경분 파일 = 스냅샷 열 + 아래 열
+CHANGE_SCHEMA = pa.schema([
+    ("change", pa.string()),
+    ("key", pa.string()),
+    ("prev_rank", pa.int32()),
+    ("moved", pa.bool_()),
+    ("price_changed", pa.bool_()),
+    ("discount_changed", pa.bool_()),
+])
+DELTA_SCHEMA = pa.schema(list(SNAPSHOT_SCHEMA) + list(CHANGE_SCHEMA))
+
+# 가격 변경 여부를 판단하는 열
+PRICE_COLUMNS = ("price_numeric", "original_price_numeric")
+
+
+def row_keys(df):
+    """행을 구분하는 키를 만듭니다. app_id가 있으면 app_id, 없으면(번들 등) url을 씁니다."""
+    app_ids = pd.to_numeric(df["app_id"], errors="coerce")
+    keys = app_ids.astype("Int64").astype("string")
+    urls = "url:" + df["url"].astype("string") if "url" in df.columns else pd.NA
+    return keys.where(app_ids.notna(), urls).astype(object)
+
+
+def _same(a, b):
+    """값이 같거나 둘 다 비어 있으면 True (NaN 끼리도 같게 봅니다)."""
+    return ((a == b) | (a.isna() & b.isna())).fillna(False).astype(bool)
+
+
+class ChangeSet:
+    """두 랭킹 사이의 변경분입니다. frame은 변경된 행마다 한 줄이며 DELTA_SCHEMA 열을 가집니다."""
+
+    def __init__(self, frame):
+        self.frame = frame
+
+    @property
+    def is_empty(self):
+        return len(self.frame) == 0
+
+    def counts(self):
+        """종류별 변경 건수를 반환합니다."""
+        frame = self.frame
+        counts = {kind: int((frame["change"] == kind).sum()) for kind in CHANGE_KINDS}
+        for flag in ("moved", "price_changed", "discount_changed"):
+            counts[flag] = int(frame[flag].sum())
+        return counts
+
+    def summary(self):
+        counts = self.counts()
+        return (f"진입 {counts['entered']}, 이탈 {counts['left']}, 순위 변동 {counts['moved']}, "
+                f"가격 변동 {counts['price_changed']}, 할인율 변동 {counts['discount_changed']}")
+
+
+def compute_changes(previous, current):
+    """
+    이전 랭킹과 새 랭킹을 키 기준으로 비교해 ChangeSet을 만듭니다.
+
+    Parameters:
+    -----------
+    previous : DataFrame
+        이전 상태 (스냅샷 열 구성)
+    current : DataFrame
+        새로 수집해 전처리한 랭킹
+
+    Returns:
+    --------
+    ChangeSet: entered/updated 행은 새 값 전체, left 행은 이전 값 전체를 담습니다.
+    """
+    previous = previous.assign(key=row_keys(previous)).drop_duplicates("key")
+    current = current.assign(key=row_keys(current)).drop_duplicates("key")
+
+    compared = ["rank", "discount"] + [column for column in PRICE_COLUMNS
+                                       if column in current.columns and column in previous.columns]
+    merged = current[["key"] + compared].merge(previous[["key"] + compared], on="key", how="outer",
+                                               suffixes=("", "_prev"), indicator=True)
+
+    both = merged["_merge"] == "both"
+    moved = both & ~_same(merged["rank"], merged["rank_prev"])
+    price_changed = pd.Series(False, index=merged.index)
+    for column in compared[2:]:
+        price_changed |= both & ~_same(merged[column], merged[f"{column}_prev"])
+    discount_changed = both & ~_same(merged["discount"], merged["discount_prev"])
+
+    merged["change"] = None
+    merged.loc[merged["_merge"] == "left_only", "change"] = "entered"
+    merged.loc[merged["_merge"] == "right_only", "change"] = "left"
+    merged.loc[moved | price_changed | discount_changed, "change"] = "updated"
+    merged["moved"] = moved
+    merged["price_changed"] = price_changed
+    merged["discount_changed"] = discount_changed
+    merged["prev_rank"] = merged["rank_prev"].astype("Int32")
+
+    changes = merged.loc[merged["change"].notna(),
+                         ["key", "change", "prev_rank", "moved", "price_changed", "discount_changed"]]
+    new_rows = changes[changes["change"] != "left"].merge(current, on="key", how="left")
+    left_rows = changes[changes["change"] == "left"].merge(previous, on="key", how="left")
+    frame = pd.concat([new_rows, left_rows], ignore_index=True)
+    if "rank" in frame.columns:
+        frame = frame.sort_values(["rank"], kind="stable", na_position="last").reset_index(drop=True)
+    return ChangeSet(frame)
+
+
+def apply_changes(state, changes):
+    """상태(DataFrame)에 변경분 DataFrame을 적용한 새 상태를 반환합니다."""
+    if "key" not in state.columns:
+        state = state.assign(key=row_keys(state))
+    state = state[~state["key"].isin(changes["key"])]
+    added = changes[changes["change"] != "left"]
+    columns = [column for column in state.columns if column in added.columns]
+    state = pd.concat([state, added[columns]], ignore_index=True)
+    return state.sort_values("rank", kind="stable").reset_index(drop=True)
+
+
+class DeltaStore:
+    """
+    변경분과 주기적인 전체 스냅샷으로 랭킹을 저장합니다.
+
+    Parameters:
+    -----------
+    root : str
+        변경분 파일을 저장할 폴더
+    snapshots : SnapshotStore
+        전체 스냅샷 저장소 (기본값: SnapshotStore())
+    full_interval : timedelta
+        마지막 전체 스냅샷 이후 이 시간이 지나면 전체 스냅샷을 저장합니다.
+    max_deltas : int
+        마지막 전체 스냅샷 이후 변경분 파일이 이만큼 쌓이면 전체 스냅샷을 저장합니다.
+    """
+
+    def __init__(self, root=DEFAULT_ROOT, snapshots=None, full_interval=DEFAULT_FULL_INTERVAL,
+                 max_deltas=DEFAULT_MAX_DELTAS):
+        self.root = root
+        self.snapshots = snapshots or SnapshotStore()
+        self.full_interval = full_interval
+        self.max_deltas = max_deltas
+
+    def current(self, category):
+        """
+        카테고리의 현재 상태를 (DataFrame, 기준 스냅샷 시각, 적용한 변경분 파일 목록)으로 반환합니다.
+
+        저장된 스냅샷이 없으면 (None, None, [])입니다.
+        """
+        state, base_at = self.snapshots.latest(category)
+        if state is None:
+            return None, None, []
+        deltas = self._delta_files(category, since=base_at)
+        state = state.assign(key=row_keys(state))
+        for _, path in deltas:
+            state = apply_changes(state, pq.read_table(path).to_pandas())
+        return state.drop(columns="key"), base_at, [path for _, path in deltas]
+
+    def record(self, df, category, captured_at=None):
+        """
+        새 랭킹을 기록합니다.
+
+        전체 스냅샷을 저장할 때가 되었으면 전체를, 아니면 바뀐 행만 저장하고,
+        바뀐 것이 없으면 아무것도 쓰지 않습니다.
+
+        Returns:
+        --------
+        dict: {"mode": 'full' | 'delta' | 'unchanged', "path": 저장한 파일(없으면 None),
+               "changes": ChangeSet(이전 상태가 없으면 None)}
+        """
+        captured_at = to_utc(captured_at).replace(microsecond=0)
+
+        state, base_at, deltas = self.current(category)
+        changes = compute_changes(state, df) if state is not None else None
+
+        # 마지막 스냅샷이 빈 파일이면 기준 시각(base_at)이 없으므로 전체 스냅샷을 저장합니다.
+        if (state is None or base_at is None or captured_at - base_at >= self.full_interval
+                or len(deltas) >= self.max_deltas):
+            path = self.snapshots.append(df, category, captured_at)
+            return {"mode": "full", "path": path, "changes": changes}
+        if changes.is_empty:
+            return {"mode": "unchanged", "path": None, "changes": changes}
+        return {"mode": "delta", "path": self._write(changes, category, captured_at),
+                "changes": changes}
+
+    def changes(self, category, since=None, until=None):
+        """기간 안에 저장된 변경분을 시간순으로 합친 DataFrame을 반환합니다. (후속 처리용)"""
+        frames = [pq.read_table(path).to_pandas()
+                  for captured_at, path in self._delta_files(category, since=since)
+                  if until is None or captured_at <= until]
+        if not frames:
+            return pd.DataFrame(columns=DELTA_SCHEMA.names)
+        return pd.concat(frames, ignore_index=True)
+
+    def _write(self, changes, category, captured_at):
+        table = self.snapshots.to_table(changes.frame, captured_at)
+        for field in CHANGE_SCHEMA:
+            column = changes.frame[field.name].astype(object)
+            table = table.append_column(field, pa.array(column.where(column.notna(), None).tolist(),
+                                                        type=field.type))
+
+        directory = os.path.join(self.root, f"category={category}",
+                                 f"date={captured_at.strftime('%Y-%m-%d')}")
+        os.makedirs(directory, exist_ok=True)
+        filename = f"delta-{captured_at.strftime('%H%M%S')}-{uuid.uuid4().hex[:8]}.parquet"
+        path = os.path.join(directory, filename)
+        pq.write_table(table, path + ".tmp", compression="zstd")
+        os.replace(path + ".tmp", path)
+        return path
+
+    def _delta_files(self, category, since=None):
+        """since 이후(초과)의 변경분 파일을 [(captured_at, 경로)]로 시간순 반환합니다."""
+        category_dir = os.path.join(self.root, f"category={category}")
+        if not os.path.isdir(category_dir):
+            return []
+        since = to_utc(since) if since is not None else None
+
+        found = []
+        for date_dir in sorted(os.listdir(category_dir)):
+            if not date_dir.startswith("date="):
+                continue
+            date = date_dir.split("=", 1)[1]
+            if since is not None and date < since.strftime("%Y-%m-%d"):
+                continue
+            directory = os.path.join(category_dir, date_dir)
+            for name in sorted(os.listdir(directory)):
+                if not (name.startswith("delta-") and name.endswith(".parquet")):
+                    continue
+                captured_at = datetime.strptime(f"{date} {name[6:12]}", "%Y-%m-%d %H%M%S")
+                captured_at = captured_at.replace(tzinfo=timezone.utc)
+                if since is None or captured_at > since:
+                    found.append((captured_at, os.path.join(directory, name)))
+        return found
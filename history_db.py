@@ -0,0 +1,185 @@
+"""app_id 기준으로 랭킹 이력을 쌓는 SQLite 데이터베이스입니다.
+
+수집할 때마다 (app_id, category, region, captured_at) 단위로 순위를 기록하므로
+특정 게임의 순위 변화나 특정 시점의 TOP N을 파일을 모두 읽지 않고 바로 조회할 수 있습니다.
+"""
+import os
+import sqlite3
+from datetime import datetime, timezone
+
+import pandas as pd
+
+DEFAULT_DB_PATH = "./output/ranking_history.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS apps (
+    app_id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS rankings (
+    app_id INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    region TEXT NOT NULL,
+    captured_at INTEGER NOT NULL,
+    rank INTEGER NOT NULL,
+    price_numeric REAL,
+    discount INTEGER,
+    review_score_numeric INTEGER,
+    PRIMARY KEY (app_id, category, region, captured_at)
+) WITHOUT ROWID;
+
+-- 특정 시점의 TOP N 조회용 (기본 키는 게임별 순위 변화 조회에 사용)
+CREATE INDEX IF NOT EXISTS idx_rankings_time_rank
+    ON rankings (category, region, captured_at, rank);
+"""
+
+
+def _to_epoch(value):
+    """
+    datetime 또는 'YYYY-MM-DD[ HH:MM:SS]' 문자열을 UTC 기준 초 단위 정수로 바꿉니다.
+
+    시간대가 없는 시각은 UTC로 봅니다. (snapshot_store.to_utc와 같은 규칙)
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+class RankingHistory:
+    """랭킹 이력을 기록하고 조회합니다."""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def record(self, df, category, region="US", captured_at=None):
+        """
+        한 번의 수집 결과를 트랜잭션 하나로 기록합니다.
+
+        같은 (app_id, category, region, captured_at)이 이미 있으면 덮어씁니다.
+        app_id가 없는 행은 건너뜁니다. 기록한 행 수를 반환합니다.
+        """
+        return self.record_many({category: df}, region, captured_at)
+
+    def record_many(self, frames, region="US", captured_at=None):
+        """{카테고리: DataFrame}을 같은 captured_at으로 트랜잭션 하나에 기록합니다."""
+        captured_at = _to_epoch(captured_at or datetime.now(timezone.utc))
+        apps, rows = {}, []
+        for category, df in frames.items():
+            category_apps, category_rows = self._rows(df, category, region, captured_at)
+            apps.update(category_apps)
+            rows.extend(category_rows)
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO apps (app_id, title) VALUES (?, ?) "
+                "ON CONFLICT(app_id) DO UPDATE SET title = excluded.title",
+                list(apps.items()),
+            )
+            self.conn.executemany(
+                "INSERT INTO rankings (app_id, category, region, captured_at, rank, "
+                "price_numeric, discount, review_score_numeric) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(app_id, category, region, captured_at) DO UPDATE SET "
+                "rank = excluded.rank, price_numeric = excluded.price_numeric, "
+                "discount = excluded.discount, review_score_numeric = excluded.review_score_numeric",
+                rows,
+            )
+        return len(rows)
+
+    def _rows(self, df, category, region, captured_at):
+        """DataFrame을 ({app_id: 제목}, rankings 행 리스트)로 바꿉니다."""
+        app_ids = pd.to_numeric(df["app_id"], errors="coerce")
+        valid = df[app_ids.notna()]
+        app_ids = app_ids[app_ids.notna()].astype("int64")
+
+        def column(name, default=None):
+            if name in valid.columns:
+                return valid[name].tolist()
+            return [default] * len(valid)
+
+        apps = dict(zip(app_ids.tolist(), column("title", "")))
+        rows = list(zip(
+            app_ids.tolist(),
+            [category] * len(valid),
+            [region] * len(valid),
+            [captured_at] * len(valid),
+            [int(rank) for rank in column("rank", 0)],
+            column("price_numeric"),
+            column("discount"),
+            column("review_score_numeric"),
+        ))
+        return apps, rows
+
+    def trajectory(self, app_id, categories=None, region="US", since=None, until=None):
+        """한 게임의 카테고리별 순위 변화를 시간순으로 반환합니다."""
+        query = ("SELECT category, captured_at, rank, price_numeric, discount "
+                 "FROM rankings WHERE app_id = ?")
+        params = [int(app_id)]
+        if categories:
+            query += f" AND category IN ({', '.join('?' * len(categories))})"
+            params.extend(categories)
+        query += " AND region = ?"
+        params.append(region)
+        if since is not None:
+            query += " AND captured_at >= ?"
+            params.append(_to_epoch(since))
+        if until is not None:
+            query += " AND captured_at <= ?"
+            params.append(_to_epoch(until))
+        query += " ORDER BY captured_at, category"
+
+        return self._frame(query, params, ["category", "captured_at", "rank", "price_numeric", "discount"])
+
+    def top_n_at(self, category, at=None, n=10, region="US"):
+        """at 시점(기본값: 최신) 이전의 마지막 스냅샷에서 상위 n개를 반환합니다."""
+        query = "SELECT MAX(captured_at) FROM rankings WHERE category = ? AND region = ?"
+        params = [category, region]
+        if at is not None:
+            query += " AND captured_at <= ?"
+            params.append(_to_epoch(at))
+        snapshot = self.conn.execute(query, params).fetchone()[0]
+        if snapshot is None:
+            return self._frame_from_rows([], ["rank", "app_id", "title", "price_numeric", "discount",
+                                              "captured_at"])
+
+        return self._frame(
+            "SELECT r.rank, r.app_id, a.title, r.price_numeric, r.discount, r.captured_at "
+            "FROM rankings AS r JOIN apps AS a ON a.app_id = r.app_id "
+            "WHERE r.category = ? AND r.region = ? AND r.captured_at = ? AND r.rank <= ? "
+            "ORDER BY r.rank",
+            [category, region, snapshot, n],
+            ["rank", "app_id", "title", "price_numeric", "discount", "captured_at"],
+        )
+
+    def snapshot_times(self, category, region="US"):
+        """기록된 스냅샷 시각 목록을 반환합니다."""
+        rows = self.conn.execute(
+            "SELECT DISTINCT captured_at FROM rankings WHERE category = ? AND region = ? "
+            "ORDER BY captured_at", (category, region)
+        ).fetchall()
+        return [datetime.fromtimestamp(row[0], timezone.utc) for row in rows]
+
+    def _frame(self, query, params, columns):
+        return self._frame_from_rows(self.conn.execute(query, params).fetchall(), columns)
+
+    def _frame_from_rows(self, rows, columns):
+        frame = pd.DataFrame(rows, columns=columns)
+        if "captured_at" in frame.columns:
+            frame["captured_at"] = pd.to_datetime(frame["captured_at"], unit="s", utc=True)
+        return frame
+
+    def close(self):
+        self.conn.close()
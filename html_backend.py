@@ -0,0 +1,203 @@
+"""HTML 파서 백엔드 모음입니다.
+
+스크래퍼는 아래 공통 메서드만 사용하므로 백엔드를 바꿔도 같은 결과를 얻습니다.
+
+- parse(html): 문서를 파싱해 루트 노드를 반환
+- select(node, selector) / select_one(node, selector): CSS 선택자로 하위 노드 검색
+- text(node): 하위 텍스트 전체를 이어 붙인 문자열
+- attr(node, name, default): 속성 값
+- children(node): 자식 요소 노드 리스트 (텍스트/주석 제외)
+- tag_info(node): (태그 이름, 속성 dict, class 튜플)
+- texts(node): 하위 텍스트 조각을 앞뒤 공백을 제거해 순서대로 담은 리스트 (빈 조각 제외)
+- parent(node) / same_node(a, b): (선택) 부모 노드, 같은 노드인지 여부
+
+CSS 선택자는 백엔드 인스턴스마다 한 번만 컴파일해서 재사용합니다.
+"""
+
+
+class BeautifulSoupBackend:
+    """BeautifulSoup + soupsieve 백엔드입니다. 항상 사용할 수 있는 기본값입니다."""
+
+    name = "html.parser"
+
+    def __init__(self, features="html.parser"):
+        from bs4 import BeautifulSoup
+        import soupsieve
+
+        self._soup_class = BeautifulSoup
+        self._compile = soupsieve.compile
+        self.features = features
+        self._selectors = {}
+
+    def _compiled(self, selector):
+        compiled = self._selectors.get(selector)
+        if compiled is None:
+            compiled = self._selectors[selector] = self._compile(selector)
+        return compiled
+
+    def parse(self, html):
+        return self._soup_class(html, self.features)
+
+    def select(self, node, selector):
+        return self._compiled(selector).select(node)
+
+    def select_one(self, node, selector):
+        return self._compiled(selector).select_one(node)
+
+    def text(self, node):
+        return node.get_text()
+
+    def attr(self, node, name, default=None):
+        value = node.get(name, default)
+        # class처럼 여러 값을 가지는 속성은 리스트로 돌아오므로 문자열로 맞춥니다.
+        if isinstance(value, list):
+            return " ".join(value)
+        return value
+
+    def children(self, node):
+        # 텍스트/주석 노드는 name이 None입니다.
+        return [child for child in node.children if child.name is not None]
+
+    def tag_info(self, node):
+        attrs = node.attrs
+        return node.name, attrs, tuple(attrs.get("class", ()))
+
+    def texts(self, node):
+        return list(node.stripped_strings)
+
+
+class LxmlBackend:
+    """lxml.html + cssselect 백엔드입니다. lxml과 cssselect가 설치되어 있어야 합니다."""
+
+    name = "lxml"
+
+    def __init__(self):
+        import lxml.html
+        from lxml.cssselect import CSSSelector
+
+        self._fromstring = lxml.html.fromstring
+        self._selector_class = CSSSelector
+        self._selectors = {}
+
+    def _compiled(self, selector):
+        compiled = self._selectors.get(selector)
+        if compiled is None:
+            compiled = self._selectors[selector] = self._selector_class(selector)
+        return compiled
+
+    def parse(self, html):
+        return self._fromstring(html)
+
+    def select(self, node, selector):
+        return self._compiled(selector)(node)
+
+    def select_one(self, node, selector):
+        found = self._compiled(selector)(node)
+        return found[0] if found else None
+
+    def text(self, node):
+        return node.text_content()
+
+    def attr(self, node, name, default=None):
+        return node.get(name, default)
+
+    def children(self, node):
+        # 주석 노드는 tag가 문자열이 아닙니다.
+        return [child for child in node.iterchildren() if isinstance(child.tag, str)]
+
+    def tag_info(self, node):
+        attrs = node.attrib
+        return node.tag, attrs, tuple(attrs.get("class", "").split())
+
+    def texts(self, node):
+        return [piece for piece in (text.strip() for text in node.itertext()) if piece]
+
+
+class SelectolaxBackend:
+    """selectolax(lexbor) 백엔드입니다. selectolax가 설치되어 있어야 합니다."""
+
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+
+        self._parser_class = LexborHTMLParser
+
+    def parse(self, html):
+        return self._parser_class(html)
+
+    def select(self, node, selector):
+        return node.css(selector)
+
+    def select_one(self, node, selector):
+        return node.css_first(selector)
+
+    def text(self, node):
+        return node.text(deep=True)
+
+    def attr(self, node, name, default=None):
+        value = node.attributes.get(name, default)
+        return default if value is None else value
+
+    def children(self, node):
+        # 텍스트/주석 노드의 tag는 '-text', '-comment'처럼 '-'로 시작합니다.
+        return [child for child in node.iter(include_text=False) if child.tag[0] != "-"]
+
+    def tag_info(self, node):
+        attrs = node.attributes
+        return node.tag, attrs, tuple((attrs.get("class") or "").split())
+
+    # parent/same_node가 있으면 row_extract가 여러 필드 선택자를 묶어 네이티브로 한 번에 찾습니다.
+    def parent(self, node):
+        return node.parent
+
+    def same_node(self, a, b):
+        return a.mem_id == b.mem_id
+
+    def texts(self, node):
+        return [piece for piece in (child.text_content.strip()
+                                    for child in node.traverse(include_text=True)
+                                    if child.tag == "-text") if piece]
+
+
+BACKENDS = {
+    "html.parser": BeautifulSoupBackend,
+    "lxml": LxmlBackend,
+    "selectolax": SelectolaxBackend,
+}
+
+# 'auto'를 요청하면 설치된 백엔드 중 앞쪽부터 사용합니다.
+AUTO_ORDER = ("selectolax", "lxml", "html.parser")
+
+_instances = {}
+
+
+def available_backends():
+    """현재 환경에서 사용할 수 있는 백엔드 이름 목록을 반환합니다."""
+    names = []
+    for name in BACKENDS:
+        try:
+            get_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_backend(name="auto"):
+    """이름에 해당하는 백엔드 인스턴스를 반환합니다. 프로세스마다 하나씩 재사용합니다."""
+    if name == "auto":
+        for candidate in AUTO_ORDER:
+            try:
+                return get_backend(candidate)
+            except ImportError:
+                continue
+        raise ImportError("사용할 수 있는 HTML 파서가 없습니다.")
+
+    if name not in BACKENDS:
+        raise ValueError(f"알 수 없는 파서 백엔드입니다: {name}")
+
+    backend = _instances.get(name)
+    if backend is None:
+        backend = _instances[name] = BACKENDS[name]()
+    return backend
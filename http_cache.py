@@ -0,0 +1,210 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+# URL 패턴별 캐시 유지 시간(초). 위에서부터 처음 일치하는 규칙을 사용합니다.
+DEFAULT_TTL_RULES = [
+    (r"/api/featuredcategories", 600),
+    (r"/api/appdetails", 3600),
+    (r"/charts/", 900),
+    (r"/search/", 600),
+]
+DEFAULT_TTL = 300
+DEFAULT_CACHE_PATH = "./.cache/http_cache.sqlite"
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+
+class CachedResponse:
+    """캐시에서 꺼낸 응답입니다. requests.Response에서 쓰는 속성만 흉내 냅니다."""
+
+    def __init__(self, url, status_code, headers, content, encoding, from_cache=True):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or "utf-8"
+        self.from_cache = from_cache
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        # 캐시에는 성공한 응답만 저장하므로 항상 통과합니다.
+        return None
+
+
+class CacheEntry:
+    """캐시 테이블의 한 행입니다."""
+
+    def __init__(self, key, url, status_code, headers, content, encoding, stored_at, ttl):
+        self.key = key
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+        self.stored_at = stored_at
+        self.ttl = ttl
+
+    def age(self, now=None):
+        return (now or time.time()) - self.stored_at
+
+    def is_fresh(self, now=None):
+        return self.age(now) < self.ttl
+
+    def validators(self):
+        """조건부 요청에 사용할 헤더를 반환합니다."""
+        headers = {}
+        if self.headers.get("ETag"):
+            headers["If-None-Match"] = self.headers["ETag"]
+        if self.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = self.headers["Last-Modified"]
+        return headers
+
+    def to_response(self):
+        return CachedResponse(self.url, self.status_code, self.headers, self.content, self.encoding)
+
+
+class HttpCache:
+    """SQLite 파일에 저장되는 HTTP 응답 캐시입니다.
+
+    - URL 패턴별 TTL
+    - ETag / Last-Modified 조건부 재검증
+    - 전체 크기 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제(LRU)
+    - stale_while_revalidate 초 이내의 만료된 항목은 바로 반환하고 백그라운드에서 갱신
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES,
+                 ttl_rules=None, default_ttl=DEFAULT_TTL, stale_while_revalidate=0):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_rules = [(re.compile(pattern), ttl)
+                          for pattern, ttl in (ttl_rules if ttl_rules is not None else DEFAULT_TTL_RULES)]
+        self.default_ttl = default_ttl
+        self.stale_while_revalidate = stale_while_revalidate
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status_code INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                encoding TEXT,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                ttl REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)")
+        self._conn.commit()
+
+    def ttl_for(self, url):
+        """URL에 적용할 TTL을 반환합니다."""
+        for pattern, ttl in self.ttl_rules:
+            if pattern.search(url):
+                return ttl
+        return self.default_ttl
+
+    def get(self, key):
+        """키에 해당하는 항목을 반환하고 마지막 사용 시각을 갱신합니다."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status_code, headers, body, encoding, stored_at, ttl "
+                "FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+
+        url, status_code, headers, body, encoding, stored_at, ttl = row
+        return CacheEntry(key, url, status_code, json.loads(headers), zlib.decompress(body),
+                          encoding, stored_at, ttl)
+
+    def put(self, key, url, status_code, headers, content, encoding, ttl=None):
+        """응답을 저장하고 필요하면 오래된 항목을 정리합니다."""
+        keep = {name: headers[name] for name in ("ETag", "Last-Modified", "Content-Type")
+                if headers.get(name)}
+        body = zlib.compress(content)
+        now = time.time()
+        ttl = self.ttl_for(url) if ttl is None else ttl
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, status_code, headers, body, encoding, size, stored_at, accessed_at, ttl) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, status_code, json.dumps(keep), body, encoding, len(body), now, now, ttl),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def refresh(self, key, headers=None, ttl=None):
+        """304 응답을 받았을 때 본문은 그대로 두고 저장 시각만 갱신합니다."""
+        now = time.time()
+        with self._lock:
+            if headers:
+                row = self._conn.execute("SELECT headers FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    stored = json.loads(row[0])
+                    for name in ("ETag", "Last-Modified"):
+                        if headers.get(name):
+                            stored[name] = headers[name]
+                    self._conn.execute("UPDATE responses SET headers = ? WHERE key = ?",
+                                       (json.dumps(stored), key))
+            if ttl is None:
+                self._conn.execute("UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?",
+                                   (now, now, key))
+            else:
+                self._conn.execute("UPDATE responses SET stored_at = ?, accessed_at = ?, ttl = ? WHERE key = ?",
+                                   (now, now, ttl, key))
+            self._conn.commit()
+
+    def _evict(self):
+        """전체 크기가 상한을 넘으면 가장 오래 사용하지 않은 항목부터 지웁니다."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        expired = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            expired.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", expired)
+
+    def total_size(self):
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,416 @@
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+import metrics
+from http_cache import HttpCache
+from rate_limit import AimdLimiter, CircuitBreaker, backoff_delay, parse_retry_after
+
+# 모든 수집기가 공유하는 HTTP 설정입니다.
+# User-Agent와 Accept-Language 정책은 이곳에서만 관리합니다.
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36"
+ACCEPT_LANGUAGES = {
+    "en": "en-US,en;q=0.9",
+    "ko": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+DEFAULT_LANGUAGE = "en"
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Language": ACCEPT_LANGUAGES[DEFAULT_LANGUAGE],
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+# 호스트별로 유지할 연결 풀 크기(동시 연결 상한)와 풀을 유지할 호스트 수
+MAX_CONNECTIONS_PER_HOST = 8
+MAX_POOLED_HOSTS = 16
+DEFAULT_TIMEOUT = 15
+
+# 디스크 캐시 설정. CACHE_ENABLED가 False이면 모든 요청이 네트워크로 나갑니다.
+CACHE_ENABLED = True
+CACHE_OPTIONS = {}
+
+# 요청 스케줄러 설정 (호스트마다 AimdLimiter와 CircuitBreaker를 하나씩 둡니다)
+# 이 상태 코드와 연결 오류는 과부하로 보고 동시 요청 수를 줄인 뒤 재시도합니다.
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# 다시 보내볼 만한 네트워크 오류 (본문을 받다 연결이 끊긴 경우 포함)
+RETRY_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                requests.exceptions.ChunkedEncodingError)
+MAX_RETRIES = 4
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+LIMITER_OPTIONS = {"initial": 4, "minimum": 1, "maximum": MAX_CONNECTIONS_PER_HOST}
+BREAKER_OPTIONS = {"failure_threshold": 5, "reset_timeout": 30.0}
+
+_session = None
+_session_lock = threading.Lock()
+_cache = None
+_revalidating = set()
+_hosts = {}
+# 진행 중인 요청: 키 → _Call. 같은 요청이 동시에 들어오면 하나만 보내고 결과를 나눠 씁니다.
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+# 호스트별 요청 수와 실제 TCP 연결(핸드셰이크) 수
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def _count(host, key):
+    with _stats_lock:
+        entry = _stats.setdefault(host, {"requests": 0, "new_connections": 0, "retries": 0})
+        entry[key] += 1
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """호스트의 회로 차단기가 열려 있어 요청을 보내지 않았을 때 발생합니다."""
+
+
+class _CountingHTTPConnection(HTTPConnection):
+    def connect(self):
+        _count(f"http://{self.host}:{self.port}", "new_connections")
+        super().connect()
+
+    def request(self, *args, **kwargs):
+        _count(f"http://{self.host}:{self.port}", "requests")
+        return super().request(*args, **kwargs)
+
+
+class _CountingHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        _count(f"https://{self.host}:{self.port}", "new_connections")
+        super().connect()
+
+    def request(self, *args, **kwargs):
+        _count(f"https://{self.host}:{self.port}", "requests")
+        return super().request(*args, **kwargs)
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CountingHTTPConnection
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CountingHTTPSConnection
+
+
+class _PooledAdapter(HTTPAdapter):
+    """연결 생성과 요청 수를 세는 연결 풀 어댑터입니다."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+def _create_session():
+    """keep-alive 연결 풀을 사용하는 세션을 만듭니다."""
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+
+    # pool_block=True 이면 호스트별 연결 수가 상한을 넘지 않도록 대기합니다.
+    adapter = _PooledAdapter(
+        pool_connections=MAX_POOLED_HOSTS,
+        pool_maxsize=MAX_CONNECTIONS_PER_HOST,
+        pool_block=True,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session():
+    """프로세스 전체에서 공유하는 세션을 반환합니다."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _create_session()
+    return _session
+
+
+def get_cache():
+    """프로세스 전체에서 공유하는 디스크 캐시를 반환합니다."""
+    global _cache
+    if _cache is None:
+        with _session_lock:
+            if _cache is None:
+                _cache = HttpCache(**CACHE_OPTIONS)
+    return _cache
+
+
+def configure_cache(enabled=True, **options):
+    """캐시 사용 여부와 HttpCache 옵션(path, max_bytes, ttl_rules 등)을 바꿉니다."""
+    global CACHE_ENABLED, CACHE_OPTIONS, _cache
+    with _session_lock:
+        CACHE_ENABLED = enabled
+        CACHE_OPTIONS = options
+        if _cache is not None:
+            _cache.close()
+            _cache = None
+
+
+def get(url, params=None, headers=None, language=None, timeout=DEFAULT_TIMEOUT,
+        use_cache=True, ttl=None, **kwargs):
+    """공유 세션으로 GET 요청을 보냅니다.
+
+    language에 'en' 또는 'ko'를 주면 해당 언어의 Accept-Language를 사용합니다.
+    캐시가 켜져 있으면 TTL 안의 응답은 네트워크 없이 반환하고,
+    만료된 응답은 ETag/Last-Modified로 조건부 재검증합니다.
+    같은 요청이 다른 스레드에서 이미 진행 중이면 새로 보내지 않고 그 응답을 함께 받습니다.
+    나머지 인자는 requests.get과 같습니다.
+    """
+    headers = dict(headers or {})
+    if language is not None:
+        headers["Accept-Language"] = ACCEPT_LANGUAGES[language]
+
+    if kwargs.get("stream"):
+        return _send(url, params, headers, timeout, **kwargs)
+
+    session = get_session()
+    prepared = session.prepare_request(requests.Request("GET", url, params=params, headers=headers))
+    # 같은 URL이라도 언어가 다르면 응답이 다르므로 키에 포함합니다.
+    key = f"{prepared.url}|{prepared.headers.get('Accept-Language', '')}"
+    cached = CACHE_ENABLED and use_cache
+    return _coalesced(f"{key}|{sorted(headers.items())}|{sorted(kwargs.items())}|{cached}",
+                      lambda: _get(key, url, params, headers, timeout, cached, ttl, **kwargs))
+
+
+class _Call:
+    """진행 중인 요청 하나입니다. 먼저 들어온 스레드가 보내고 나머지는 결과를 기다립니다."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+def _coalesced(key, fetch):
+    """
+    같은 key의 요청이 이미 진행 중이면 새로 보내지 않고 그 결과를 함께 받습니다. (singleflight)
+
+    응답 객체는 요청한 스레드들이 함께 쓰므로 읽기만 해야 합니다.
+    """
+    with _inflight_lock:
+        call = _inflight.get(key)
+        leader = call is None
+        if leader:
+            call = _inflight[key] = _Call()
+
+    if not leader:
+        metrics.incr("coalesced")
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.response
+
+    try:
+        call.response = fetch()
+        return call.response
+    except Exception as e:
+        call.error = e
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+        call.done.set()
+
+
+def _get(key, url, params, headers, timeout, cached, ttl, **kwargs):
+    if not cached:
+        return _send(url, params, headers, timeout, **kwargs)
+
+    cache = get_cache()
+    entry = cache.get(key)
+
+    if entry is not None:
+        if entry.is_fresh():
+            metrics.incr("cache_hit")
+            return entry.to_response()
+        if entry.age() < entry.ttl + cache.stale_while_revalidate:
+            metrics.incr("cache_stale")
+            _revalidate_in_background(key, entry, url, params, headers, timeout, ttl, **kwargs)
+            return entry.to_response()
+
+    return _fetch_and_store(key, entry, url, params, headers, timeout, ttl, **kwargs)
+
+
+def _host_key(url):
+    """URL에서 통계와 같은 형식의 호스트 키(scheme://host:port)를 만듭니다."""
+    parts = urlsplit(url)
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    return f"{parts.scheme}://{parts.hostname}:{port}"
+
+
+def _host_controls(host):
+    """호스트별 (AimdLimiter, CircuitBreaker)를 반환합니다."""
+    controls = _hosts.get(host)
+    if controls is None:
+        with _session_lock:
+            controls = _hosts.get(host)
+            if controls is None:
+                controls = (AimdLimiter(**LIMITER_OPTIONS), CircuitBreaker(**BREAKER_OPTIONS))
+                _hosts[host] = controls
+    return controls
+
+
+def configure_scheduler(max_retries=None, limiter=None, breaker=None, backoff_base=None,
+                        backoff_cap=None):
+    """재시도 횟수와 AimdLimiter/CircuitBreaker 옵션을 바꾸고 호스트별 상태를 초기화합니다."""
+    global MAX_RETRIES, BACKOFF_BASE, BACKOFF_CAP
+    with _session_lock:
+        if max_retries is not None:
+            MAX_RETRIES = max_retries
+        if backoff_base is not None:
+            BACKOFF_BASE = backoff_base
+        if backoff_cap is not None:
+            BACKOFF_CAP = backoff_cap
+        LIMITER_OPTIONS.update(limiter or {})
+        BREAKER_OPTIONS.update(breaker or {})
+        _hosts.clear()
+
+
+def _send(url, params, headers, timeout, **kwargs):
+    """
+    호스트별 동시 요청 상한과 회로 차단기를 거쳐 요청을 보냅니다.
+
+    429/5xx 응답이나 연결 오류(RETRY_ERRORS)는 동시 요청 상한을 줄이고, Retry-After(없으면 지터를 넣은
+    지수 백오프)만큼 기다린 뒤 MAX_RETRIES번까지 다시 보냅니다.
+    마지막 시도의 응답은 상태 코드와 관계없이 그대로 반환합니다.
+    """
+    host = _host_key(url)
+    limiter, breaker = _host_controls(host)
+    attempt = 0
+    while True:
+        if not breaker.allow():
+            metrics.incr("circuit_open")
+            raise CircuitOpenError(f"{host} 요청이 연속으로 실패해 {breaker.retry_in():.0f}초 동안 "
+                                   f"차단되었습니다.")
+
+        started = limiter.acquire()
+        retry_after = None
+        try:
+            with metrics.span("fetch") as span:
+                response = get_session().get(url, params=params, headers=headers, timeout=timeout,
+                                             **kwargs)
+                if not kwargs.get("stream"):
+                    # 본문을 여기서 받아야 다운로드 시간과 크기가 fetch에 들어갑니다.
+                    span.add(bytes=len(response.content))
+        except BaseException as e:
+            # 어떤 예외든 자리를 돌려주고 실패로 기록해야 상한과 시험 요청 상태가 새지 않습니다.
+            retryable = isinstance(e, RETRY_ERRORS)
+            limiter.release(started, overloaded=retryable)
+            breaker.record_failure()
+            if not retryable or attempt >= MAX_RETRIES:
+                raise
+        else:
+            overloaded = response.status_code in RETRY_STATUSES
+            limiter.release(started, overloaded=overloaded)
+            if not overloaded:
+                breaker.record_success()
+                return response
+            breaker.record_failure()
+            if attempt >= MAX_RETRIES:
+                return response
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            response.close()
+
+        _count(host, "retries")
+        metrics.incr("retries")
+        time.sleep(backoff_delay(attempt, BACKOFF_BASE, BACKOFF_CAP, retry_after))
+        attempt += 1
+
+
+def _fetch_and_store(key, entry, url, params, headers, timeout, ttl, **kwargs):
+    """네트워크로 요청하고 결과를 캐시에 반영합니다."""
+    cache = get_cache()
+    request_headers = dict(headers)
+    if entry is not None:
+        request_headers.update(entry.validators())
+
+    response = _send(url, params, request_headers, timeout, **kwargs)
+
+    if entry is not None and response.status_code == 304:
+        # 본문은 다시 받지 않고 캐시의 유효 기간만 연장합니다.
+        metrics.incr("cache_revalidated")
+        cache.refresh(key, response.headers, ttl)
+        return entry.to_response()
+
+    metrics.incr("cache_miss")
+
+    if response.status_code == 200:
+        cache.put(key, response.url, response.status_code, response.headers,
+                  response.content, response.encoding, ttl)
+    return response
+
+
+def _revalidate_in_background(key, entry, url, params, headers, timeout, ttl, **kwargs):
+    """
+    만료된 항목을 백그라운드 스레드에서 재검증합니다. 키마다 하나만 실행합니다.
+
+    kwargs(verify, allow_redirects 등)는 원래 요청과 같게 넘깁니다.
+    """
+    with _session_lock:
+        if key in _revalidating:
+            return
+        _revalidating.add(key)
+
+    def run():
+        try:
+            _fetch_and_store(key, entry, url, params, headers, timeout, ttl, **kwargs)
+        except requests.exceptions.RequestException:
+            pass
+        finally:
+            with _session_lock:
+                _revalidating.discard(key)
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+def connection_stats():
+    """호스트별 요청 수, 새 연결 수, 연결 재사용 횟수를 반환합니다."""
+    with _stats_lock:
+        return {
+            host: {
+                "requests": entry["requests"],
+                "new_connections": entry["new_connections"],
+                "reused": max(0, entry["requests"] - entry["new_connections"]),
+                "retries": entry["retries"],
+                "concurrency_limit": _hosts[host][0].limit if host in _hosts else None,
+                "circuit": _hosts[host][1].state if host in _hosts else None,
+            }
+            for host, entry in _stats.items()
+        }
+
+
+def print_connection_stats():
+    """연결 재사용 통계를 출력합니다."""
+    stats = connection_stats()
+    if not stats:
+        print("[연결 통계] 아직 보낸 요청이 없습니다.")
+        return
+    print("[연결 통계]")
+    for host, entry in stats.items():
+        print(f"- {host}: 요청 {entry['requests']}회, "
+              f"새 연결 {entry['new_connections']}회, 재사용 {entry['reused']}회, "
+              f"재시도 {entry['retries']}회")
+
+
+def close():
+    """공유 세션, 연결 풀과 캐시를 닫습니다."""
+    global _session, _cache
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+        if _cache is not None:
+            _cache.close()
+            _cache = None
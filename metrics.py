@@ -0,0 +1,229 @@
+"""수집 단계별 시간과 처리량을 기록하고 내보내는 모듈입니다.
+
+단계(throttle, fetch, parse, extract, preprocess, save, render)마다 호출 수, 걸린 시간, 처리한 행 수와
+바이트 수를 모으고, 재시도나 캐시 적중 같은 횟수는 카운터로 셉니다.
+표준 라이브러리만 사용하므로 수집만 하는 실행에서도 부담 없이 불러올 수 있습니다.
+
+    with metrics.span("parse") as span:
+        document = parser.parse(html)
+        span.add(bytes=len(html))
+
+    metrics.write_report("./output/metrics/run_report.json")       # JSON 실행 보고서
+    metrics.write_prometheus("./output/metrics/steam_collector.prom")  # node_exporter textfile
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+# throttle은 요청 속도 제한 때문에 기다린 시간입니다.
+STAGES = ("throttle", "fetch", "parse", "extract", "preprocess", "save", "render")
+PROMETHEUS_PREFIX = "steam_collector"
+
+_lock = threading.Lock()
+_stages = {}
+_counters = {}
+_started_at = time.time()
+_started = time.perf_counter()
+
+
+class Span:
+    """진행 중인 단계 하나입니다. add()로 처리한 행 수와 바이트 수를 더합니다."""
+
+    def __init__(self, stage):
+        self.stage = stage
+        self.rows = 0
+        self.bytes = 0
+
+    def add(self, rows=0, bytes=0):
+        self.rows += rows
+        self.bytes += bytes
+
+
+@contextmanager
+def span(stage):
+    """블록 실행 시간을 stage에 기록합니다. 예외가 나도 기록하고 errors를 하나 올립니다."""
+    current = Span(stage)
+    start = time.perf_counter()
+    failed = False
+    try:
+        yield current
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        record(stage, time.perf_counter() - start, rows=current.rows, bytes=current.bytes,
+               errors=int(failed))
+
+
+def record(stage, seconds, rows=0, bytes=0, errors=0):
+    """이미 측정한 시간을 stage에 더합니다."""
+    with _lock:
+        entry = _stages.setdefault(stage, {"calls": 0, "seconds": 0.0, "max_seconds": 0.0,
+                                           "rows": 0, "bytes": 0, "errors": 0})
+        entry["calls"] += 1
+        entry["seconds"] += seconds
+        entry["max_seconds"] = max(entry["max_seconds"], seconds)
+        entry["rows"] += rows
+        entry["bytes"] += bytes
+        entry["errors"] += errors
+
+
+def incr(name, value=1):
+    """카운터를 올립니다. (예: 'retries', 'cache_hit', 'cache_miss')"""
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def reset():
+    """모든 기록을 지우고 실행 시작 시각을 다시 잡습니다."""
+    global _started_at, _started
+    with _lock:
+        _stages.clear()
+        _counters.clear()
+        _started_at = time.time()
+        _started = time.perf_counter()
+
+
+def snapshot():
+    """현재까지의 기록을 JSON으로 바꿀 수 있는 dict로 반환합니다."""
+    with _lock:
+        stages = {stage: dict(entry) for stage, entry in _stages.items()}
+        counters = dict(_counters)
+        started_at, elapsed = _started_at, time.perf_counter() - _started
+
+    for entry in stages.values():
+        seconds = entry["seconds"]
+        entry["rows_per_sec"] = entry["rows"] / seconds if seconds > 0 and entry["rows"] else None
+        entry["bytes_per_sec"] = entry["bytes"] / seconds if seconds > 0 and entry["bytes"] else None
+
+    lookups = sum(counters.get(f"cache_{result}", 0) for result in ("hit", "stale", "revalidated", "miss"))
+    served = lookups - counters.get("cache_miss", 0)
+    return {
+        "started_at": datetime.fromtimestamp(started_at, timezone.utc).isoformat(timespec="seconds"),
+        "duration_seconds": elapsed,
+        "stages": stages,
+        "counters": counters,
+        "cache_hit_ratio": served / lookups if lookups else None,
+    }
+
+
+def print_summary():
+    """단계별 시간과 처리량을 표로 출력합니다."""
+    report = snapshot()
+    print(f"\n⏱️ 단계별 시간 (전체 {report['duration_seconds']:.2f}초)")
+    ordered = [stage for stage in STAGES if stage in report["stages"]]
+    ordered += sorted(stage for stage in report["stages"] if stage not in STAGES)
+    for stage in ordered:
+        entry = report["stages"][stage]
+        line = f"- {stage:<10} {entry['seconds']:8.3f}초  {entry['calls']:5d}회"
+        if entry["rows_per_sec"]:
+            line += f"  {entry['rows']:,}행 ({entry['rows_per_sec']:,.0f}행/초)"
+        if entry["bytes"]:
+            line += f"  {entry['bytes'] / 1024:,.0f}KB"
+        print(line)
+    counters = report["counters"]
+    if counters.get("retries"):
+        print(f"- 재시도 {counters['retries']}회")
+    if report["cache_hit_ratio"] is not None:
+        print(f"- 캐시 적중률 {report['cache_hit_ratio']:.0%}")
+
+
+def _write_atomic(path, text):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(path + ".tmp", path)
+
+
+def write_report(path, **labels):
+    """JSON 실행 보고서를 저장합니다. labels(카테고리 등)는 보고서에 그대로 들어갑니다."""
+    report = {"labels": labels, **snapshot()}
+    report["finished_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    _write_atomic(path, json.dumps(report, ensure_ascii=False, indent=2))
+    return path
+
+
+def _label_text(labels):
+    if not labels:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+               for value in labels.values())
+    return "{" + ",".join(f'{key}="{value}"' for key, value in zip(labels, escaped)) + "}"
+
+
+def prometheus_text(cumulative=False, **labels):
+    """
+    Prometheus 텍스트 형식(node_exporter textfile collector용)으로 바꿉니다.
+
+    실행마다 reset()하는 일회성 실행은 "지난 실행" 값을 gauge로 내보냅니다.
+    cumulative=True이면 reset() 없이 계속 쌓는 상주 프로세스용으로, 누적 값을
+    `_total` 이름의 counter로 내보내 rate()/increase()로 구간 값을 구할 수 있게 합니다.
+    """
+    report = snapshot()
+    lines = []
+    period = "since the process started" if cumulative else "during the last run"
+    counter = "counter" if cumulative else "gauge"
+    suffix = "_total" if cumulative else ""
+
+    def metric(name, kind, help_text, samples):
+        full_name = f"{PROMETHEUS_PREFIX}_{name}"
+        lines.append(f"# HELP {full_name} {help_text}")
+        lines.append(f"# TYPE {full_name} {kind}")
+        for sample_labels, value in samples:
+            lines.append(f"{full_name}{_label_text({**labels, **sample_labels})} {value}")
+
+    stages = report["stages"]
+    metric(f"stage_seconds{suffix}", counter, f"Time spent in each stage {period}.",
+           [({"stage": stage}, f"{entry['seconds']:.6f}") for stage, entry in stages.items()])
+    metric("stage_max_seconds", "gauge", f"Slowest single call of each stage {period}.",
+           [({"stage": stage}, f"{entry['max_seconds']:.6f}") for stage, entry in stages.items()])
+    metric(f"stage_calls{suffix}", counter, f"Number of calls of each stage {period}.",
+           [({"stage": stage}, entry["calls"]) for stage, entry in stages.items()])
+    metric(f"stage_errors{suffix}", counter, f"Number of failed calls of each stage {period}.",
+           [({"stage": stage}, entry["errors"]) for stage, entry in stages.items()])
+    metric(f"stage_rows{suffix}", counter, f"Rows processed by each stage {period}.",
+           [({"stage": stage}, entry["rows"]) for stage, entry in stages.items() if entry["rows"]])
+    metric("stage_rows_per_second", "gauge", f"Row throughput of each stage {period}.",
+           [({"stage": stage}, f"{entry['rows_per_sec']:.3f}")
+            for stage, entry in stages.items() if entry["rows_per_sec"]])
+    metric(f"bytes_downloaded{suffix}", counter, f"Bytes downloaded from the network {period}.",
+           [({}, stages.get("fetch", {}).get("bytes", 0))])
+    metric(f"events{suffix}", counter, f"Event counters (retries, cache results) {period}.",
+           [({"event": name}, value) for name, value in sorted(report["counters"].items())])
+    if report["cache_hit_ratio"] is not None:
+        metric("cache_hit_ratio", "gauge", "Share of cacheable requests served from the HTTP cache.",
+               [({}, f"{report['cache_hit_ratio']:.4f}")])
+    if cumulative:
+        metric("process_uptime_seconds", "gauge", "Seconds since the process started collecting.",
+               [({}, f"{report['duration_seconds']:.3f}")])
+        metric("last_export_timestamp_seconds", "gauge", "Unix time of the latest export.",
+               [({}, f"{time.time():.0f}")])
+    else:
+        metric("run_duration_seconds", "gauge", "Wall-clock duration of the last run.",
+               [({}, f"{report['duration_seconds']:.3f}")])
+        metric("last_run_timestamp_seconds", "gauge", "Unix time when the last run finished.",
+               [({}, f"{time.time():.0f}")])
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path, cumulative=False, **labels):
+    """Prometheus textfile을 원자적으로 저장합니다. (수집기가 반쯤 쓴 파일을 읽지 않도록)"""
+    _write_atomic(path, prometheus_text(cumulative=cumulative, **labels))
+    return path
+
+
+def export(directory, cumulative=False, **labels):
+    """
+    directory에 run_report.json과 steam_collector.prom을 저장하고 두 경로를 반환합니다.
+
+    cumulative는 prometheus_text와 같습니다. (상주 프로세스는 True)
+    """
+    report_path = write_report(os.path.join(directory, "run_report.json"), **labels)
+    prom_path = write_prometheus(os.path.join(directory, f"{PROMETHEUS_PREFIX}.prom"),
+                                 cumulative=cumulative, **labels)
+    return report_path, prom_path
@@ -0,0 +1,160 @@
+"""여러 나라 통화로 표시된 가격 문자열을 (최소 단위 금액, 통화 코드)로 바꿉니다.
+
+'$19.99', '₩ 1,000', '1.234,56€', 'R$ 99,90', '¥ 2,980', 'Free' 같은 문자열을 열 단위로 처리합니다.
+
+- 통화 기호나 ISO 코드로 통화를 찾습니다. ('$', '¥', 'kr'처럼 여러 나라가 쓰는 기호는
+  currency 인자로 준 통화를 우선합니다)
+- 마지막 구분자('.' 또는 ',') 뒤 숫자가 1~2자리이고 그 구분자가 한 번만 나오면 소수점으로,
+  아니면 천 단위 구분자로 봅니다. 두 구분자가 모두 있으면 뒤에 나온 쪽이 소수점입니다.
+- 금액은 통화의 최소 단위 정수입니다. (USD는 센트, KRW/JPY는 원/엔 그대로)
+- 숫자 없이 'Free', '무료' 등이 들어 있으면 0, 가격을 알 수 없으면 결측값입니다.
+
+같은 가격 문자열이 많으므로 고유값만 파싱하고, 파싱 결과는 프로세스 안에서 기억해 두었다가
+다음 호출에서도 다시 파싱하지 않습니다. 고유값 파싱도 pandas 문자열 연산과 numpy로 한 번에 합니다.
+
+    normalized = price_normalize.normalize_prices(df["price"], currency="KRW")
+    normalized["amount_minor"], normalized["currency"]
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+# 기호/코드 → ISO 4217 통화 코드
+SYMBOLS = {
+    "$": "USD", "US$": "USD", "CDN$": "CAD", "C$": "CAD", "A$": "AUD", "NZ$": "NZD", "HK$": "HKD",
+    "NT$": "TWD", "S$": "SGD", "R$": "BRL", "Mex$": "MXN", "CLP$": "CLP", "COL$": "COP", "ARS$": "ARS",
+    "₩": "KRW", "¥": "JPY", "￥": "JPY", "€": "EUR", "£": "GBP", "₽": "RUB", "руб": "RUB",
+    "zł": "PLN", "₺": "TRY", "₹": "INR", "₴": "UAH", "₸": "KZT", "฿": "THB", "₫": "VND", "₱": "PHP",
+    "₪": "ILS", "₡": "CRC", "Rp": "IDR", "RM": "MYR", "CHF": "CHF", "kr": "SEK", "S/.": "PEN",
+    "SR": "SAR", "AED": "AED", "QR": "QAR", "KD": "KWD",
+}
+# 여러 통화가 함께 쓰는 기호. currency 인자를 주면 그 통화로 봅니다.
+AMBIGUOUS_SYMBOLS = frozenset({"$", "¥", "￥", "kr"})
+CURRENCY_CODES = frozenset(SYMBOLS.values()) | {"CNY", "NOK", "DKK", "EUR", "USD"}
+
+# 최소 단위가 1인 통화 (나머지는 1/100)
+ZERO_DECIMAL_CURRENCIES = frozenset({"KRW", "JPY", "VND", "CLP"})
+# 스토어 국가 코드 → 그 지역 가격의 통화 코드
+REGION_CURRENCIES = {
+    "US": "USD", "KR": "KRW", "JP": "JPY", "CN": "CNY", "GB": "GBP", "DE": "EUR", "FR": "EUR",
+    "IT": "EUR", "ES": "EUR", "NL": "EUR", "FI": "EUR", "AT": "EUR", "BE": "EUR", "PT": "EUR",
+    "IE": "EUR", "BR": "BRL", "RU": "RUB", "CA": "CAD", "AU": "AUD", "NZ": "NZD", "HK": "HKD",
+    "TW": "TWD", "SG": "SGD", "MX": "MXN", "CL": "CLP", "CO": "COP", "PL": "PLN", "TR": "TRY",
+    "IN": "INR", "UA": "UAH", "KZ": "KZT", "TH": "THB", "VN": "VND", "PH": "PHP", "IL": "ILS",
+    "ID": "IDR", "MY": "MYR", "CH": "CHF", "NO": "NOK", "SE": "SEK", "DK": "DKK", "PE": "PEN",
+    "SA": "SAR", "AE": "AED", "ZA": "ZAR",
+}
+
+FREE_PATTERN = r"free|무료|gratis|gratuit|kostenlos|бесплатно|免费|無料"
+# 기호는 긴 것부터 찾아야 'R$'나 'CDN$'가 '$'로 잘못 잡히지 않습니다.
+_SYMBOL_PATTERN = "|".join(re.escape(symbol) for symbol in
+                           sorted(set(SYMBOLS) | CURRENCY_CODES, key=len, reverse=True))
+# 공백(좁은 공백 포함)과 스위스식 천 단위 구분자(')는 숫자 사이에서 지웁니다.
+_SPACE_PATTERN = r"[\s  '’]"
+
+# (문자열, currency) → (최소 단위 금액 또는 NaN, 통화 코드 또는 None)
+_memo = {}
+MEMO_LIMIT = 200_000
+
+
+def _parse_uniques(texts, currency=None):
+    """고유 가격 문자열들을 한 번에 파싱해 (금액 배열, 통화 배열)을 반환합니다."""
+    texts = pd.Series(texts, dtype="string")
+    compact = texts.str.replace(_SPACE_PATTERN, "", regex=True)
+    number = compact.str.extract(r"(\d(?:[\d.,]*\d)?)", expand=False)
+    symbol = compact.str.extract(f"({_SYMBOL_PATTERN})", expand=False)
+
+    codes = symbol.map(lambda found: found if found in CURRENCY_CODES else SYMBOLS.get(found),
+                       na_action="ignore")
+    if currency is not None:
+        ambiguous = symbol.isin(AMBIGUOUS_SYMBOLS).fillna(False).astype(bool)
+        codes = codes.mask(ambiguous | symbol.isna(), currency)
+
+    # 구분자 위치로 소수 자릿수를 정합니다.
+    last_dot = number.str.rfind(".").fillna(-1).to_numpy(dtype=np.int64)
+    last_comma = number.str.rfind(",").fillna(-1).to_numpy(dtype=np.int64)
+    dots = number.str.count(r"\.").fillna(0).to_numpy(dtype=np.int64)
+    commas = number.str.count(",").fillna(0).to_numpy(dtype=np.int64)
+    length = number.str.len().fillna(0).to_numpy(dtype=np.int64)
+
+    last = np.maximum(last_dot, last_comma)
+    after = length - last - 1
+    both = (last_dot >= 0) & (last_comma >= 0)
+    once = np.where(last_dot > last_comma, dots, commas) == 1
+    decimals = np.where((last >= 0) & once & (both | (after <= 2)), after, 0)
+
+    digits = pd.to_numeric(number.str.replace(r"[.,]", "", regex=True), errors="coerce")
+    digits = digits.to_numpy(dtype=np.float64, na_value=np.nan)
+    exponent = np.where(codes.isin(ZERO_DECIMAL_CURRENCIES).fillna(False).to_numpy(dtype=bool), 0, 2)
+    amounts = np.round(digits * np.power(10.0, exponent - decimals))
+
+    free = texts.str.contains(FREE_PATTERN, case=False, regex=True).fillna(False).to_numpy(dtype=bool)
+    amounts[free & np.isnan(digits)] = 0.0
+    return amounts, codes.astype(object).where(codes.notna(), None).to_numpy()
+
+
+def normalize_prices(prices, currency=None):
+    """
+    가격 문자열 열을 (amount_minor, currency) 두 열의 DataFrame으로 바꿉니다.
+
+    Parameters:
+    -----------
+    prices : Series or list
+        가격 문자열 (결측값 포함 가능)
+    currency : str
+        통화 기호가 없거나 여러 나라가 쓰는 기호('$', '¥', 'kr')일 때 쓸 통화 코드
+        (지역 가격이면 REGION_CURRENCIES[국가 코드])
+
+    Returns:
+    --------
+    DataFrame: amount_minor(Int64, 최소 단위 금액)와 currency(category) 열.
+    prices가 Series이면 같은 index를 씁니다.
+    """
+    index = prices.index if isinstance(prices, pd.Series) else None
+    codes, uniques = pd.factorize(pd.Series(prices, dtype=object), use_na_sentinel=True)
+
+    amounts = np.full(len(uniques) + 1, np.nan)
+    currencies = np.full(len(uniques) + 1, None, dtype=object)
+    missing = []
+    for i, text in enumerate(uniques):
+        found = _memo.get((text, currency))
+        if found is None:
+            missing.append(i)
+        else:
+            amounts[i], currencies[i] = found
+
+    if missing:
+        parsed_amounts, parsed_currencies = _parse_uniques(uniques[missing], currency)
+        amounts[missing] = parsed_amounts
+        currencies[missing] = parsed_currencies
+        if len(_memo) + len(missing) > MEMO_LIMIT:
+            _memo.clear()
+        _memo.update(((uniques[i], currency), (amount, code))
+                     for i, amount, code in zip(missing, parsed_amounts, parsed_currencies))
+
+    # 코드 -1(결측값)은 마지막 원소(NaN, None)를 가리킵니다.
+    currency_codes, categories = pd.factorize(currencies, use_na_sentinel=True)
+    return pd.DataFrame({
+        "amount_minor": pd.array(amounts[codes], dtype="Int64"),
+        "currency": pd.Categorical.from_codes(currency_codes[codes], categories),
+    }, index=index)
+
+
+def to_major(normalized):
+    """normalize_prices 결과를 통화의 기본 단위 금액(float, 예: 19.99)으로 바꿉니다."""
+    zero_decimal = normalized["currency"].isin(ZERO_DECIMAL_CURRENCIES).to_numpy(dtype=bool)
+    amounts = normalized["amount_minor"].to_numpy(dtype=np.float64, na_value=np.nan)
+    return pd.Series(np.where(zero_decimal, amounts, amounts / 100), index=normalized.index)
+
+
+def parse_price(text, currency=None):
+    """가격 문자열 하나를 (최소 단위 금액 또는 None, 통화 코드 또는 None)으로 바꿉니다."""
+    if text is None or (not isinstance(text, str) and pd.isna(text)):
+        return None, None
+    found = _memo.get((text, currency))
+    if found is None:
+        amounts, codes = _parse_uniques([text], currency)
+        found = _memo[(text, currency)] = (amounts[0], codes[0])
+    amount, code = found
+    return (None if np.isnan(amount) else int(amount)), code
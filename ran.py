@@ -1,24 +1,20 @@
-import requests
-from bs4 import BeautifulSoup
+import html_backend
+import http_client
+from row_extract import Field, RowSpec
 
-url = "https://store.steampowered.com/search/?filter=topsellers"
-headers = {
-    "User-Agent": "Mozilla/5.0"
-}
-response = requests.get(url, headers=headers)
-soup = BeautifulSoup(response.text, "html.parser")
-
-games = soup.select(".search_result_row")
+# 검색 결과 한 행에서 제목과 가격을 뽑는 규칙
+SEARCH_PRICE_SPEC = RowSpec(".search_result_row", [
+    Field("title", ".title"),
+    Field("price", ".search_price", mode="joined", default="정보 없음"),
+])
 
-for i, game in enumerate(games[:10], 1):
-    title = game.select_one(".title").text.strip()
+url = "https://store.steampowered.com/search/?filter=topsellers"
+response = http_client.get(url)
+parser = html_backend.get_backend()
+games = SEARCH_PRICE_SPEC.extract_all(parser.parse(response.text), parser, limit=10)
 
-    price_tag = game.select_one(".search_price")
-    if price_tag:
-        price = price_tag.get_text(separator=" ", strip=True)
-        if not price:
-            price = "무료"
-    else:
-        price = "정보 없음"
+for i, game in enumerate(games, 1):
+    # 가격 칸은 있는데 비어 있으면 무료 게임입니다.
+    price = game["price"] or "무료"
 
-    print(f"{i}. {title} - 가격: {price}")
+    print(f"{i}. {game['title']} - 가격: {price}")
@@ -1,48 +1,25 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-import time
-
-# Chrome 드라이버 옵션 설정
-options = Options()
-options.add_argument('--headless')  # 브라우저 창을 띄우지 않음
-options.add_argument('--no-sandbox')
-options.add_argument('--disable-dev-shm-usage')
-
-# Chrome 드라이버 경로 설정 (자신의 환경에 맞게 수정)
-driver_path = 'C:/chromedriver.exe'  # 예: 'C:/chromedriver.exe' 또는 '/usr/local/bin/chromedriver'
-
-# Service 객체 생성
-service = Service(executable_path=driver_path)
-
-# Chrome 드라이버 실행
-driver = webdriver.Chrome(service=service, options=options)
+import html_backend
+import renderer
+from row_extract import Field, RowSpec
+
+# 순위 항목 하나에서 순위/앱 이름/회사를 뽑는 규칙
+# (실제 클래스명은 페이지 구조에 따라 다를 수 있음)
+RANKING_ITEM_SPEC = RowSpec('.ranking-item', [
+    Field('rank', '.rank-number', mode='strip'),
+    Field('app_name', '.app-name', mode='strip'),
+    Field('company', '.company-name', mode='strip'),
+])
 
 # 모바일인덱스 실시간 게임 순위 페이지 접속
+# 순위 목록은 자바스크립트로 그려지므로 정적 HTML에 없으면 헤드리스 브라우저로 렌더링합니다.
+# 고정 대기 대신 순위 항목이 나타날 때까지 기다립니다.
 url = 'https://www.mobileindex.com/mi-chart/realtime-rank'
-driver.get(url)
-
-# 페이지 로딩 대기
-time.sleep(10)  # 필요에 따라 조정
-
-# 순위 데이터 추출
-ranks = []
-try:
-    # 순위 항목들을 포함하는 요소 찾기
-    rank_elements = driver.find_elements(By.CSS_SELECTOR, '.ranking-item')  # 실제 클래스명은 페이지 구조에 따라 다를 수 있음
+html = renderer.get_renderer().render(url, '.ranking-item', timeout=20)
 
-    for elem in rank_elements[:100]:  # 상위 100개 항목만 추출
-        rank = elem.find_element(By.CSS_SELECTOR, '.rank-number').text
-        app_name = elem.find_element(By.CSS_SELECTOR, '.app-name').text
-        company = elem.find_element(By.CSS_SELECTOR, '.company-name').text
-        ranks.append({
-            'rank': rank,
-            'app_name': app_name,
-            'company': company
-        })
-finally:
-    driver.quit()
+# 순위 데이터 추출 (상위 100개 항목만)
+parser = html_backend.get_backend()
+ranks = RANKING_ITEM_SPEC.extract_all(parser.parse(html), parser, limit=100)
 
 # 결과 출력
 for item in ranks:
-    print(f"{item['rank']}위: {item['app_name']} ({item['company']})")
\ No newline at end of file
+    print(f"{item['rank']}위: {item['app_name']} ({item['company']})")
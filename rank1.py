@@ -1,42 +1,24 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-import time
-
-# Chrome 드라이버 설정
-options = Options()
-options.add_argument("--headless=new")  # 최신 headless 모드
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
-options.add_argument("--disable-gpu")
-options.add_argument("--remote-debugging-port=9222")
-
-# ChromeDriver 자동 설치
-service = Service(ChromeDriverManager().install())
-
-driver = webdriver.Chrome(service=service, options=options)
-
-driver.get("https://store.steampowered.com/search/?filter=topsellers")
-time.sleep(3)
-
-html = driver.page_source
-soup = BeautifulSoup(html, "html.parser")
-
-games = soup.select(".search_result_row")
-
-for i, game in enumerate(games[:10], 1):
-    title = game.select_one(".title").text.strip()
-    price_tag = game.select_one(".search_price")
-    
-    if price_tag:
-        price = price_tag.get_text(separator=" ", strip=True)
-        if not price:
-            price = "무료"
-    else:
-        price = "정보 없음"
-
-    print(f"{i}. {title} - 가격: {price}")
-
-driver.quit()
+import html_backend
+import renderer
+from row_extract import Field, RowSpec
+
+# 검색 결과 한 행에서 제목과 가격을 뽑는 규칙
+SEARCH_PRICE_SPEC = RowSpec(".search_result_row", [
+    Field("title", ".title"),
+    Field("price", ".search_price", mode="joined", default="정보 없음"),
+])
+
+# 정적 HTML에 검색 결과가 있으면 브라우저 없이 바로 파싱하고,
+# 없을 때만 헤드리스 브라우저로 렌더링합니다. (고정 대기 대신 선택자가 나타날 때까지 대기)
+html = renderer.get_renderer().render(
+    "https://store.steampowered.com/search/?filter=topsellers",
+    ".search_result_row",
+)
+parser = html_backend.get_backend()
+games = SEARCH_PRICE_SPEC.extract_all(parser.parse(html), parser, limit=10)
+
+for i, game in enumerate(games, 1):
+    # 가격 칸은 있는데 비어 있으면 무료 게임입니다.
+    price = game["price"] or "무료"
+
+    print(f"{i}. {game['title']} - 가격: {price}")
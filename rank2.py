@@ -1,36 +1,24 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+import html_backend
+import renderer
+from row_extract import Field, RowSpec
 
-# 크롬 옵션 설정
-options = Options()
-options.add_argument("--headless")  # 브라우저 창 안 띄움
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
-
-# 드라이버 설정
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+# 통계 테이블 한 행에서 현재/오늘 최고 플레이어 수와 게임 이름을 뽑는 규칙
+# (머리글 행에는 td가 없으므로 건너뜁니다)
+DETAIL_STATS_SPEC = RowSpec('#detailStats tr', [
+    Field('current_players', 'td:nth-of-type(1)', mode='strip'),
+    Field('peak_today', 'td:nth-of-type(2)', mode='strip'),
+    Field('name', 'td:nth-of-type(4)', mode='strip'),
+], required=('name',))
 
 # 스팀 통계 페이지 열기
-driver.get("https://store.steampowered.com/stats/")
-time.sleep(3)  # 페이지 로딩 대기
-
-# HTML 가져오기
-soup = BeautifulSoup(driver.page_source, 'html.parser')
-driver.quit()
+# 통계 테이블이 정적 HTML에 없을 때만 브라우저로 렌더링합니다.
+html = renderer.get_renderer().render("https://store.steampowered.com/stats/", "#detailStats")
 
 # 테이블 파싱
-table = soup.find('table', {'id': 'detailStats'})
-rows = table.find_all('tr')[1:11]
+parser = html_backend.get_backend()
+rows = DETAIL_STATS_SPEC.extract_all(parser.parse(html), parser, limit=10)
 
 print("Steam 인기 게임 순위 (Most Played - Top 10):\n")
 
 for i, row in enumerate(rows, 1):
-    cols = row.find_all('td')
-    current_players = cols[0].get_text(strip=True)
-    peak_today = cols[1].get_text(strip=True)
-    name = cols[3].get_text(strip=True)
-    print(f"{i}. {name} - 현재 플레이어 수: {current_players}, 오늘 최고: {peak_today}")
+    print(f"{i}. {row['name']} - 현재 플레이어 수: {row['current_players']}, 오늘 최고: {row['peak_today']}")
@@ -1,21 +1,108 @@
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import re
-import os
-from datetime import datetime
-import time
+from datetime import datetime, timezone
+import asyncio
+
+import http_client
+import html_backend
+import metrics
+from rate_limit import TokenBucket, run_jobs
+from row_extract import Field, RowSpec
+from search_stream import iter_row_html
+
+# 분석 클래스는 pandas를 불러오므로 steam_analyzer에 두고, 처음 접근할 때 가져옵니다.
+_ANALYZER_EXPORTS = ("SteamDataAnalyzer", "REVIEW_SCORE_MAP")
+
+
+def __getattr__(name):
+    if name in _ANALYZER_EXPORTS:
+        import steam_analyzer
+        return getattr(steam_analyzer, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# search/results/ 엔드포인트에 한 번에 요청할 행 수 (스토어는 요청당 최대 100개까지 돌려줍니다)
+BULK_BATCH_SIZE = 100
+
+
+def _finalize_search_row(row):
+    """검색 결과 행에서 뽑은 값들로 가격/할인/리뷰 정보를 정리합니다."""
+    game_data = {
+        "rank": 0,  # 나중에 설정
+        "title": row["title"],
+        "price": "N/A",
+        "original_price": "N/A",
+        "discount": 0,
+        "release_date": row["release_date"],
+        "tags": row["tags"],
+        "review_score": "N/A",
+        "review_count": 0,
+        "review_positive_pct": None,
+        "app_id": row["app_id"],
+        "url": row["url"],
+        "image_url": row["image_url"],
+    }
+    
+    # 할인 가격이 있는 경우
+    if row["discount_pct"] is not None:
+        game_data["discount"] = row["discount_pct"]
+        if row["discount_original_price"] is not None:
+            game_data["original_price"] = row["discount_original_price"]
+        if row["discount_final_price"] is not None:
+            game_data["price"] = row["discount_final_price"]
+    elif row["search_price"] is not None or row["discount_final_price"] is not None:
+        # 일반 가격 (지금 검색 결과는 할인이 없어도 가격을 discount_final_price에 넣습니다)
+        price_text = row["search_price"] if row["search_price"] is not None else row["discount_final_price"]
+        game_data["price"] = price_text
+        if "Free" not in price_text and price_text != "":
+            game_data["original_price"] = price_text
+    
+    tooltip = row["review_tooltip"]
+    if tooltip:
+        # 리뷰 점수
+        score_match = re.search(r"([^<]+)<br>", tooltip)
+        if score_match:
+            game_data["review_score"] = score_match.group(1).strip()
+        
+        # 긍정 비율과 리뷰 수 ("86% of the 39,010 user reviews for this game are positive.")
+        # 첫 숫자는 비율이므로 비율을 뺀 나머지에서 리뷰 수를 찾습니다.
+        pct_match = re.search(r"(\d+)%", tooltip)
+        if pct_match:
+            game_data["review_positive_pct"] = int(pct_match.group(1))
+            tooltip = tooltip[:pct_match.start()] + tooltip[pct_match.end():]
+        count_match = re.search(r"(\d+(?:,\d+)*)", tooltip)
+        if count_match:
+            game_data["review_count"] = int(count_match.group(1).replace(',', ''))
+    
+    return game_data
+
+
+# 검색 결과 한 행(<a>)에서 게임 정보를 뽑는 규칙
+SEARCH_ROW_SPEC = RowSpec("#search_resultsRows > a", [
+    Field("url", attr="href"),
+    Field("app_id", attr="href", pattern=r"/app/(\d+)/", default="N/A"),
+    Field("title", ".title", default="N/A"),
+    Field("image_url", "img", attr="src", default="N/A"),
+    Field("discount_pct", ".discount_pct", convert=lambda text: int(re.sub(r'[^\d]', '', text))),
+    Field("discount_original_price", ".discount_original_price"),
+    Field("discount_final_price", ".discount_final_price"),
+    Field("search_price", ".search_price"),
+    Field("release_date", ".search_released", default="N/A"),
+    Field("tags", ".search_tag", many=True),
+    Field("review_tooltip", ".search_review_summary", attr="data-tooltip-html"),
+], finalize=_finalize_search_row)
+
 
 class SteamGameScraper:
-    def __init__(self):
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
+    def __init__(self, parser="auto", region="US"):
         self.base_url = "https://store.steampowered.com"
+        # HTML 파서 백엔드 ('auto', 'lxml', 'selectolax', 'html.parser')
+        # 백엔드와 행 추출 규칙은 프로세스에서 하나씩 만들어 모든 스크래퍼가 함께 씁니다.
+        self.parser = html_backend.get_backend(parser)
+        # 스토어 국가 코드 (가격 통화와 순위가 이 지역 기준이 됩니다)
+        self.region = region
         
-    def get_top_games(self, page_count=1, category="topsellers"):
+    def get_top_games(self, page_count=1, category="topsellers", async_mode=False,
+                      max_concurrency=4, rate=1.0):
         """
         스팀에서 인기 게임 목록을 가져옵니다.
         
@@ -25,294 +112,314 @@ class SteamGameScraper:
             가져올 페이지 수 (기본값: 1)
         category : str
             카테고리 ('topsellers', 'specials', 'popularnew', 'free')
+        async_mode : bool
+            True이면 asyncio로 여러 페이지를 동시에 가져옵니다 (기본값: False)
+        max_concurrency : int
+            비동기 모드에서 동시에 진행할 최대 요청 수 (기본값: 4)
+        rate : float
+            비동기 모드에서 초당 허용할 요청 수 (기본값: 1.0)
         
         Returns:
         --------
         list: 게임 정보 리스트
         """
+        if async_mode:
+            return asyncio.run(
+                self._get_top_games_async(page_count, category, max_concurrency, rate)
+            )
+        
         all_games = []
         
         for page in range(page_count):
-            url = f"{self.base_url}/search/"
-            params = {
-                "filter": category,
-                "page": page + 1,
-                "cc": "US"  # 통화를 달러로 설정
-            }
-            
-            if category == "free":
-                params["maxprice"] = "free"
-                params["filter"] = "topsellers"
-            
             print(f"페이지 {page + 1} 수집 중...")
             
             try:
-                response = requests.get(url, headers=self.headers, params=params)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, "html.parser")
-                games = self._parse_games(soup)
-                all_games.extend(games)
-                
-                # 요청 간 딜레이 (서버 부하 방지)
-                time.sleep(1)
+                # 요청 간격과 재시도는 http_client의 호스트별 스케줄러가 조절합니다.
+                all_games.extend(self._fetch_page_games(page, category))
                 
             except Exception as e:
                 print(f"페이지 {page + 1} 수집 실패: {e}")
                 
         return all_games
     
-    def _parse_games(self, soup):
-        """HTML에서 게임 정보를 파싱합니다."""
-        games = []
-        game_elements = soup.select("#search_resultsRows > a")
-        
-        for game_element in game_elements:
-            game_data = self._extract_game_info(game_element)
-            if game_data:
-                games.append(game_data)
-                
-        return games
+    async def _get_top_games_async(self, page_count, category, max_concurrency, rate):
+        """여러 페이지를 동시에 가져오되, 결과는 페이지 순서대로 합칩니다."""
+        jobs = [
+            (f"페이지 {page + 1}", lambda page=page: self._fetch_page_games(page, category))
+            for page in range(page_count)
+        ]
+        return await self._gather_in_order(jobs, max_concurrency, rate)
     
-    def _extract_game_info(self, game_element):
-        """개별 게임 요소에서 정보를 추출합니다."""
-        try:
-            game_data = {
-                "rank": 0,  # 나중에 설정
-                "title": "N/A",
-                "price": "N/A",
-                "original_price": "N/A",
-                "discount": 0,
-                "release_date": "N/A",
-                "tags": [],
-                "review_score": "N/A",
-                "review_count": 0,
-                "app_id": "N/A",
-                "url": "N/A",
-                "image_url": "N/A"
-            }
-            
-            # 게임 URL 및 앱 ID
-            game_url = game_element.get("href", "")
-            game_data["url"] = game_url
-            
-            app_id_match = re.search(r"/app/(\d+)/", game_url)
-            if app_id_match:
-                game_data["app_id"] = app_id_match.group(1)
-            
-            # 게임 제목
-            title_element = game_element.select_one(".title")
-            if title_element:
-                game_data["title"] = title_element.text.strip()
-            
-            # 게임 이미지 URL
-            img_element = game_element.select_one("img")
-            if img_element:
-                game_data["image_url"] = img_element.get("src", "")
-            
-            # 가격 정보
-            self._extract_price_info(game_element, game_data)
-            
-            # 출시일
-            release_element = game_element.select_one(".search_released")
-            if release_element:
-                game_data["release_date"] = release_element.text.strip()
-            
-            # 태그
-            tag_elements = game_element.select(".search_tag")
-            if tag_elements:
-                game_data["tags"] = [tag.text.strip() for tag in tag_elements]
-            
-            # 리뷰 정보
-            self._extract_review_info(game_element, game_data)
-            
-            return game_data
-            
-        except Exception as e:
-            print(f"게임 정보 추출 실패: {e}")
-            return None
+    async def _gather_in_order(self, jobs, max_concurrency, rate):
+        """(이름, 함수) 작업들을 동시에 실행하고 결과 리스트를 작업 순서대로 합칩니다."""
+        all_games = []
+        for games in await self._run_jobs(jobs, max_concurrency, rate):
+            all_games.extend(games)
+        return all_games
     
-    def _extract_price_info(self, game_element, game_data):
-        """가격 정보를 추출합니다."""
-        # 할인 가격이 있는 경우
-        discount_element = game_element.select_one(".discount_pct")
-        if discount_element:
-            discount_text = discount_element.text.strip()
-            game_data["discount"] = int(re.sub(r'[^\d]', '', discount_text))
-            
-            original_price_element = game_element.select_one(".discount_original_price")
-            if original_price_element:
-                game_data["original_price"] = original_price_element.text.strip()
-                
-            discount_price_element = game_element.select_one(".discount_final_price")
-            if discount_price_element:
-                game_data["price"] = discount_price_element.text.strip()
-        else:
-            # 일반 가격
-            price_element = game_element.select_one(".search_price")
-            if price_element:
-                price_text = price_element.text.strip()
-                game_data["price"] = price_text
-                if "Free" not in price_text and price_text != "":
-                    game_data["original_price"] = price_text
-    
-    def _extract_review_info(self, game_element, game_data):
-        """리뷰 정보를 추출합니다."""
-        review_element = game_element.select_one(".search_review_summary")
-        if review_element and review_element.get("data-tooltip-html"):
-            tooltip = review_element["data-tooltip-html"]
-            
-            # 리뷰 점수
-            score_match = re.search(r"([^<]+)<br>", tooltip)
-            if score_match:
-                game_data["review_score"] = score_match.group(1).strip()
-            
-            # 리뷰 수
-            count_match = re.search(r"(\d+(?:,\d+)*)", tooltip)
-            if count_match:
-                count_str = count_match.group(1).replace(',', '')
-                game_data["review_count"] = int(count_str)
+    async def _run_jobs(self, jobs, max_concurrency, rate=1.0, bucket=None):
+        """
+        (이름, 함수) 작업들을 동시에 실행하고 작업별 결과를 작업 순서대로 반환합니다.
 
-class SteamDataAnalyzer:
-    def __init__(self, games_data):
-        self.df = pd.DataFrame(games_data)
-        self._preprocess_data()
-    
-    def _preprocess_data(self):
-        """데이터 전처리를 수행합니다."""
-        # 랭킹 설정
-        self.df['rank'] = range(1, len(self.df) + 1)
+        bucket을 주면 rate 대신 그 버킷의 요청 속도 한도를 함께 씁니다.
+        """
+        return await run_jobs(jobs, max_concurrency, bucket or TokenBucket(rate=rate),
+                              default=[], progress=True)
+    
+    def get_top_games_bulk(self, total=1000, category="topsellers", batch_size=BULK_BATCH_SIZE,
+                           max_concurrency=4, rate=1.0):
+        """
+        무한 스크롤용 검색 결과 엔드포인트로 많은 게임을 한꺼번에 가져옵니다.
         
-        # 가격 정보 정리
-        self.df['price_numeric'] = self.df['price'].apply(self._clean_price)
-        self.df['original_price_numeric'] = self.df['original_price'].apply(self._clean_price)
+        `search/results/`에 start/count를 지정하면 JSON의 `results_html`로
+        여러 행을 한 번에 받을 수 있어, 25개씩 페이지를 넘기는 것보다 요청 수가 적습니다.
         
-        # 리뷰 점수 수치화
-        review_score_map = {
-            'Overwhelmingly Positive': 10, 'Very Positive': 8, 'Positive': 7,
-            'Mostly Positive': 6, 'Mixed': 5, 'Mostly Negative': 4,
-            'Negative': 3, 'Very Negative': 2, 'Overwhelmingly Negative': 1
-        }
-        self.df['review_score_numeric'] = self.df['review_score'].map(
-            lambda x: review_score_map.get(x, 0)
-        )
-    
-    def _clean_price(self, price_str):
-        """가격 문자열을 숫자로 변환합니다."""
-        if pd.isna(price_str) or price_str in ["N/A", "Free to Play"] or "Free" in str(price_str):
-            return 0
+        Parameters:
+        -----------
+        total : int
+            가져올 최대 게임 수 (기본값: 1000)
+        category : str
+            카테고리 ('topsellers', 'specials', 'popularnew', 'free')
+        batch_size : int
+            요청 한 번에 받을 행 수 (기본값: BULK_BATCH_SIZE)
+        max_concurrency : int
+            동시에 진행할 최대 요청 수 (기본값: 4)
+        rate : float
+            초당 허용할 요청 수 (기본값: 1.0)
         
-        price_match = re.search(r'[\d,.]+', str(price_str))
-        if price_match:
-            return float(price_match.group().replace(',', ''))
-        return 0
-    
-    def get_top_games(self, n=10, sort_by='rank'):
-        """상위 N개 게임을 반환합니다."""
-        if sort_by == 'rank':
-            return self.df.head(n)
-        elif sort_by == 'review_score':
-            return self.df.sort_values(['review_score_numeric', 'review_count'], 
-                                     ascending=False).head(n)
-        elif sort_by == 'price':
-            return self.df.sort_values('price_numeric').head(n)
-    
-    def get_statistics(self):
-        """데이터 통계를 반환합니다."""
-        stats = {
-            "total_games": len(self.df),
-            "free_games": len(self.df[self.df['price_numeric'] == 0]),
-            "paid_games": len(self.df[self.df['price_numeric'] > 0]),
-            "games_on_sale": len(self.df[self.df['discount'] > 0]),
-            "avg_price": self.df['price_numeric'].mean(),
-            "avg_discount": self.df['discount'].mean(),
-            "avg_review_score": self.df['review_score_numeric'].mean(),
-            "most_common_tags": self._get_most_common_tags()
-        }
-        return stats
+        Returns:
+        --------
+        list: 게임 정보 리스트. rank는 구간의 시작 위치로 정하므로, 실패한 구간이 있으면
+        그 구간의 순위만 비고 뒤 구간의 순위는 밀리지 않습니다.
+        """
+        # 첫 요청으로 전체 결과 수를 확인한 뒤 나머지 구간을 동시에 요청합니다.
+        print(f"0 - {min(batch_size, total)}번째 게임 수집 중...")
+        first_games, total_count = self._fetch_bulk_games(0, min(batch_size, total), category)
+        if total_count is not None:
+            total = min(total, total_count)
+        
+        starts = list(range(batch_size, total, batch_size))
+        jobs = []
+        for start in starts:
+            count = min(batch_size, total - start)
+            jobs.append((
+                f"{start} - {start + count}번째 게임",
+                lambda start=start, count=count: self._fetch_bulk_games(start, count, category)[0],
+            ))
+        
+        rest = asyncio.run(self._run_jobs(jobs, max_concurrency, rate)) if jobs else []
+        all_games = []
+        for start, games in zip([0, *starts], [first_games, *rest]):
+            for rank, game in enumerate(games, start + 1):
+                game["rank"] = rank
+            all_games.extend(games)
+        return [game for game in all_games if game["rank"] <= total]
+    
+    def _fetch_bulk_games(self, start, count, category, records=None):
+        """검색 결과 JSON 한 구간을 가져와 (게임 정보 리스트, 전체 결과 수)를 반환합니다."""
+        url = f"{self.base_url}/search/results/"
+        params = self._build_search_params(0, category)
+        del params["page"]
+        params.update({"start": start, "count": count, "infinite": 1})
+        
+        response = http_client.get(url, params=params, language="en")
+        response.raise_for_status()
+        data = response.json()
+        
+        # results_html에는 행(<a>)만 들어 있으므로 검색 페이지와 같은 구조로 감싸서 파싱합니다.
+        results_html = data.get("results_html", "")
+        with metrics.span("parse") as span:
+            document = self.parser.parse(f'<div id="search_resultsRows">{results_html}</div>')
+            span.add(bytes=len(results_html))
+        total_count = data.get("total_count")
+        games = self._parse_games(document, records)
+        return games, int(total_count) if total_count is not None else None
     
-    def _get_most_common_tags(self):
-        """가장 흔한 태그들을 반환합니다."""
-        all_tags = []
-        for tags_list in self.df['tags']:
-            all_tags.extend(tags_list)
+    def _build_search_params(self, page, category):
+        """검색 페이지 요청 파라미터를 만듭니다."""
+        params = {
+            "filter": category,
+            "page": page + 1,
+            "cc": self.region
+        }
         
-        if all_tags:
-            tag_counts = pd.Series(all_tags).value_counts()
-            return tag_counts.head(5).to_dict()
-        return {}
-    
-    def save_data(self, filename="steam_games_ranking.csv", output_dir="./output"):
-        """데이터를 CSV 파일로 저장합니다."""
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        if category == "free":
+            params["maxprice"] = "free"
+            params["filter"] = "topsellers"
         
-        filepath = os.path.join(output_dir, filename)
-        self.df.to_csv(filepath, index=False, encoding='utf-8-sig')
-        print(f"데이터가 {filepath}에 저장되었습니다.")
-        return filepath
-    
-    def create_visualizations(self, output_dir="./output"):
-        """데이터 시각화를 생성합니다."""
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        return params
+    
+    def _fetch_page_games(self, page, category, records=None):
+        """검색 결과 한 페이지를 가져와 게임 정보 리스트로 변환합니다."""
+        url = f"{self.base_url}/search/"
+        params = self._build_search_params(page, category)
         
-        plt.style.use('default')
+        response = http_client.get(url, params=params, language="en")
+        response.raise_for_status()
         
-        # 1. 상위 10개 게임 랭킹
-        fig, ax = plt.subplots(figsize=(12, 8))
-        top_10 = self.get_top_games(10)
-        bars = ax.barh(range(len(top_10)), top_10['rank'], color='steelblue')
-        ax.set_yticks(range(len(top_10)))
-        ax.set_yticklabels(top_10['title'], fontsize=10)
-        ax.set_xlabel('랭킹')
-        ax.set_title('스팀 인기 게임 TOP 10', fontsize=14, fontweight='bold')
-        ax.invert_yaxis()
+        with metrics.span("parse") as span:
+            document = self.parser.parse(response.text)
+            span.add(bytes=len(response.content))
+        return self._parse_games(document, records)
+    
+    def iter_top_games(self, page_count=1, category="topsellers", chunk_size=16 * 1024):
+        """
+        인기 게임 목록을 응답이 도착하는 대로 한 개씩 내보냅니다.
         
-        # 순위 표시
-        for i, bar in enumerate(bars):
-            width = bar.get_width()
-            ax.text(width + 0.1, bar.get_y() + bar.get_height()/2, 
-                   f'#{int(width)}', ha='left', va='center')
+        페이지 전체를 DOM으로 만들지 않고 `#search_resultsRows`의 행을 하나씩 잘라
+        파싱하므로, 첫 게임이 빨리 나오고 페이지 수와 관계없이 메모리가 일정합니다.
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, 'top_10_games.png'), dpi=300, bbox_inches='tight')
-        plt.close()
+        Parameters:
+        -----------
+        page_count : int
+            가져올 페이지 수 (기본값: 1)
+        category : str
+            카테고리 ('topsellers', 'specials', 'popularnew', 'free')
+        chunk_size : int
+            한 번에 읽을 응답 크기 (바이트)
         
-        # 2. 가격 분포
-        fig, ax = plt.subplots(figsize=(10, 6))
-        paid_games = self.df[self.df['price_numeric'] > 0]
-        if len(paid_games) > 0:
-            ax.hist(paid_games['price_numeric'], bins=20, alpha=0.7, color='lightcoral')
-            ax.set_xlabel('가격 ($)')
-            ax.set_ylabel('게임 수')
-            ax.set_title('유료 게임 가격 분포')
-        plt.savefig(os.path.join(output_dir, 'price_distribution.png'), dpi=300, bbox_inches='tight')
-        plt.close()
+        Yields:
+        -------
+        dict: 게임 정보 (rank가 채워진 상태)
+        """
+        rank = 0
+        url = f"{self.base_url}/search/"
         
-        # 3. 할인율 분포
-        fig, ax = plt.subplots(figsize=(10, 6))
-        games_on_sale = self.df[self.df['discount'] > 0]
-        if len(games_on_sale) > 0:
-            ax.hist(games_on_sale['discount'], bins=15, alpha=0.7, color='lightgreen')
-            ax.set_xlabel('할인율 (%)')
-            ax.set_ylabel('게임 수')
-            ax.set_title('할인 중인 게임의 할인율 분포')
-        plt.savefig(os.path.join(output_dir, 'discount_distribution.png'), dpi=300, bbox_inches='tight')
-        plt.close()
+        for page in range(page_count):
+            print(f"페이지 {page + 1} 수집 중...")
+            params = self._build_search_params(page, category)
+            
+            try:
+                with http_client.get(url, params=params, language="en", stream=True) as response:
+                    response.raise_for_status()
+                    if response.encoding is None:
+                        response.encoding = "utf-8"
+                    
+                    chunks = response.iter_content(chunk_size=chunk_size, decode_unicode=True)
+                    for row_html in iter_row_html(chunks):
+                        with metrics.span("parse") as span:
+                            row = self.parser.select_one(self.parser.parse(row_html), "a")
+                            span.add(bytes=len(row_html))
+                        if row is None:
+                            continue
+                        with metrics.span("extract") as span:
+                            game_data = self._extract_game_info(row)
+                            span.add(rows=1 if game_data else 0)
+                        if game_data:
+                            rank += 1
+                            game_data["rank"] = rank
+                            yield game_data
+                
+            except Exception as e:
+                print(f"페이지 {page + 1} 수집 실패: {e}")
+    
+    def _parse_games(self, document, records=None):
+        """
+        파싱된 HTML 문서에서 게임 정보를 추출합니다.
         
-        # 4. 리뷰 점수 분포
-        fig, ax = plt.subplots(figsize=(10, 6))
-        review_games = self.df[self.df['review_score_numeric'] > 0]
-        if len(review_games) > 0:
-            ax.hist(review_games['review_score_numeric'], bins=10, alpha=0.7, color='gold')
-            ax.set_xlabel('리뷰 점수')
-            ax.set_ylabel('게임 수')
-            ax.set_title('게임 리뷰 점수 분포')
-        plt.savefig(os.path.join(output_dir, 'review_score_distribution.png'), dpi=300, bbox_inches='tight')
-        plt.close()
+        records(app_id → 게임 정보 dict)를 넘기면 이미 추출한 app_id의 행은 다시 추출하지 않고
+        기존 dict를 그대로 넣으며, 새로 추출한 게임은 records에 추가합니다.
+        """
+        with metrics.span("extract") as span:
+            games = self._collect_games(document, records)
+            span.add(rows=len(games))
+        return games
+    
+    def _collect_games(self, document, records):
+        """_parse_games의 실제 추출 부분입니다."""
+        games = []
+        game_elements = SEARCH_ROW_SPEC.rows(document, self.parser)
         
-        print(f"시각화 파일들이 {output_dir}에 저장되었습니다.")
+        for game_element in game_elements:
+            app_id = None
+            if records is not None:
+                app_id_match = re.search(r"/app/(\d+)/", self.parser.attr(game_element, "href", ""))
+                app_id = app_id_match.group(1) if app_id_match else None
+                if app_id in records:
+                    games.append(records[app_id])
+                    continue
+            
+            game_data = self._extract_game_info(game_element)
+            if game_data:
+                if app_id is not None:
+                    # 다른 스레드가 먼저 넣었으면 그쪽 dict를 함께 씁니다.
+                    game_data = records.setdefault(app_id, game_data)
+                games.append(game_data)
+                
+        return games
+    
+    def _extract_game_info(self, game_element):
+        """개별 게임 요소에서 정보를 추출합니다."""
+        try:
+            return SEARCH_ROW_SPEC.extract(game_element, self.parser)
+        except Exception as e:
+            print(f"게임 정보 추출 실패: {e}")
+            return None
+
+
+def analyze_and_save(games_data, category, visualize=True, incremental=False, region="US"):
+    """
+    수집한 게임 데이터의 통계를 출력하고 스냅샷/이력/차트를 저장합니다.
+    
+    pandas와 matplotlib은 이 함수가 실행될 때 처음 불러옵니다.
+    
+    Parameters:
+    -----------
+    games_data : list
+        SteamGameScraper가 반환한 게임 정보 리스트
+    category : str
+        수집한 카테고리
+    visualize : bool
+        False이면 차트를 그리지 않습니다 (기본값: True)
+    incremental : bool
+        True이면 전체 스냅샷 대신 지난 상태와 달라진 행만 저장합니다 (기본값: False)
+    region : str
+        수집한 스토어 국가 코드. 랭킹 이력의 지역으로 기록합니다 (기본값: 'US')
+    
+    Returns:
+    --------
+    SteamDataAnalyzer: 분석에 사용한 객체
+    """
+    # 데이터 분석 (pandas는 이 단계에서 처음 불러옵니다)
+    from steam_analyzer import SteamDataAnalyzer
+    analyzer = SteamDataAnalyzer(games_data)
+    
+    # 통계 출력
+    stats = analyzer.get_statistics()
+    print("\n📈 수집 결과 통계:")
+    print(f"- 총 게임 수: {stats['total_games']}")
+    print(f"- 무료 게임: {stats['free_games']}")
+    print(f"- 유료 게임: {stats['paid_games']}")
+    print(f"- 할인 중인 게임: {stats['games_on_sale']}")
+    print(f"- 평균 가격: {stats['avg_price']:.2f} {stats['price_currency'] or ''}".rstrip())
+    if len(stats["avg_price_by_currency"]) > 1:
+        print("  (통화별 유료 게임 평균: " + ", ".join(
+            f"{amount:.2f} {code}" for code, amount in stats["avg_price_by_currency"].items()) + ")")
+    print(f"- 평균 할인율: {stats['avg_discount']:.1f}%")
+    print(f"- 평균 리뷰 점수: {stats['avg_review_score']:.1f}/10")
+    
+    # 상위 10개 게임 출력
+    print("\n🏆 인기 게임 TOP 10:")
+    top_10 = analyzer.get_top_games(10)
+    for idx, game in top_10.iterrows():
+        print(f"{game['rank']:2d}. {game['title'][:50]:<50} | {game['price']}")
+    
+    # 데이터 저장
+    print("\n💾 데이터 저장 중...")
+    captured_at = datetime.now(timezone.utc)
+    if incremental:
+        analyzer.save_delta(category, captured_at=captured_at)
+    else:
+        analyzer.save_snapshot(category, captured_at=captured_at)
+    analyzer.save_history(category, region=region, captured_at=captured_at)
+    
+    # 시각화 생성
+    if visualize:
+        print("📊 시각화 생성 중...")
+        analyzer.create_visualizations()
+    
+    return analyzer
+
 
 def main():
     """메인 실행 함수"""
@@ -349,7 +456,9 @@ def main():
     print(f"\n📊 '{category}' 카테고리에서 {page_count}페이지 수집 시작...")
     
     # 데이터 수집
-    games_data = scraper.get_top_games(page_count=page_count, category=category)
+    # 여러 페이지를 수집할 때는 비동기 모드로 동시에 가져옵니다.
+    games_data = scraper.get_top_games(page_count=page_count, category=category,
+                                       async_mode=page_count > 1)
     
     if not games_data:
         print("❌ 데이터를 수집할 수 없습니다.")
@@ -357,35 +466,8 @@ def main():
     
     print(f"✅ {len(games_data)}개 게임 정보 수집 완료!")
     
-    # 데이터 분석
-    analyzer = SteamDataAnalyzer(games_data)
-    
-    # 통계 출력
-    stats = analyzer.get_statistics()
-    print("\n📈 수집 결과 통계:")
-    print(f"- 총 게임 수: {stats['total_games']}")
-    print(f"- 무료 게임: {stats['free_games']}")
-    print(f"- 유료 게임: {stats['paid_games']}")
-    print(f"- 할인 중인 게임: {stats['games_on_sale']}")
-    print(f"- 평균 가격: ${stats['avg_price']:.2f}")
-    print(f"- 평균 할인율: {stats['avg_discount']:.1f}%")
-    print(f"- 평균 리뷰 점수: {stats['avg_review_score']:.1f}/10")
-    
-    # 상위 10개 게임 출력
-    print("\n🏆 인기 게임 TOP 10:")
-    top_10 = analyzer.get_top_games(10)
-    for idx, game in top_10.iterrows():
-        print(f"{game['rank']:2d}. {game['title'][:50]:<50} | {game['price']}")
-    
-    # 데이터 저장
-    print("\n💾 데이터 저장 중...")
-    current_time = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"steam_{category}_ranking_{current_time}.csv"
-    analyzer.save_data(filename=filename)
-    
-    # 시각화 생성
-    print("📊 시각화 생성 중...")
-    analyzer.create_visualizations()
+    analyze_and_save(games_data, category, region=scraper.region)
+    metrics.print_summary()
     
     print("\n🎉 작업 완료!")
     print("생성된 파일들을 './output' 폴더에서 확인하세요.")
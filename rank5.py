@@ -1,12 +1,21 @@
 import requests
-from bs4 import BeautifulSoup # HTML 파싱을 위한 라이브러리
+
+import html_backend  # HTML 파싱을 위한 모듈
+import http_client
+from row_extract import Field, RowSpec
+
+# 평가순 검색 결과의 한 행
+TOP_RATED_SPEC = RowSpec('#search_resultsRows > a', [
+    Field('title', '.title'),
+    Field('review_summary', '.search_review_summary', attr='data-tooltip-html'),
+])
 
 
 def get_top_sellers(count=10):
     """지정한 수만큼 스팀 최고 인기 게임 목록을 가져옵니다."""
     url = f"https://store.steampowered.com/api/featuredcategories/"
     try:
-        response = requests.get(url)
+        response = http_client.get(url, language="ko")
         response.raise_for_status()  # 오류 발생 시 예외 처리
         data = response.json()
         
@@ -29,7 +38,6 @@ def get_top_discounts(count=10):
     """할인율이 가장 높은 스팀 게임 목록을 가져옵니다."""
     # 검색 조건: 할인 중인 게임, Windows 지원, 출시된 제품
     url = f"https://store.steampowered.com/search/results/?query&sort_by=Price_ASC&specials=1&os=win&filter=topsellers&count={count}"
-    headers = {'Accept-Language': 'ko-KR,ko;q=0.9'} # 한글로 된 게임 제목을 보기 위함
 
     try:
         # 실제로는 HTML을 파싱해야 하지만, API가 있다면 아래와 같은 형태로 데이터를 가져올 수 있습니다.
@@ -62,25 +70,21 @@ def get_top_rated_games(count=10):
     """사용자 평점이 가장 높은 스팀 게임 목록을 가져옵니다."""
     # 검색 조건: 사용자 평가 순 정렬
     url = f"https://store.steampowered.com/search/?sort_by=Reviews_DESC&filter=topsellers&os=win&page=1"
-    headers = {'Accept-Language': 'ko-KR,ko;q=0.9'}
 
     try:
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, language="ko")  # 한글로 된 게임 제목을 보기 위함
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        parser = html_backend.get_backend()
         
-        games = soup.select('#search_resultsRows > a')
+        games = TOP_RATED_SPEC.extract_all(parser.parse(response.text), parser, limit=count)
         
         print(f"--- 스팀 게임 평점 TOP {count} ---")
-        for i, game_html in enumerate(games[:count]):
-            title = game_html.select_one('.title').text.strip()
-            
-            # 리뷰 요약 정보 추출
-            review_summary_span = game_html.select_one('.search_review_summary')
-            review_summary = review_summary_span['data-tooltip-html'].replace('<br>', ' | ') if review_summary_span else "평가 정보 없음"
+        for i, game in enumerate(games):
+            # 리뷰 요약 정보
+            review_summary = game['review_summary'].replace('<br>', ' | ') if game['review_summary'] is not None else "평가 정보 없음"
             
-            print(f"{i+1}. {title} ({review_summary})")
+            print(f"{i+1}. {game['title']} ({review_summary})")
 
     except requests.exceptions.RequestException as e:
         print(f"오류가 발생했습니다: {e}")
@@ -113,6 +117,7 @@ def main():
         elif choice == '5':
             get_top_rated_games(10)
         elif choice == '6':
+            http_client.print_connection_stats()
             print("프로그램을 종료합니다.")
             break
         else:
@@ -1,15 +1,19 @@
 import requests
-from bs4 import BeautifulSoup
-import time
+
+import html_backend
+import http_client
+from row_extract import Field, RowSpec
 
 # 웹사이트의 구조가 변경되면 아래 선택자(selector)도 변경해야 할 수 있습니다.
 # 스팀 상점 페이지는 자주 바뀌지 않으므로 한동안은 잘 동작할 것입니다.
 
 # 스팀 게임 매출 순위 URL 및 선택자
-TOP_SELLING_URL = 'https://store.steampowered.com/charts/topselling/KR'
-TOP_SELLING_ROW_SELECTOR = 'tr[class^="weeklytopsellers_TableRow_"]'
-TOP_SELLING_TITLE_SELECTOR = 'div[class^="weeklytopsellers_GameName_"]'
-TOP_SELLING_PRICE_SELECTOR = 'div.salepreviewwidgets_StoreSalePriceBox_Wh0L8' # 조금 더 일반적인 선택자
+# 매출 순위는 국가별 페이지이며, {region}에 국가 코드가 들어갑니다.
+TOP_SELLING_URL = 'https://store.steampowered.com/charts/topselling/{region}'
+TOP_SELLING_REGION = 'KR'
+TOP_SELLING_ROW_SELECTOR = 'tr[class*="weeklytopsellers_TableRow_"]'
+TOP_SELLING_TITLE_SELECTOR = 'div[class*="weeklytopsellers_GameName_"]'
+TOP_SELLING_PRICE_SELECTOR = 'div[class*="StoreSalePriceBox"]' # 조금 더 일반적인 선택자
 
 # 스팀 인기 게임(최다 플레이어) 순위 URL 및 선택자
 MOST_PLAYED_URL = 'https://store.steampowered.com/charts/mostplayed'
@@ -17,22 +21,40 @@ MOST_PLAYED_ROW_SELECTOR = 'tr[class^="dailyglobaltopsellers_TableRow_"]'
 MOST_PLAYED_TITLE_SELECTOR = 'div[class^="dailyglobaltopsellers_GameName_"]'
 MOST_PLAYED_CURRENT_SELECTOR = 'td:nth-of-type(3)' # 세 번째 'td' 태그
 
-# 'get_top_selling_games' 함수를 아래 코드로 통째로 교체해주세요.
 
-def get_top_selling_games():
-    """스팀 최고 매출 게임 100개 정보를 가져옵니다."""
+def _finalize_top_selling(game):
+    """가격 정보가 없는 경우(예: 출시 예정)와 무료 게임의 가격 표시를 정리합니다."""
+    price_text = game['price']
+    if price_text is None:
+        game['price'] = "가격 정보 없음"
+    elif "Free" in price_text or "무료" in price_text:
+        game['price'] = "무료"
+    return game
+
+
+# 행마다 제목/가격을 한 번의 순회로 추출하는 규칙
+TOP_SELLING_SPEC = RowSpec(TOP_SELLING_ROW_SELECTOR, [
+    Field('title', TOP_SELLING_TITLE_SELECTOR, mode="strip"),
+    Field('app_id', 'a', attr='href', pattern=r'/app/(\d+)/'),
+    Field('price', TOP_SELLING_PRICE_SELECTOR, mode="strip"),
+], required=('title',), finalize=_finalize_top_selling)
+
+MOST_PLAYED_SPEC = RowSpec(MOST_PLAYED_ROW_SELECTOR, [
+    Field('title', MOST_PLAYED_TITLE_SELECTOR, mode="strip"),
+    Field('current_players', MOST_PLAYED_CURRENT_SELECTOR, mode="strip"),
+], required=('title', 'current_players'))
+
+
+def get_top_selling_games(region=TOP_SELLING_REGION):
+    """스팀 최고 매출 게임 100개 정보를 가져옵니다. region은 매출 순위를 볼 국가 코드입니다."""
     print("\n스팀 최고 매출 게임 정보를 가져오는 중...")
     try:
-        # 헤더 추가 (봇으로 인식되는 것을 방지)
-        headers = {'User-Agent': 'Mozilla/5.0', 'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7'}
-        response = requests.get('https://store.steampowered.com/charts/topselling/KR', headers=headers)
+        # User-Agent 등 공통 헤더는 http_client에서 설정합니다.
+        response = http_client.get(TOP_SELLING_URL.format(region=region), language="ko")
         response.raise_for_status() # 오류가 발생하면 예외를 발생시킴
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # --- 여기가 수정된 부분입니다 ---
-        # 변경된 웹사이트 구조에 맞는 새로운 CSS 선택자를 사용합니다.
-        game_rows = soup.select('tr[class*="weeklytopsellers_TableRow_"]')
+        parser = html_backend.get_backend()
+        game_rows = TOP_SELLING_SPEC.rows(parser.parse(response.text), parser)
         
         if not game_rows:
             print("[!] 게임 목록을 찾을 수 없습니다. 스팀 웹사이트의 구조가 변경되었을 수 있습니다.")
@@ -40,22 +62,11 @@ def get_top_selling_games():
 
         games_list = []
         for rank, row in enumerate(game_rows, 1):
-            # 게임 제목과 가격 정보 선택자를 더 구체적으로 수정
-            title_tag = row.select_one('div[class*="weeklytopsellers_GameName_"]')
-            price_tag = row.select_one('div[class*="StoreSalePriceBox"]')
-            
-            if title_tag:
-                title = title_tag.get_text(strip=True)
-                # 가격 정보가 없는 경우(예: 출시 예정) 처리
-                price = "가격 정보 없음"
-                if price_tag:
-                    price_text = price_tag.get_text(strip=True)
-                    if "Free" in price_text or "무료" in price_text:
-                        price = "무료"
-                    else:
-                        price = price_text
-                
-                games_list.append({'rank': rank, 'title': title, 'price': price})
+            # 제목이 없는 행은 건너뛰지만 순위는 행 순서를 그대로 따릅니다.
+            game = TOP_SELLING_SPEC.extract(row, parser)
+            if game:
+                games_list.append({'rank': rank, 'title': game['title'], 'price': game['price'],
+                                   'app_id': game['app_id']})
         
         print("정보를 성공적으로 가져왔습니다!")
         return games_list
@@ -71,25 +82,15 @@ def get_most_played_games():
     """스팀 최다 플레이어 게임 100개 정보를 가져옵니다."""
     print("\n스팀 인기 게임 정보를 가져오는 중...")
     try:
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        response = requests.get(MOST_PLAYED_URL, headers=headers)
+        response = http_client.get(MOST_PLAYED_URL, language="ko")
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-        game_rows = soup.select(MOST_PLAYED_ROW_SELECTOR)
+        parser = html_backend.get_backend()
+        games = MOST_PLAYED_SPEC.extract_all(parser.parse(response.text), parser)
 
-        games_list = []
-        rank = 1
-        for row in game_rows:
-            title_tag = row.select_one(MOST_PLAYED_TITLE_SELECTOR)
-            current_players_tag = row.select_one(MOST_PLAYED_CURRENT_SELECTOR)
-
-            if title_tag and current_players_tag:
-                title = title_tag.get_text(strip=True)
-                current_players = current_players_tag.get_text(strip=True)
-                
-                games_list.append({'rank': rank, 'title': title, 'current_players': current_players})
-                rank += 1
+        # 제목과 접속자 수가 모두 있는 행만 순위를 매깁니다.
+        games_list = [{'rank': rank, 'title': game['title'], 'current_players': game['current_players']}
+                      for rank, game in enumerate(games, 1)]
         
         print("정보를 성공적으로 가져왔습니다!")
         return games_list
@@ -130,9 +131,8 @@ def get_top_rated_games():
 
 def main():
     """메인 프로그램 루프입니다."""
-    top_selling_cache = None
-    most_played_cache = None
-    
+    # 응답은 http_client의 디스크 캐시에 TTL 동안 보관되므로
+    # 같은 메뉴를 다시 선택하거나 프로그램을 다시 실행해도 네트워크 요청 없이 표시됩니다.
     while True:
         print("\n==========================")
         print("| 1. 스팀 게임 매출 TOP 100 |")
@@ -148,39 +148,26 @@ def main():
         choice = input("[원하시는 서비스에 해당하는 번호를 입력하세요.]: ")
 
         if choice == '1':
-            if not top_selling_cache:
-                top_selling_cache = get_top_selling_games()
-            display_top_selling(top_selling_cache, 100)
+            display_top_selling(get_top_selling_games(), 100)
         elif choice == '2':
-            if not top_selling_cache:
-                top_selling_cache = get_top_selling_games()
-            display_top_selling(top_selling_cache, 50)
+            display_top_selling(get_top_selling_games(), 50)
         elif choice == '3':
-            if not top_selling_cache:
-                top_selling_cache = get_top_selling_games()
-            display_top_selling(top_selling_cache, 10)
+            display_top_selling(get_top_selling_games(), 10)
         elif choice == '4':
-            if not most_played_cache:
-                most_played_cache = get_most_played_games()
-            display_most_played(most_played_cache, 100)
+            display_most_played(get_most_played_games(), 100)
         elif choice == '5':
-            if not most_played_cache:
-                most_played_cache = get_most_played_games()
-            display_most_played(most_played_cache, 50)
+            display_most_played(get_most_played_games(), 50)
         elif choice == '6':
-            if not most_played_cache:
-                most_played_cache = get_most_played_games()
-            display_most_played(most_played_cache, 10)
+            display_most_played(get_most_played_games(), 10)
         elif choice == '7':
             get_top_rated_games()
         elif choice == '0':
+            http_client.print_connection_stats()
             print("\n프로그램을 종료합니다. 이용해주셔서 감사합니다.")
             break
         else:
             print("\n[!] 잘못된 입력입니다. 0부터 7까지의 숫자 중 하나를 입력해주세요.")
-            
-        # 다음 입력을 위해 잠시 대기
-        time.sleep(1)
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,217 @@
+import asyncio
+import random
+import threading
+import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+
+import metrics
+
+
+class TokenBucket:
+    """토큰 버킷 방식의 요청 속도 제한기입니다.
+
+    초당 `rate`개의 토큰이 채워지고, 최대 `capacity`개까지 쌓입니다.
+    요청 하나당 토큰 하나를 소비하며, 토큰이 없으면 채워질 때까지 기다립니다.
+    스레드와 asyncio 양쪽에서 같은 버킷을 공유할 수 있습니다.
+    """
+
+    def __init__(self, rate=1.0, capacity=None):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self):
+        """토큰 하나를 예약하고, 사용 가능해질 때까지 기다려야 할 시간을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # 토큰이 음수가 되도록 허용해 대기 순서를 예약 순서대로 유지합니다.
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """토큰을 얻을 때까지 현재 스레드를 대기시킵니다."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """토큰을 얻을 때까지 이벤트 루프를 막지 않고 대기합니다."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class AimdLimiter:
+    """응답에 따라 동시 요청 수 상한을 조절하는 AIMD 제한기입니다.
+
+    성공하면 상한을 조금씩 올리고(상한만큼 성공할 때마다 +increase),
+    429/5xx처럼 과부하 응답을 받으면 상한을 decrease배로 줄입니다.
+    줄인 뒤에 시작한 요청이 실패해야 다시 줄이므로, 동시에 실패한 요청들 때문에
+    상한이 연달아 줄어들지 않습니다. 스레드 간에 공유할 수 있습니다.
+    """
+
+    def __init__(self, initial=4, minimum=1, maximum=16, increase=1.0, decrease=0.5):
+        if not 0 < decrease < 1:
+            raise ValueError("decrease는 0과 1 사이여야 합니다.")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.limit = float(min(max(initial, minimum), maximum))
+        self.in_flight = 0
+        self._decreased_at = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """자리가 날 때까지 기다린 뒤 요청 시작 시각을 반환합니다. release()에 그대로 넘깁니다."""
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+            return time.monotonic()
+
+    def release(self, started, overloaded=False):
+        """요청이 끝났음을 알립니다. overloaded가 True이면 상한을 줄입니다."""
+        with self._condition:
+            self.in_flight -= 1
+            if overloaded:
+                if started >= self._decreased_at:
+                    self.limit = max(self.minimum, self.limit * self.decrease)
+                    self._decreased_at = time.monotonic()
+            else:
+                self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+            self._condition.notify_all()
+
+
+class CircuitBreaker:
+    """연속 실패가 이어지면 한동안 요청을 막는 회로 차단기입니다.
+
+    - closed: 정상. 연속 실패가 failure_threshold번이 되면 open으로 바뀝니다.
+    - open: reset_timeout초 동안 모든 요청을 막습니다.
+    - half_open: 시험 요청 하나만 보내 성공하면 closed, 실패하면 다시 open이 됩니다.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """요청을 보내도 되면 True를 반환합니다."""
+        with self._lock:
+            if self.state == "open" and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = "half_open"
+                self._probing = False
+            if self.state == "closed":
+                return True
+            if self.state == "half_open" and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def retry_in(self):
+        """다시 요청할 수 있을 때까지 남은 시간(초)을 반환합니다."""
+        with self._lock:
+            if self.state != "open":
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+
+def parse_retry_after(value, now=None):
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 바꿉니다. 해석할 수 없으면 None입니다."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, when.timestamp() - (now or time.time()))
+
+
+def backoff_delay(attempt, base=0.5, cap=30.0, retry_after=None):
+    """
+    attempt번째 재시도 전에 기다릴 시간(초)을 반환합니다.
+
+    지수 백오프에 전체 지터(0 ~ base * 2^attempt 사이의 난수)를 적용하고,
+    서버가 Retry-After를 주었으면 그보다 짧게 기다리지 않습니다.
+    """
+    delay = random.uniform(0, min(cap, base * (2 ** attempt)))
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, cap * 4))
+    return delay
+
+
+async def run_jobs(jobs, max_concurrency, bucket=None, default=None, progress=False):
+    """
+    (이름, 함수) 작업들을 동시에 실행하고 작업별 결과를 작업 순서대로 반환합니다.
+
+    함수가 코루틴 함수이면 이벤트 루프에서 기다리고, 아니면 (requests 같은 블로킹 호출이므로)
+    스레드에서 실행합니다. 실패한 작업은 메시지를 출력하고 default를 결과로 씁니다.
+
+    Parameters:
+    -----------
+    jobs : list
+        (이름, 인자 없는 함수) 튜플 목록
+    max_concurrency : int
+        동시에 진행할 최대 작업 수
+    bucket : TokenBucket
+        지정하면 작업마다 토큰 하나를 얻은 뒤 시작합니다. 여러 실행에 같은 버킷을 넘기면
+        초당 요청 수 한도를 함께 씁니다. (작업 안에서 직접 토큰을 얻으면 None)
+    default : object
+        실패한 작업의 결과로 쓸 값 (기본값: None)
+    progress : bool
+        True이면 작업을 시작할 때 이름을 출력합니다.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(label, job):
+        async with semaphore:
+            if bucket is not None:
+                waited = time.perf_counter()
+                await bucket.acquire_async()
+                metrics.record("throttle", time.perf_counter() - waited)
+            if progress:
+                print(f"{label} 수집 중...")
+            try:
+                if asyncio.iscoroutinefunction(job):
+                    return await job()
+                return await asyncio.to_thread(job)
+            except Exception as e:
+                print(f"{label} 실패: {e}")
+                return default
+
+    return await asyncio.gather(*(run(label, job) for label, job in jobs))
@@ -0,0 +1,187 @@
+"""여러 국가(지역)의 같은 순위를 동시에 수집해 app_id × 지역 표로 합칩니다.
+
+지역마다 따로 실행하면 지역 수만큼 시간이 걸리므로, 모든 지역의 요청을 한 번에 만들어
+전체 동시 요청 수와 초당 요청 수 한도 안에서 함께 보냅니다.
+HTML 파서 백엔드와 행 추출 규칙은 프로세스에 하나씩만 만들어 모든 지역이 함께 씁니다.
+
+결과 표는 게임(app_id)마다 한 행이고, 지역별 순위/가격/할인율이 열로 붙습니다.
+(rank_US, rank_KR, ..., price_US, price_KR, ..., discount_US, discount_KR, ...)
+가격은 price_normalize로 최소 단위 금액과 통화 코드(amount_US, currency_US, ...) 열도 붙입니다.
+
+사용법:
+    python region_matrix.py --regions US KR JP DE GB -c topsellers --total 200
+    python region_matrix.py --regions US KR JP --source topselling   # 국가별 매출 순위 차트
+"""
+import argparse
+import asyncio
+import os
+from datetime import datetime
+
+import metrics
+import price_normalize
+from rank3 import BULK_BATCH_SIZE, SteamGameScraper
+
+DEFAULT_REGIONS = ("US", "KR", "JP", "DE", "GB")
+SOURCES = ("search", "topselling")
+FIELDS = ("rank", "price", "discount")
+OUTPUT_DIR = "./output/regions"
+
+
+def collect_regions(regions, category="topsellers", total=100, source="search", parser="auto",
+                    max_concurrency=8, rate=4.0, base_url=None):
+    """
+    여러 지역의 순위를 동시에 수집합니다.
+
+    Parameters:
+    -----------
+    regions : list
+        국가 코드 목록 (예: ['US', 'KR', 'JP'])
+    category : str
+        검색 카테고리 ('topsellers', 'specials', 'popularnew', 'free'). source='search'일 때만 씁니다.
+    total : int
+        지역마다 가져올 최대 게임 수 (기본값: 100)
+    source : str
+        'search'는 검색 결과 엔드포인트, 'topselling'은 국가별 매출 순위 차트입니다.
+    max_concurrency : int
+        모든 지역을 합쳐 동시에 진행할 최대 요청 수 (기본값: 8)
+    rate : float
+        모든 지역을 합쳐 초당 허용할 요청 수 (기본값: 4.0)
+    base_url : str
+        스토어 주소를 바꿀 때 지정합니다 (로컬 서버 등, source='search'만 해당)
+
+    Returns:
+    --------
+    dict: 국가 코드 → 순위대로 정렬된 게임 정보 리스트. rank는 구간의 시작 위치로 정하므로
+    실패한 구간이 있으면 그 구간의 순위만 비고 뒤 구간의 순위는 밀리지 않습니다.
+    """
+    if source not in SOURCES:
+        raise ValueError(f"알 수 없는 수집 대상입니다: {source}")
+    regions = list(dict.fromkeys(region.upper() for region in regions))
+
+    # 지역마다 가격이 다르므로 collect_job처럼 app_id별 dict를 지역끼리 나눠 쓰지 않습니다.
+    scrapers = {region: SteamGameScraper(parser=parser, region=region) for region in regions}
+    jobs, owners = [], []
+    for region, scraper in scrapers.items():
+        if base_url:
+            scraper.base_url = base_url
+        if source == "topselling":
+            jobs.append((f"[{region}] 매출 순위", lambda region=region: _top_selling(region)))
+            owners.append((region, 0))
+            continue
+        # 전체 결과 수를 먼저 확인하지 않고 모든 구간을 한 번에 요청합니다.
+        # (결과가 total보다 적으면 뒤쪽 구간은 빈 목록으로 돌아옵니다)
+        for start in range(0, total, BULK_BATCH_SIZE):
+            count = min(BULK_BATCH_SIZE, total - start)
+            jobs.append((
+                f"[{region}] {start} - {start + count}번째 게임",
+                lambda scraper=scraper, start=start, count=count:
+                    scraper._fetch_bulk_games(start, count, category)[0],
+            ))
+            owners.append((region, start))
+
+    # 작업 전체를 한 번에 실행해야 동시 요청 수와 요청 속도 한도가 모든 지역에 함께 적용됩니다.
+    runner = next(iter(scrapers.values()))
+    results = asyncio.run(runner._run_jobs(jobs, max_concurrency, rate)) if jobs else []
+
+    rankings = {region: [] for region in regions}
+    for (region, start), games in zip(owners, results):
+        for rank, game in enumerate(games, start + 1):
+            game["rank"] = rank
+        rankings[region].extend(game for game in games if game["rank"] <= total)
+    return rankings
+
+
+def _top_selling(region):
+    """국가별 매출 순위 차트를 검색 결과와 같은 키(app_id, title, price, discount)로 가져옵니다."""
+    import rank6
+
+    games = rank6.get_top_selling_games(region) or []
+    return [{**game, "discount": None} for game in games]
+
+
+def join_regions(rankings):
+    """
+    지역별 순위를 app_id × 지역 표(pandas DataFrame)로 합칩니다.
+
+    열은 title, regions(순위에 든 지역 수)와 rank_<지역>, price_<지역>, discount_<지역>,
+    amount_<지역>(최소 단위 금액), currency_<지역>이며, 행은 가장 높은 지역 순위 순서로 정렬합니다.
+    """
+    import pandas as pd
+
+    regions = list(rankings)
+    rows = [{"app_id": game.get("app_id"), "title": game.get("title"), "region": region,
+             **{field: game.get(field) for field in FIELDS}}
+            for region, games in rankings.items() for game in games]
+    columns = [f"{field}_{region}" for field in (*FIELDS, "amount", "currency") for region in regions]
+    if not rows:
+        return pd.DataFrame(columns=["app_id", "title", "regions", *columns])
+
+    long = pd.DataFrame(rows)
+    # app_id가 없는 행(번들 등)은 지역끼리 맞출 수 없으므로 뺍니다.
+    long = long[long["app_id"].notna() & (long["app_id"] != "N/A")]
+    long = long.drop_duplicates(["app_id", "region"])
+
+    wide = long.pivot(index="app_id", columns="region", values=list(FIELDS))
+    wide.columns = [f"{field}_{region}" for field, region in wide.columns]
+    wide = wide.reindex(columns=columns)
+    for region in regions:
+        normalized = price_normalize.normalize_prices(
+            wide[f"price_{region}"], currency=price_normalize.REGION_CURRENCIES.get(region))
+        wide[f"amount_{region}"] = normalized["amount_minor"]
+        wide[f"currency_{region}"] = normalized["currency"]
+    for column in (f"rank_{region}" for region in regions):
+        wide[column] = wide[column].astype("Int64")
+    for column in (f"discount_{region}" for region in regions):
+        wide[column] = pd.to_numeric(wide[column]).astype("Int64")
+
+    titles = long.groupby("app_id", sort=False)["title"].first()
+    ranks = wide[[f"rank_{region}" for region in regions]]
+    wide.insert(0, "title", titles.reindex(wide.index))
+    wide.insert(1, "regions", ranks.notna().sum(axis=1))
+    best = ranks.min(axis=1)
+    wide = wide.iloc[best.argsort(kind="stable")]
+    return wide.reset_index()
+
+
+def save_matrix(table, name, output_dir=OUTPUT_DIR):
+    """표를 CSV로 저장하고 경로를 반환합니다."""
+    os.makedirs(output_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = os.path.join(output_dir, f"{name}_{timestamp}.csv")
+    with metrics.span("save") as span:
+        table.to_csv(path, index=False, encoding="utf-8-sig")
+        span.add(rows=len(table))
+    print(f"지역별 비교표가 {path}에 저장되었습니다.")
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="여러 지역의 순위와 가격을 동시에 수집해 비교합니다.")
+    parser.add_argument("--regions", nargs="+", default=list(DEFAULT_REGIONS), metavar="CC",
+                        help=f"국가 코드 목록 (기본값: {' '.join(DEFAULT_REGIONS)})")
+    parser.add_argument("-c", "--category", default="topsellers",
+                        choices=("topsellers", "specials", "popularnew", "free"),
+                        help="검색 카테고리 (기본값: topsellers)")
+    parser.add_argument("--source", choices=SOURCES, default="search",
+                        help="'search'는 검색 결과, 'topselling'은 국가별 매출 순위 차트 (기본값: search)")
+    parser.add_argument("--total", type=int, default=100, help="지역마다 가져올 게임 수 (기본값: 100)")
+    parser.add_argument("--concurrency", type=int, default=8, help="전체 동시 요청 수 (기본값: 8)")
+    parser.add_argument("--rate", type=float, default=4.0, help="전체 초당 요청 수 (기본값: 4.0)")
+    parser.add_argument("--parser", default="auto", help="HTML 파서 백엔드")
+    parser.add_argument("--output", default=OUTPUT_DIR, help=f"저장 폴더 (기본값: {OUTPUT_DIR})")
+    args = parser.parse_args(argv)
+
+    rankings = collect_regions(args.regions, category=args.category, total=args.total,
+                               source=args.source, parser=args.parser,
+                               max_concurrency=args.concurrency, rate=args.rate)
+    for region, games in rankings.items():
+        print(f"- {region}: {len(games)}개")
+    table = join_regions(rankings)
+    name = "topselling" if args.source == "topselling" else args.category
+    save_matrix(table, name, args.output)
+    metrics.print_summary()
+    return 0 if len(table) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,188 @@
+"""페이지 HTML을 가져오는 렌더러 계층입니다.
+
+먼저 일반 HTTP 요청으로 정적 HTML을 받아 필요한 선택자가 있는지 확인하고,
+없을 때만 헤드리스 브라우저로 렌더링합니다. 브라우저는 풀에 보관해 재사용하며
+고정 sleep 대신 선택자가 나타날 때까지 명시적으로 기다립니다.
+
+브라우저 쪽은 render(url, selector, timeout) 메서드만 있으면 되므로
+테스트에서는 실제 브라우저 대신 간단한 객체로 바꿔 끼울 수 있습니다.
+"""
+import atexit
+import queue
+import threading
+
+import http_client
+import html_backend
+
+DEFAULT_WAIT_TIMEOUT = 15
+
+
+def headless_chrome(driver_path=None):
+    """헤드리스 Chrome 드라이버를 만듭니다.
+
+    driver_path를 주지 않으면 Selenium Manager가 드라이버를 찾아 주므로
+    실행할 때마다 ChromeDriverManager().install()을 호출할 필요가 없습니다.
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    # 이미지는 선택자 대기에 필요 없으므로 불러오지 않습니다.
+    options.add_argument("--blink-settings=imagesEnabled=false")
+
+    service = Service(executable_path=driver_path) if driver_path else Service()
+    return webdriver.Chrome(service=service, options=options)
+
+
+class StaticRenderer:
+    """공유 HTTP 클라이언트로 정적 HTML을 가져옵니다."""
+
+    def fetch(self, url, language=None):
+        response = http_client.get(url, language=language)
+        response.raise_for_status()
+        return response.text
+
+
+class BrowserPool:
+    """헤드리스 브라우저 세션을 보관했다가 재사용하는 풀입니다.
+
+    세션은 처음 필요할 때 만들고, 최대 size개까지 유지합니다.
+    """
+
+    def __init__(self, size=2, driver_factory=headless_chrome):
+        self.size = size
+        self.driver_factory = driver_factory
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._drivers = []
+
+    def acquire(self, timeout=None):
+        """쉬고 있는 세션을 꺼내거나, 여유가 있으면 새로 만듭니다."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                create = True
+            else:
+                create = False
+
+        if create:
+            try:
+                driver = self.driver_factory()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+            with self._lock:
+                self._drivers.append(driver)
+            return driver
+
+        return self._idle.get(timeout=timeout)
+
+    def release(self, driver):
+        self._idle.put(driver)
+
+    def discard(self, driver):
+        """오류가 난 세션은 풀에서 빼고 종료합니다."""
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+                self._created -= 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """모든 세션을 종료합니다."""
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+            self._created = 0
+        self._idle = queue.LifoQueue()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+class BrowserRenderer:
+    """브라우저 풀에서 세션을 빌려 페이지를 렌더링합니다."""
+
+    def __init__(self, pool=None):
+        self.pool = pool or BrowserPool()
+
+    def render(self, url, selector, timeout=DEFAULT_WAIT_TIMEOUT):
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        driver = self.pool.acquire()
+        try:
+            driver.get(url)
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            )
+            html = driver.page_source
+        except Exception:
+            self.pool.discard(driver)
+            raise
+        self.pool.release(driver)
+        return html
+
+    def close(self):
+        self.pool.close()
+
+
+class TieredRenderer:
+    """정적 HTML을 먼저 시도하고, 선택자가 없을 때만 브라우저로 넘어갑니다."""
+
+    def __init__(self, static=None, browser=None, parser="auto"):
+        self.static = static or StaticRenderer()
+        self.browser = browser
+        self.parser = html_backend.get_backend(parser)
+
+    def render(self, url, selector, timeout=DEFAULT_WAIT_TIMEOUT, language=None):
+        """selector가 들어 있는 HTML을 반환합니다."""
+        try:
+            html = self.static.fetch(url, language=language)
+            if self.parser.select_one(self.parser.parse(html), selector) is not None:
+                return html
+        except Exception as e:
+            print(f"정적 HTML을 가져오지 못해 브라우저로 시도합니다. ({e})")
+
+        if self.browser is None:
+            self.browser = BrowserRenderer()
+        return self.browser.render(url, selector, timeout)
+
+    def close(self):
+        if self.browser is not None:
+            self.browser.close()
+
+
+_default_renderer = None
+
+
+def get_renderer():
+    """프로세스 전체에서 공유하는 렌더러를 반환합니다. 브라우저 풀은 종료 시 정리됩니다."""
+    global _default_renderer
+    if _default_renderer is None:
+        _default_renderer = TieredRenderer()
+        atexit.register(_default_renderer.close)
+    return _default_renderer
+
+
+def set_renderer(renderer):
+    """공유 렌더러를 교체합니다. 테스트에서 가짜 브라우저를 넣을 때 사용합니다."""
+    global _default_renderer
+    _default_renderer = renderer
@@ -0,0 +1,429 @@
+"""스토어 리뷰 API(appreviews)로 순위 상위 게임의 리뷰를 모읍니다.
+
+검색 결과 행의 툴팁에는 리뷰 요약만 있으므로, 실제 리뷰 수와 최근 평가는
+커서로 페이지를 넘기는 `/appreviews/<app_id>?json=1` 엔드포인트로 가져옵니다.
+
+- 여러 게임을 동시에 받되, 동시에 진행하는 게임 수와 초당 요청 수는 모든 게임이 함께 나눠 씁니다.
+- filter=recent는 작성 시각이 최신인 리뷰부터 주므로, 실행마다 먼저 첫 페이지(cursor='*')부터
+  지난번에 받은 가장 최신 리뷰가 나올 때까지 새 리뷰를 받습니다.
+- max_pages에 닿아 다 받지 못한 오래된 쪽은 이어받기 커서로 저장해 두고, 다음 실행에서 새 리뷰를
+  받고 남은 페이지로 이어서 받습니다. 이어받기 커서는 페이지와 같은 트랜잭션에 저장합니다.
+- 리뷰는 recommendationid를 기본 키로 SQLite에 저장해 중복을 막고, 여러 불리언 값은 비트 하나씩으로
+  묶고 본문은 zlib으로 압축합니다.
+
+사용법:
+    python review_ingest.py --top 50 -c topsellers       # 상위 50개 게임의 새 리뷰 수집
+    python review_ingest.py --app-ids 730 570 --max-pages 20
+    python review_ingest.py --summary                     # 저장된 리뷰 요약만 출력
+"""
+import argparse
+import asyncio
+import functools
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+import http_client
+from rate_limit import TokenBucket, run_jobs
+
+DEFAULT_BASE_URL = "https://store.steampowered.com"
+DEFAULT_DB_PATH = "./output/reviews.sqlite"
+
+# 요청 하나로 받을 리뷰 수 (API 최대값)
+PAGE_SIZE = 100
+# 처음 수집할 때 게임 하나에 받을 최대 페이지 수. 나머지는 다음 실행에서 커서로 이어 받습니다.
+DEFAULT_MAX_PAGES = 10
+# 최근 평가를 계산할 기간(일)
+RECENT_DAYS = 30
+
+# flags 열의 비트
+VOTED_UP = 1
+STEAM_PURCHASE = 2
+RECEIVED_FOR_FREE = 4
+EARLY_ACCESS = 8
+_FLAG_FIELDS = (("voted_up", VOTED_UP), ("steam_purchase", STEAM_PURCHASE),
+                ("received_for_free", RECEIVED_FOR_FREE), ("written_during_early_access", EARLY_ACCESS))
+
+
+def _pack_review(app_id, review, keep_text=True):
+    """API의 리뷰 dict를 reviews 테이블 한 행으로 바꿉니다."""
+    author = review.get("author") or {}
+    flags = 0
+    for field, bit in _FLAG_FIELDS:
+        if review.get(field):
+            flags |= bit
+    body = review.get("review")
+    return (
+        int(review["recommendationid"]),
+        app_id,
+        int(author["steamid"]) if author.get("steamid") else None,
+        review.get("language"),
+        int(review.get("timestamp_created") or 0),
+        int(review.get("timestamp_updated") or 0),
+        flags,
+        int(review.get("votes_up") or 0),
+        int(review.get("votes_funny") or 0),
+        float(review.get("weighted_vote_score") or 0),
+        author.get("playtime_forever"),
+        author.get("playtime_at_review"),
+        zlib.compress(body.encode("utf-8")) if keep_text and body else None,
+    )
+
+
+class ReviewStore:
+    """게임별 리뷰와 수집 상태(커서, 최신 리뷰 시각)를 저장하는 SQLite 저장소입니다."""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS reviews (
+                review_id INTEGER PRIMARY KEY,
+                app_id INTEGER NOT NULL,
+                author INTEGER,
+                language TEXT,
+                created INTEGER NOT NULL,
+                updated INTEGER NOT NULL,
+                flags INTEGER NOT NULL,
+                votes_up INTEGER NOT NULL,
+                votes_funny INTEGER NOT NULL,
+                weighted_score REAL,
+                playtime_forever INTEGER,
+                playtime_at_review INTEGER,
+                body BLOB
+            );
+            CREATE INDEX IF NOT EXISTS reviews_app_created ON reviews (app_id, created);
+
+            -- newest: 첫 페이지부터 빠짐없이 받은 가장 최신 리뷰 시각
+            -- backfill_cursor/backfill_floor: 아직 받지 못한 오래된 구간의 다음 커서와 그 구간의 끝 시각
+            CREATE TABLE IF NOT EXISTS review_state (
+                app_id INTEGER PRIMARY KEY,
+                newest INTEGER NOT NULL DEFAULT 0,
+                backfill_cursor TEXT,
+                backfill_floor INTEGER,
+                total_reviews INTEGER,
+                total_positive INTEGER,
+                total_negative INTEGER,
+                review_score_desc TEXT,
+                updated_at REAL
+            ) WITHOUT ROWID;
+            """
+        )
+        self._conn.commit()
+
+    def state(self, app_id):
+        """게임의 수집 상태를 dict로 반환합니다. 처음 보는 게임이면 빈 상태입니다."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT newest, backfill_cursor, backfill_floor FROM review_state WHERE app_id = ?",
+                (app_id,),
+            ).fetchone()
+        if row is None:
+            return {"newest": 0, "backfill_cursor": None, "backfill_floor": None}
+        return {"newest": row[0], "backfill_cursor": row[1], "backfill_floor": row[2]}
+
+    def save_page(self, app_id, rows, state=None, summary=None):
+        """
+        리뷰 행들과 다음 수집 상태를 트랜잭션 하나로 저장하고 새로 들어간 리뷰 수를 반환합니다.
+
+        state가 None이면 수집 상태는 바꾸지 않습니다. summary는 첫 페이지의 query_summary이며,
+        주면 전체 리뷰 수와 평가도 갱신합니다.
+        """
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO reviews (review_id, app_id, author, language, created, updated, "
+                "flags, votes_up, votes_funny, weighted_score, playtime_forever, playtime_at_review, body) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows,
+            )
+            inserted = self._conn.total_changes - before
+            if state is not None:
+                self._conn.execute(
+                    "INSERT INTO review_state (app_id, newest, backfill_cursor, backfill_floor, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?) ON CONFLICT (app_id) DO UPDATE SET newest = excluded.newest, "
+                    "backfill_cursor = excluded.backfill_cursor, backfill_floor = excluded.backfill_floor, "
+                    "updated_at = excluded.updated_at",
+                    (app_id, state["newest"], state["backfill_cursor"], state["backfill_floor"], time.time()),
+                )
+            if summary:
+                # 상태보다 요약이 먼저 올 수 있으므로 행이 없으면 빈 상태로 만듭니다.
+                self._conn.execute("INSERT OR IGNORE INTO review_state (app_id) VALUES (?)", (app_id,))
+                self._conn.execute(
+                    "UPDATE review_state SET total_reviews = ?, total_positive = ?, total_negative = ?, "
+                    "review_score_desc = ? WHERE app_id = ?",
+                    (summary.get("total_reviews"), summary.get("total_positive"),
+                     summary.get("total_negative"), summary.get("review_score_desc"), app_id),
+                )
+        return inserted
+
+    def summary(self, app_ids=None, days=RECENT_DAYS, now=None):
+        """
+        게임별 리뷰 요약을 {app_id: dict} 로 반환합니다.
+
+        total_reviews/total_positive는 API가 알려준 전체 수, stored는 저장한 리뷰 수,
+        recent/recent_positive_pct는 최근 days일 동안 작성된 저장 리뷰의 수와 긍정 비율입니다.
+        """
+        since = (now or time.time()) - days * 86400
+        where, params = "", []
+        if app_ids is not None:
+            app_ids = [int(app_id) for app_id in app_ids]
+            where = f"WHERE s.app_id IN ({', '.join('?' * len(app_ids))})"
+            params = app_ids
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT s.app_id, s.total_reviews, s.total_positive, s.review_score_desc, s.backfill_cursor, "
+                "COUNT(r.review_id), SUM(r.created >= ?), SUM(r.created >= ? AND r.flags & ?) "
+                f"FROM review_state s LEFT JOIN reviews r ON r.app_id = s.app_id {where} "
+                "GROUP BY s.app_id",
+                [since, since, VOTED_UP, *params],
+            ).fetchall()
+        result = {}
+        for app_id, total, positive, desc, cursor, stored, recent, recent_positive in rows:
+            result[app_id] = {
+                "total_reviews": total,
+                "positive_pct": round(positive * 100 / total) if total else None,
+                "review_score_desc": desc,
+                "stored": stored,
+                "recent": recent or 0,
+                "recent_positive_pct": round(recent_positive * 100 / recent) if recent else None,
+                "backfill_pending": cursor is not None,
+            }
+        return result
+
+    def reviews(self, app_id, since=None):
+        """저장된 리뷰를 최신순으로 하나씩 dict로 내보냅니다. (본문은 압축을 풉니다)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT review_id, language, created, flags, votes_up, playtime_at_review, body "
+                "FROM reviews WHERE app_id = ? AND created >= ? ORDER BY created DESC",
+                (int(app_id), since or 0),
+            ).fetchall()
+        for review_id, language, created, flags, votes_up, playtime, body in rows:
+            yield {
+                "review_id": review_id,
+                "language": language,
+                "created": created,
+                "voted_up": bool(flags & VOTED_UP),
+                "votes_up": votes_up,
+                "playtime_at_review": playtime,
+                "review": zlib.decompress(body).decode("utf-8") if body is not None else None,
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ReviewIngester:
+    """
+    여러 게임의 리뷰를 커서 페이지로 동시에 받아 ReviewStore에 저장합니다.
+
+    Parameters:
+    -----------
+    base_url : str
+        스토어 주소 (로컬 테스트 서버를 쓸 때 바꿉니다)
+    store : ReviewStore
+        리뷰 저장소 (기본값: ReviewStore())
+    max_concurrency : int
+        동시에 리뷰를 받는 최대 게임 수 (기본값: 4)
+    rate : float
+        모든 게임을 합쳐 초당 허용할 요청 수 (기본값: 1.0)
+    max_pages : int
+        한 번 실행할 때 게임마다 받을 최대 페이지 수. None이면 끝까지 받습니다.
+        새 리뷰가 이 수를 다 써도 이어받기에는 실행마다 적어도 한 페이지를 씁니다.
+    language : str
+        받을 리뷰 언어 (기본값: 'all')
+    keep_text : bool
+        False이면 리뷰 본문은 저장하지 않습니다.
+    bucket : TokenBucket
+        다른 수집과 요청 속도 한도를 함께 쓸 때 넘깁니다. (주면 rate는 무시)
+    """
+
+    def __init__(self, base_url=DEFAULT_BASE_URL, store=None, max_concurrency=4, rate=1.0,
+                 max_pages=DEFAULT_MAX_PAGES, language="all", keep_text=True, page_size=PAGE_SIZE,
+                 bucket=None):
+        self.base_url = base_url
+        self.store = store or ReviewStore()
+        self.max_concurrency = max_concurrency
+        self.rate = rate
+        self.bucket = bucket or TokenBucket(rate=rate)
+        self.max_pages = max_pages
+        self.language = language
+        self.keep_text = keep_text
+        self.page_size = page_size
+        self.requests_sent = 0
+
+    def refresh(self, app_ids):
+        """
+        app_id들의 새 리뷰를 받아 저장합니다.
+
+        Returns:
+        --------
+        dict: app_id → {"new": 새로 저장한 리뷰 수, "pages": 받은 페이지 수,
+                        "complete": 이어받을 오래된 구간이 남지 않았는지(False면 다음 실행에서 계속)}
+        """
+        app_ids = list(dict.fromkeys(int(app_id) for app_id in app_ids))
+        # 페이지마다 토큰을 얻으므로 작업 단위로는 버킷을 쓰지 않습니다.
+        jobs = [(f"[{app_id}] 리뷰 수집", functools.partial(self._refresh_app, app_id))
+                for app_id in app_ids]
+        results = asyncio.run(run_jobs(jobs, self.max_concurrency)) if jobs else []
+        return {app_id: result for app_id, result in zip(app_ids, results) if result is not None}
+
+    async def _refresh_app(self, app_id):
+        """
+        게임 하나의 새 리뷰를 먼저 받고, 남은 페이지로 이어받기 커서의 오래된 리뷰를 받습니다.
+
+        새 리뷰는 매번 첫 페이지(cursor='*')부터 newest까지 받으므로, 이어받을 구간이 길어도
+        밀리지 않고 전체 리뷰 요약도 매번 갱신됩니다. 이어받기에는 max_pages에서 남은 페이지를 쓰되
+        적어도 한 페이지는 쓰므로, max_pages가 작아도 이어받기가 멈추지 않습니다.
+        새 리뷰를 max_pages 안에 다 받지 못하면
+        남은 구간을 이어받기 커서로 넘깁니다. (이미 이어받는 중이면 더 최신 위치의 커서로 바꾸고
+        끝 시각은 그대로 두므로, 이미 받은 구간을 한 번 더 지나갈 뿐 빠지는 리뷰는 없습니다)
+        """
+        state = await asyncio.to_thread(self.store.state, app_id)
+        newest = state["newest"]
+        cursor, floor = state["backfill_cursor"], state["backfill_floor"]
+        result = {"new": 0, "pages": 0, "complete": False}
+
+        top, head_cursor, reached = newest, None, False
+        head = self._walk(app_id, "*", newest, self.max_pages, result)
+        async for data, rows, page_top, next_cursor, finished in head:
+            summary = data.get("query_summary") if head_cursor is None else None
+            result["new"] += await asyncio.to_thread(self.store.save_page, app_id, rows, None, summary)
+            top, head_cursor, reached = max(top, page_top), next_cursor, finished
+        if not reached and head_cursor:
+            cursor, floor = head_cursor, newest if cursor is None else min(floor, newest)
+        await asyncio.to_thread(self.store.save_page, app_id, [], {
+            "newest": top, "backfill_cursor": cursor, "backfill_floor": floor})
+
+        if cursor is not None:
+            limit = None if self.max_pages is None else max(1, self.max_pages - result["pages"])
+            async for _, rows, _, next_cursor, finished in self._walk(app_id, cursor, floor, limit, result):
+                cursor = None if finished else next_cursor
+                next_state = {"newest": top, "backfill_cursor": cursor,
+                              "backfill_floor": None if finished else floor}
+                result["new"] += await asyncio.to_thread(self.store.save_page, app_id, rows, next_state)
+        result["complete"] = cursor is None
+        return result
+
+    async def _walk(self, app_id, cursor, floor, limit, result):
+        """
+        cursor부터 최신순으로 페이지를 받아 (응답, floor 이후 리뷰 행, 페이지의 가장 최신 리뷰 시각,
+        다음 커서, 끝났는지)를 내보냅니다. floor보다 오래된 리뷰가 나오면 끝나고, limit 페이지를
+        받으면(None이면 제한 없음) 끝나지 않은 채로 멈춥니다. 받은 페이지 수는 result["pages"]에 더합니다.
+
+        floor와 같은 시각의 리뷰도 받습니다. (같은 초에 작성된 리뷰를 놓치지 않도록, 중복은 기본 키로 거릅니다)
+        """
+        pages = 0
+        while limit is None or pages < limit:
+            await self.bucket.acquire_async()
+            # 요청 수는 이벤트 루프에서 세므로 작업 스레드끼리 경쟁하지 않습니다.
+            self.requests_sent += 1
+            data = await asyncio.to_thread(self._fetch_page, app_id, cursor)
+            pages += 1
+            result["pages"] += 1
+
+            reviews = data.get("reviews") or []
+            created = [int(review.get("timestamp_created") or 0) for review in reviews]
+            rows = [_pack_review(app_id, review, self.keep_text)
+                    for review, timestamp in zip(reviews, created) if timestamp >= floor]
+            next_cursor = data.get("cursor")
+            # 빈 페이지, floor보다 오래된 리뷰, 바뀌지 않는 커서는 모두 끝을 뜻합니다.
+            finished = (not reviews or min(created) < floor or not next_cursor
+                        or next_cursor == cursor)
+            yield data, rows, max(created, default=0), next_cursor, finished
+            if finished:
+                return
+            cursor = next_cursor
+
+    def _fetch_page(self, app_id, cursor):
+        # 커서마다 응답이 다르고 다시 쓰지 않으므로 HTTP 캐시를 거치지 않습니다.
+        response = http_client.get(f"{self.base_url}/appreviews/{app_id}", params={
+            "json": 1,
+            "filter": "recent",
+            "language": self.language,
+            "review_type": "all",
+            "purchase_type": "all",
+            "num_per_page": self.page_size,
+            "cursor": cursor,
+        }, use_cache=False)
+        response.raise_for_status()
+        data = response.json() or {}
+        if data.get("success") != 1:
+            raise RuntimeError(f"리뷰 API가 실패를 반환했습니다 (success={data.get('success')})")
+        return data
+
+
+def top_app_ids(count, category="topsellers", base_url=None):
+    """검색 결과 상위 count개 게임의 app_id를 순위대로 반환합니다."""
+    from rank3 import SteamGameScraper
+
+    scraper = SteamGameScraper()
+    if base_url:
+        scraper.base_url = base_url
+    games = scraper.get_top_games_bulk(total=count, category=category)
+    return [int(game["app_id"]) for game in games if str(game.get("app_id", "")).isdigit()]
+
+
+def print_summary(store, app_ids=None):
+    summaries = store.summary(app_ids)
+    order = app_ids if app_ids is not None else sorted(summaries)
+    print(f"\n📝 리뷰 요약 (최근 {RECENT_DAYS}일)")
+    for app_id in order:
+        entry = summaries.get(int(app_id))
+        if entry is None:
+            continue
+        total = f"{entry['total_reviews']:,}" if entry["total_reviews"] is not None else "?"
+        positive = f"{entry['positive_pct']}%" if entry["positive_pct"] is not None else "-"
+        recent = f"{entry['recent_positive_pct']}%" if entry["recent_positive_pct"] is not None else "-"
+        pending = " (이어받기 대기)" if entry["backfill_pending"] else ""
+        print(f"- {app_id:>8}: 전체 {total}건 긍정 {positive} | 저장 {entry['stored']:,}건 | "
+              f"최근 {entry['recent']:,}건 긍정 {recent}{pending}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="순위 상위 게임의 리뷰를 수집합니다.")
+    parser.add_argument("--top", type=int, default=20, help="검색 결과 상위 N개 게임 (기본값: 20)")
+    parser.add_argument("-c", "--category", default="topsellers",
+                        choices=("topsellers", "specials", "popularnew", "free"))
+    parser.add_argument("--app-ids", type=int, nargs="+", metavar="ID", help="순위 대신 수집할 app_id 목록")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help=f"리뷰 저장소 경로 (기본값: {DEFAULT_DB_PATH})")
+    parser.add_argument("--max-pages", type=int, default=DEFAULT_MAX_PAGES,
+                        help=f"게임마다 이번에 받을 최대 페이지 수 (기본값: {DEFAULT_MAX_PAGES}, 0이면 제한 없음)")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시에 받을 게임 수 (기본값: 4)")
+    parser.add_argument("--rate", type=float, default=1.0, help="초당 요청 수 (기본값: 1.0)")
+    parser.add_argument("--no-text", action="store_true", help="리뷰 본문은 저장하지 않습니다")
+    parser.add_argument("--summary", action="store_true", help="수집하지 않고 저장된 요약만 출력합니다")
+    args = parser.parse_args(argv)
+
+    store = ReviewStore(args.db)
+    try:
+        if args.summary:
+            print_summary(store, args.app_ids)
+            return 0
+        app_ids = args.app_ids or top_app_ids(args.top, args.category)
+        ingester = ReviewIngester(store=store, max_concurrency=args.concurrency, rate=args.rate,
+                                  max_pages=args.max_pages or None, keep_text=not args.no_text)
+        start = time.perf_counter()
+        results = ingester.refresh(app_ids)
+        elapsed = time.perf_counter() - start
+        print(f"✅ 게임 {len(results)}개, 새 리뷰 {sum(r['new'] for r in results.values()):,}건, "
+              f"요청 {ingester.requests_sent}회, {elapsed:.1f}초")
+        print_summary(store, app_ids)
+    finally:
+        store.close()
+        http_client.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
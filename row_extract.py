@@ -0,0 +1,464 @@
+"""선언형 행(row) 추출 엔진입니다.
+
+필드마다 선택자/속성/정규식/변환 함수를 적은 RowSpec을 파서 백엔드별로 한 번 컴파일해 두고,
+각 행의 하위 트리를 한 번만 순회하면서 모든 필드를 채웁니다. 필드마다 select_one으로
+행을 다시 훑지 않으므로, 행 하나를 추출하는 비용이 필드 수에 비례해 늘지 않습니다.
+
+    SPEC = RowSpec("#search_resultsRows > a", [
+        Field("title", ".title", default="N/A"),
+        Field("app_id", attr="href", pattern=r"/app/(\\d+)/", default="N/A"),
+        Field("tags", ".search_tag", many=True),
+    ])
+    games = SPEC.extract_all(backend.parse(html), backend)
+
+필드 선택자는 행 기준으로 해석하며 다음 문법을 지원합니다.
+태그, *, .class, #id, [attr], [attr=v], [attr^=v], [attr*=v], [attr$=v],
+:nth-of-type(n), :nth-child(n), 자손(공백)과 자식(>) 결합자.
+"""
+import re
+
+# 텍스트 추출 방식
+#   text   : 하위 텍스트 전체를 이어 붙인 뒤 앞뒤 공백 제거 (node.text.strip())
+#   strip  : 텍스트 조각마다 공백을 제거하고 이어 붙임 (get_text(strip=True))
+#   joined : 텍스트 조각을 공백 하나로 이어 붙임 (get_text(separator=" ", strip=True))
+#   last   : 마지막 텍스트 조각
+TEXT_MODES = ("text", "strip", "joined", "last")
+
+_SELECTOR_TOKEN = re.compile(r"""
+    \s*(?P<child>>)\s*
+  | (?P<space>\s+)
+  | (?P<tag>\*|[A-Za-z][\w-]*)
+  | \.(?P<cls>[\w-]+)
+  | \#(?P<id>[\w-]+)
+  | \[\s*(?P<attr>[\w:-]+)\s*(?:(?P<op>[\^*$]?=)\s*(?P<quote>["']?)(?P<value>.*?)(?P=quote)\s*)?\]
+  | :(?P<pseudo>nth-of-type|nth-child)\(\s*(?P<nth>\d+)\s*\)
+""", re.VERBOSE)
+
+# 행을 순회할 때 path에 쌓는 항목의 위치
+_NODE, _TAG, _ATTRS, _CLASSES, _TYPE_INDEX, _CHILD_INDEX = range(6)
+
+
+class _Compound:
+    """결합자 없이 붙어 있는 단순 선택자 묶음 (예: div.search_price[data-x^="a"])입니다."""
+
+    def __init__(self):
+        self.tag = None
+        self.classes = ()
+        self.id = None
+        self.attrs = ()
+        self.nth_of_type = None
+        self.nth_child = None
+
+    def key(self):
+        """후보 필드를 찾을 때 쓰는 색인 키입니다. 가장 좁게 거를 수 있는 조건을 고릅니다."""
+        if self.id is not None:
+            return ("#", self.id)
+        if self.classes:
+            return (".", self.classes[0])
+        if self.tag is not None:
+            return ("tag", self.tag)
+        return ("*", None)
+
+    def matches(self, entry):
+        if self.tag is not None and entry[_TAG] != self.tag:
+            return False
+        if self.classes:
+            classes = entry[_CLASSES]
+            for name in self.classes:
+                if name not in classes:
+                    return False
+        attrs = entry[_ATTRS]
+        if self.id is not None and attrs.get("id") != self.id:
+            return False
+        for name, op, expected in self.attrs:
+            if name not in attrs:
+                return False
+            if op is None:
+                continue
+            value = attrs.get(name)
+            if isinstance(value, list):
+                value = " ".join(value)
+            value = value or ""
+            if op == "=" and value != expected:
+                return False
+            if op == "^=" and not (expected and value.startswith(expected)):
+                return False
+            if op == "*=" and not (expected and expected in value):
+                return False
+            if op == "$=" and not (expected and value.endswith(expected)):
+                return False
+        if self.nth_of_type is not None and entry[_TYPE_INDEX] != self.nth_of_type:
+            return False
+        if self.nth_child is not None and entry[_CHILD_INDEX] != self.nth_child:
+            return False
+        return True
+
+
+def parse_selector(selector):
+    """선택자 문자열을 [(결합자, _Compound), ...] 로 바꿉니다. 첫 항목의 결합자는 None입니다."""
+    parts = []
+    compound = None
+    combinator = None
+    position = 0
+    selector = selector.strip()
+
+    while position < len(selector):
+        match = _SELECTOR_TOKEN.match(selector, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"지원하지 않는 선택자입니다: {selector!r}")
+        position = match.end()
+
+        if match.group("child") is not None or match.group("space") is not None:
+            if compound is None:
+                raise ValueError(f"결합자 앞에 선택자가 없습니다: {selector!r}")
+            parts.append((combinator, compound))
+            compound = None
+            combinator = ">" if match.group("child") is not None else " "
+            continue
+
+        if compound is None:
+            compound = _Compound()
+        if match.group("tag") is not None:
+            if match.group("tag") != "*":
+                compound.tag = match.group("tag").lower()
+        elif match.group("cls") is not None:
+            compound.classes += (match.group("cls"),)
+        elif match.group("id") is not None:
+            compound.id = match.group("id")
+        elif match.group("attr") is not None:
+            compound.attrs += ((match.group("attr"), match.group("op"), match.group("value")),)
+        elif match.group("pseudo") == "nth-of-type":
+            compound.nth_of_type = int(match.group("nth"))
+        elif match.group("pseudo") == "nth-child":
+            compound.nth_child = int(match.group("nth"))
+
+    if compound is None:
+        raise ValueError(f"빈 선택자입니다: {selector!r}")
+    parts.append((combinator, compound))
+    return parts
+
+
+def _match_chain(parts, index, path, position):
+    """parts[index]가 path[position]에 맞고, 그 왼쪽 선택자들도 조상에 맞는지 확인합니다."""
+    combinator, compound = parts[index]
+    if not compound.matches(path[position]):
+        return False
+    if index == 0:
+        return True
+    if combinator == ">":
+        return position > 0 and _match_chain(parts, index - 1, path, position - 1)
+    for ancestor in range(position - 1, -1, -1):
+        if _match_chain(parts, index - 1, path, ancestor):
+            return True
+    return False
+
+
+class Field:
+    """
+    행에서 값 하나를 뽑는 규칙입니다.
+
+    Parameters:
+    -----------
+    name : str
+        결과 dict의 키
+    selector : str
+        행 기준 CSS 선택자. None이면 행 요소 자체를 사용합니다.
+    attr : str
+        지정하면 텍스트 대신 속성 값을 사용합니다. (요소는 있는데 속성이 없으면 빈 문자열)
+    mode : str
+        텍스트 추출 방식 (TEXT_MODES 참고, 기본값: 'text')
+    pattern : str
+        정규식. 그룹이 있으면 첫 그룹, 없으면 전체 일치 문자열을 사용하고, 일치하지 않으면 default
+    convert : callable
+        마지막에 적용할 변환 함수 (ValueError/TypeError가 나면 default)
+    default : object
+        요소가 없을 때의 값 (many=True이면 빈 리스트)
+    many : bool
+        True이면 선택자에 맞는 모든 요소의 값을 문서 순서대로 리스트로 모읍니다.
+    """
+
+    def __init__(self, name, selector=None, attr=None, mode="text", pattern=None, convert=None,
+                 default=None, many=False):
+        if mode not in TEXT_MODES:
+            raise ValueError(f"알 수 없는 텍스트 추출 방식입니다: {mode}")
+        self.name = name
+        self.selector = selector
+        self.attr = attr
+        self.mode = mode
+        self.pattern = re.compile(pattern) if isinstance(pattern, str) else pattern
+        self.convert = convert
+        self.default = default
+        self.many = many
+        self.parts = parse_selector(selector) if selector is not None else None
+
+    def value(self, node, backend):
+        """찾은 요소에서 값을 뽑습니다."""
+        if self.attr is not None:
+            value = backend.attr(node, self.attr)
+            value = "" if value is None else value
+        elif self.mode == "text":
+            value = backend.text(node).strip()
+        else:
+            pieces = backend.texts(node)
+            if self.mode == "strip":
+                value = "".join(pieces)
+            elif self.mode == "joined":
+                value = " ".join(pieces)
+            else:
+                value = pieces[-1] if pieces else ""
+
+        if self.pattern is not None:
+            match = self.pattern.search(value)
+            if match is None:
+                return self.default
+            value = match.group(1) if self.pattern.groups else match.group(0)
+        if self.convert is not None:
+            try:
+                value = self.convert(value)
+            except (ValueError, TypeError):
+                return self.default
+        return value
+
+
+class RowExtractor:
+    """RowSpec을 백엔드 하나에 맞게 컴파일한 결과입니다. RowSpec.compile로 만듭니다.
+
+    백엔드에 parent/same_node가 있으면(selectolax) 모든 필드 선택자를 묶은 선택자 목록을
+    백엔드의 네이티브 엔진으로 한 번 실행하고, 찾은 요소만 필드에 나눠 줍니다.
+    그렇지 않으면 파이썬에서 행의 하위 트리를 한 번 순회합니다.
+    """
+
+    def __init__(self, spec, backend):
+        self.spec = spec
+        self.backend = backend
+        self.self_fields = [field for field in spec.fields if field.parts is None]
+        self.tree_fields = [field for field in spec.fields if field.parts is not None]
+
+        # 마지막 단순 선택자의 태그/클래스/id로 필드를 색인해 두면, 요소마다
+        # 그 요소에 맞을 수 있는 필드만 검사하므로 필드가 늘어도 순회 비용이 그대로입니다.
+        self.by_tag, self.by_class, self.by_id, self.universal = {}, {}, {}, []
+        for slot, field in enumerate(self.tree_fields):
+            kind, value = field.parts[-1][1].key()
+            if kind == "#":
+                self.by_id.setdefault(value, []).append(slot)
+            elif kind == ".":
+                self.by_class.setdefault(value, []).append(slot)
+            elif kind == "tag":
+                self.by_tag.setdefault(value, []).append(slot)
+            else:
+                self.universal.append(slot)
+        self.single_count = sum(1 for field in self.tree_fields if not field.many)
+        self.has_many = self.single_count != len(self.tree_fields)
+        self.required = spec.required
+
+        self.native = hasattr(backend, "parent") and hasattr(backend, "same_node")
+        self.combined_selector = ", ".join(field.selector for field in self.tree_fields)
+        self.needs_position = any(compound.nth_of_type is not None or compound.nth_child is not None
+                                  for field in self.tree_fields for _, compound in field.parts)
+        # 모든 필드 선택자가 결합자 없는 단순 선택자이면 조상 경로를 만들 필요가 없습니다.
+        self.needs_ancestors = any(len(field.parts) > 1 for field in self.tree_fields)
+
+    def extract(self, row):
+        """행 하나를 dict로 추출합니다. 필수 필드가 없거나 finalize가 None을 주면 None입니다."""
+        backend = self.backend
+        found = [None] * len(self.tree_fields)
+        if self.tree_fields:
+            tag, attrs, classes = backend.tag_info(row)
+            path = [(row, tag, attrs, classes, 1, 1)]
+            if self.native:
+                self._collect_native(row, path, found)
+            else:
+                self._walk(row, path, found, self.single_count)
+
+        record = {}
+        for field in self.self_fields:
+            record[field.name] = field.value(row, backend)
+        for field, nodes in zip(self.tree_fields, found):
+            if field.many:
+                record[field.name] = [field.value(node, backend) for node in nodes or ()]
+            elif nodes is None:
+                record[field.name] = field.default
+            else:
+                record[field.name] = field.value(nodes, backend)
+
+        if self.required and any(record.get(name) is None for name in self.required):
+            return None
+        if self.spec.finalize is not None:
+            return self.spec.finalize(record)
+        return record
+
+    def _check(self, slots, path, found):
+        """path의 마지막 요소가 slots의 필드에 맞으면 기록하고, 새로 채운 단일 필드 수를 반환합니다."""
+        fields = self.tree_fields
+        node = path[-1][_NODE]
+        position = len(path) - 1
+        filled = 0
+        for slot in slots:
+            field = fields[slot]
+            if field.many:
+                if _match_chain(field.parts, len(field.parts) - 1, path, position):
+                    if found[slot] is None:
+                        found[slot] = []
+                    found[slot].append(node)
+            elif found[slot] is None and _match_chain(field.parts, len(field.parts) - 1,
+                                                      path, position):
+                found[slot] = node
+                filled += 1
+        return filled
+
+    def _dispatch(self, path, found):
+        """path의 마지막 요소에 맞을 수 있는 필드(태그/클래스/id 색인)만 검사합니다."""
+        _, tag, attrs, classes, _, _ = path[-1]
+        filled = 0
+        slots = self.by_tag.get(tag)
+        if slots:
+            filled += self._check(slots, path, found)
+        for name in classes:
+            slots = self.by_class.get(name)
+            if slots:
+                filled += self._check(slots, path, found)
+        if self.by_id:
+            slots = self.by_id.get(attrs.get("id"))
+            if slots:
+                filled += self._check(slots, path, found)
+        if self.universal:
+            filled += self._check(self.universal, path, found)
+        return filled
+
+    def _walk(self, row, path, found, remaining):
+        """행의 하위 요소를 문서 순서대로 한 번 순회하며 필드별로 맞는 요소를 기록합니다."""
+        children_of, tag_info = self.backend.children, self.backend.tag_info
+        by_tag, by_class, by_id = self.by_tag, self.by_class, self.by_id
+        check_all = bool(by_id or self.universal)
+        stop_early = not self.has_many
+
+        # 재귀 대신 (자식 리스트, 태그별 개수) 스택으로 깊이 우선 순회합니다.
+        levels = [(children_of(row), {})]
+        indices = [0]
+        while True:
+            depth = len(levels) - 1
+            children, type_counts = levels[depth]
+            index = indices[depth]
+            if index == len(children):
+                levels.pop()
+                indices.pop()
+                if not levels:
+                    return
+                path.pop()
+                continue
+            indices[depth] = index + 1
+
+            child = children[index]
+            tag, attrs, classes = tag_info(child)
+            type_index = type_counts[tag] = type_counts.get(tag, 0) + 1
+            path.append((child, tag, attrs, classes, type_index, index + 1))
+
+            # 대부분의 요소는 어떤 필드에도 해당하지 않으므로 색인에 없으면 바로 넘어갑니다.
+            if check_all or tag in by_tag or any(name in by_class for name in classes):
+                remaining -= self._dispatch(path, found)
+                # 한 요소만 찾는 필드가 모두 채워졌고 여러 요소를 모으는 필드가 없으면 일찍 끝냅니다.
+                if stop_early and remaining == 0:
+                    return
+            levels.append((children_of(child), {}))
+            indices.append(0)
+
+    def _collect_native(self, row, path, found):
+        """묶은 선택자를 백엔드에서 한 번 실행하고, 찾은 요소마다 조상 경로를 만들어 나눠 줍니다."""
+        backend = self.backend
+        previous = None
+        for node in backend.select(row, self.combined_selector):
+            # 여러 선택자에 맞는 요소는 연달아 여러 번 나올 수 있고, 행 자신도 포함될 수 있습니다.
+            if previous is not None and backend.same_node(node, previous):
+                continue
+            previous = node
+            if backend.same_node(node, row):
+                continue
+
+            if not self.needs_ancestors:
+                del path[1:]
+                path.append(self._entry(node))
+                self._dispatch(path, found)
+                continue
+
+            chain = []
+            current = node
+            while current is not None and not backend.same_node(current, row):
+                chain.append(current)
+                current = backend.parent(current)
+            if current is None:
+                continue
+
+            del path[1:]
+            for child in reversed(chain):
+                path.append(self._entry(child))
+            self._dispatch(path, found)
+
+    def _entry(self, node):
+        """네이티브 검색으로 찾은 요소의 path 항목을 만듭니다."""
+        tag, attrs, classes = self.backend.tag_info(node)
+        type_index = child_index = 0
+        if self.needs_position:
+            type_index, child_index = self._position(self.backend, node, tag)
+        return (node, tag, attrs, classes, type_index, child_index)
+
+    @staticmethod
+    def _position(backend, node, tag):
+        """형제 요소 중 (같은 태그 중 몇 번째, 전체 중 몇 번째)인지 1부터 세어 반환합니다."""
+        type_index = 0
+        for child_index, sibling in enumerate(backend.children(backend.parent(node)), 1):
+            if backend.tag_info(sibling)[0] == tag:
+                type_index += 1
+            if backend.same_node(sibling, node):
+                return type_index, child_index
+        return 0, 0
+
+
+class RowSpec:
+    """
+    행 선택자와 필드 규칙 목록입니다.
+
+    Parameters:
+    -----------
+    row_selector : str
+        문서에서 행을 고르는 CSS 선택자 (백엔드의 select로 실행)
+    fields : list
+        Field 목록
+    required : tuple
+        이 필드들 중 하나라도 값이 None이면 행을 건너뜁니다.
+    finalize : callable
+        추출한 dict를 받아 최종 dict(또는 건너뛰려면 None)를 반환하는 함수
+    """
+
+    def __init__(self, row_selector, fields, required=(), finalize=None):
+        self.row_selector = row_selector
+        self.fields = list(fields)
+        self.required = tuple(required)
+        self.finalize = finalize
+        self._extractors = {}
+
+    def compile(self, backend):
+        """백엔드별 추출기를 한 번만 만들어 재사용합니다."""
+        extractor = self._extractors.get(backend.name)
+        if extractor is None or extractor.backend is not backend:
+            extractor = self._extractors[backend.name] = RowExtractor(self, backend)
+        return extractor
+
+    def rows(self, document, backend, row_selector=None):
+        """문서에서 행 요소 목록을 고릅니다."""
+        return backend.select(document, row_selector or self.row_selector)
+
+    def extract(self, row, backend):
+        """행 요소 하나를 추출합니다."""
+        return self.compile(backend).extract(row)
+
+    def extract_all(self, document, backend, row_selector=None, limit=None):
+        """문서의 모든 행을 추출해 리스트로 반환합니다. (건너뛴 행은 빠집니다)"""
+        extractor = self.compile(backend)
+        records = []
+        for row in self.rows(document, backend, row_selector):
+            record = extractor.extract(row)
+            if record is not None:
+                records.append(record)
+                if limit is not None and len(records) >= limit:
+                    break
+        return records
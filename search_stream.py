@@ -0,0 +1,84 @@
+from collections import deque
+from html import escape
+from html.parser import HTMLParser
+
+# 닫는 태그가 없는 요소들. 깊이 계산에서 제외합니다.
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}
+
+
+class SearchRowSplitter(HTMLParser):
+    """검색 결과 HTML을 조각 단위로 받아 `#search_resultsRows > a` 행을 하나씩 떼어 냅니다.
+
+    feed()로 받은 만큼만 토큰화하고, 완성된 행의 HTML은 `rows`에 쌓입니다.
+    DOM 전체를 만들지 않으므로 메모리는 행 하나 크기만큼만 사용합니다.
+    """
+
+    def __init__(self, container_id="search_resultsRows"):
+        super().__init__(convert_charrefs=True)
+        self.container_id = container_id
+        self.rows = deque()
+        self.finished = False
+        self._depth = 0
+        self._container_depth = None
+        self._row_depth = None
+        self._buffer = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag not in VOID_ELEMENTS:
+            self._depth += 1
+
+        if self._container_depth is None:
+            if not self.finished and dict(attrs).get("id") == self.container_id:
+                self._container_depth = self._depth
+            return
+
+        if self._row_depth is None:
+            # 컨테이너의 바로 아래 <a>만 행으로 취급합니다.
+            if tag == "a" and self._depth == self._container_depth + 1:
+                self._row_depth = self._depth
+                self._buffer = [self.get_starttag_text()]
+            return
+
+        self._buffer.append(self.get_starttag_text())
+
+    def handle_startendtag(self, tag, attrs):
+        if self._row_depth is not None:
+            self._buffer.append(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        if tag in VOID_ELEMENTS:
+            return
+
+        if self._row_depth is not None:
+            self._buffer.append(f"</{tag}>")
+            if self._depth == self._row_depth:
+                self.rows.append("".join(self._buffer))
+                self._buffer = []
+                self._row_depth = None
+        elif self._container_depth is not None and self._depth == self._container_depth:
+            self._container_depth = None
+            self.finished = True
+
+        self._depth -= 1
+
+    def handle_data(self, data):
+        if self._row_depth is not None:
+            self._buffer.append(escape(data, quote=False))
+
+
+def iter_row_html(chunks):
+    """텍스트 조각들을 받아 완성되는 행 HTML을 차례로 내보냅니다."""
+    splitter = SearchRowSplitter()
+    for chunk in chunks:
+        # 행 목록이 끝난 뒤의 나머지는 연결을 재사용할 수 있도록 읽기만 하고 버립니다.
+        if not chunk or splitter.finished:
+            continue
+        splitter.feed(chunk)
+        while splitter.rows:
+            yield splitter.rows.popleft()
+    splitter.close()
+    while splitter.rows:
+        yield splitter.rows.popleft()
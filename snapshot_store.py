@@ -0,0 +1,194 @@
+"""카테고리/날짜로 파티션된 Parquet 스냅샷 저장소입니다.
+
+실행할 때마다 CSV 파일을 새로 만드는 대신, 한 번의 수집 결과를
+
+    <root>/category=<카테고리>/date=<YYYY-MM-DD>/part-<HHMMSS>-<id>.parquet
+
+파일 하나로 추가합니다. 숫자 열은 정수/실수 타입으로, tags는 문자열 리스트로 저장되어
+불러올 때 다시 파싱할 필요가 없고, 필요한 파티션과 열만 읽을 수 있습니다.
+
+review_count는 리뷰 툴팁의 리뷰 수입니다. 이전 스냅샷에는 툴팁의 첫 숫자인 긍정 비율(%)이
+잘못 들어가 있었으므로, review_positive_pct 열이 비어 있는 파일의 review_count는 리뷰 수로 쓰지 않습니다.
+"""
+import os
+import uuid
+from datetime import datetime, timezone
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+DEFAULT_ROOT = "./output/snapshots"
+
+SNAPSHOT_SCHEMA = pa.schema([
+    ("captured_at", pa.timestamp("s", tz="UTC")),
+    ("rank", pa.int32()),
+    ("app_id", pa.int64()),
+    ("title", pa.string()),
+    ("price", pa.string()),
+    ("original_price", pa.string()),
+    ("discount", pa.int16()),
+    ("release_date", pa.string()),
+    ("tags", pa.list_(pa.string())),
+    ("review_score", pa.string()),
+    ("review_count", pa.int64()),
+    ("review_positive_pct", pa.int8()),
+    ("url", pa.string()),
+    ("image_url", pa.string()),
+    ("price_numeric", pa.float64()),
+    ("original_price_numeric", pa.float64()),
+    ("price_currency", pa.string()),
+    ("review_score_numeric", pa.int8()),
+])
+
+PARTITION_SCHEMA = pa.schema([("category", pa.string()), ("date", pa.string())])
+
+
+def to_utc(value=None):
+    """
+    수집 시각을 UTC datetime으로 바꿉니다. None이면 지금 시각입니다.
+
+    시간대가 없는 시각은 history_db와 같이 UTC로 봅니다. (로컬 시각으로 보면 같은 실행이
+    저장소마다 다른 시각으로 기록됩니다)
+    """
+    if value is None:
+        return datetime.now(timezone.utc)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class SnapshotStore:
+    """스냅샷을 추가하고 파티션/열 단위로 불러오는 저장소입니다."""
+
+    def __init__(self, root=DEFAULT_ROOT):
+        self.root = root
+
+    def append(self, df, category, captured_at=None):
+        """수집 결과 DataFrame을 스냅샷으로 추가하고 저장한 파일 경로를 반환합니다."""
+        return self.append_many({category: df}, captured_at)[category]
+
+    def append_many(self, frames, captured_at=None):
+        """
+        여러 카테고리의 수집 결과를 같은 captured_at의 스냅샷 하나로 추가합니다.
+
+        모든 파일을 숨김 임시 파일로 먼저 쓴 뒤 이름을 바꾸므로, 읽는 쪽에서는
+        일부 카테고리만 들어간 스냅샷을 보지 않습니다. {카테고리: 파일 경로}를 반환합니다.
+        """
+        captured_at = to_utc(captured_at).replace(microsecond=0)
+        filename = f"part-{captured_at.strftime('%H%M%S')}-{uuid.uuid4().hex[:8]}.parquet"
+
+        written = {}
+        try:
+            for category, df in frames.items():
+                table = self.to_table(df, captured_at)
+                directory = os.path.join(self.root, f"category={category}",
+                                         f"date={captured_at.strftime('%Y-%m-%d')}")
+                os.makedirs(directory, exist_ok=True)
+                path = os.path.join(directory, filename)
+                # '.'으로 시작하는 파일은 데이터셋을 읽을 때 무시됩니다.
+                temp_path = os.path.join(directory, "." + filename + ".tmp")
+                pq.write_table(table, temp_path, compression="zstd")
+                written[category] = (temp_path, path)
+        except Exception:
+            for temp_path, _ in written.values():
+                os.remove(temp_path)
+            raise
+
+        for temp_path, path in written.values():
+            os.replace(temp_path, path)
+        return {category: path for category, (_, path) in written.items()}
+
+    def to_table(self, df, captured_at):
+        """DataFrame을 스냅샷 스키마에 맞는 Arrow 테이블로 변환합니다."""
+        frame = pd.DataFrame(index=df.index)
+        for field in SNAPSHOT_SCHEMA:
+            if field.name == "captured_at":
+                continue
+            if field.name not in df.columns:
+                frame[field.name] = None
+            else:
+                frame[field.name] = df[field.name]
+
+        # app_id는 'N/A'가 들어올 수 있으므로 숫자가 아니면 null로 저장합니다.
+        frame["app_id"] = pd.to_numeric(frame["app_id"], errors="coerce").astype("Int64")
+        frame["review_positive_pct"] = pd.to_numeric(frame["review_positive_pct"],
+                                                     errors="coerce").astype("Int8")
+        frame["tags"] = pd.Series([list(tags) if isinstance(tags, (list, tuple)) else []
+                                   for tags in frame["tags"]], index=frame.index, dtype=object)
+        # price_normalize가 만든 통화 코드는 category 타입이므로 문자열로 바꿔 저장합니다.
+        frame["price_currency"] = frame["price_currency"].astype(object)
+        frame.insert(0, "captured_at", pd.Timestamp(captured_at))
+
+        return pa.Table.from_pandas(frame, schema=SNAPSHOT_SCHEMA, preserve_index=False)
+
+    def dataset(self):
+        """저장소 전체를 Arrow 데이터셋으로 엽니다."""
+        return ds.dataset(self.root, format="parquet", schema=SNAPSHOT_SCHEMA.append(
+            pa.field("category", pa.string())).append(pa.field("date", pa.string())),
+            partitioning=ds.partitioning(PARTITION_SCHEMA, flavor="hive"))
+
+    def load(self, categories=None, start_date=None, end_date=None, columns=None):
+        """
+        조건에 맞는 파티션만 읽어 DataFrame으로 반환합니다.
+
+        Parameters:
+        -----------
+        categories : list
+            읽을 카테고리 목록 (기본값: 전체)
+        start_date, end_date : str
+            'YYYY-MM-DD' 형식의 날짜 범위 (양 끝 포함)
+        columns : list
+            읽을 열 목록. 지정하면 나머지 열은 디스크에서 읽지 않습니다.
+        """
+        if not os.path.exists(self.root):
+            return pd.DataFrame(columns=columns or [])
+
+        condition = None
+        if categories:
+            condition = ds.field("category").isin(list(categories))
+        if start_date:
+            part = ds.field("date") >= start_date
+            condition = part if condition is None else condition & part
+        if end_date:
+            part = ds.field("date") <= end_date
+            condition = part if condition is None else condition & part
+
+        table = self.dataset().to_table(columns=columns, filter=condition)
+        return table.to_pandas()
+
+    def latest(self, category):
+        """
+        카테고리의 가장 최근 스냅샷을 (DataFrame, captured_at)으로 반환합니다. 없으면 (None, None).
+
+        최근 날짜 파티션의 마지막 파일만 읽으므로 저장소 전체를 읽지 않습니다.
+        """
+        category_dir = os.path.join(self.root, f"category={category}")
+        if not os.path.isdir(category_dir):
+            return None, None
+
+        for date_dir in sorted((name for name in os.listdir(category_dir)
+                                if name.startswith("date=")), reverse=True):
+            directory = os.path.join(category_dir, date_dir)
+            # part-HHMMSS-<id>.parquet 이므로 이름 순서가 시간 순서입니다. ('.'으로 시작하는 임시 파일 제외)
+            parts = sorted(name for name in os.listdir(directory)
+                           if name.startswith("part-") and name.endswith(".parquet"))
+            if parts:
+                frame = pq.read_table(os.path.join(directory, parts[-1])).to_pandas()
+                captured_at = frame["captured_at"].iloc[0].to_pydatetime() if len(frame) else None
+                return frame, captured_at
+        return None, None
+
+    def partitions(self):
+        """저장된 (카테고리, 날짜) 파티션 목록을 반환합니다."""
+        found = []
+        if not os.path.exists(self.root):
+            return found
+        for category_dir in sorted(os.listdir(self.root)):
+            if not category_dir.startswith("category="):
+                continue
+            for date_dir in sorted(os.listdir(os.path.join(self.root, category_dir))):
+                if date_dir.startswith("date="):
+                    found.append((category_dir.split("=", 1)[1], date_dir.split("=", 1)[1]))
+        return found
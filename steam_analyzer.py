@@ -0,0 +1,262 @@
+"""스팀 게임 데이터를 분석하는 SteamDataAnalyzer 클래스입니다.
+
+pandas/numpy를 불러오므로 수집만 하는 실행에서는 이 모듈을 import하지 않습니다.
+rank3에서도 `from rank3 import SteamDataAnalyzer`로 그대로 쓸 수 있습니다.
+"""
+import numpy as np
+import pandas as pd
+import os
+
+import metrics
+import price_normalize
+from tag_index import SortedColumnIndex, TagIndex, bitmap_to_positions
+from compact_frame import compact_frame, expand_frame, memory_report
+
+# 리뷰 요약 문구별 점수 (목록에 없는 문구는 0점)
+REVIEW_SCORE_MAP = {
+    'Overwhelmingly Positive': 10, 'Very Positive': 8, 'Positive': 7,
+    'Mostly Positive': 6, 'Mixed': 5, 'Mostly Negative': 4,
+    'Negative': 3, 'Very Negative': 2, 'Overwhelmingly Negative': 1
+}
+
+class SteamDataAnalyzer:
+    def __init__(self, games_data, compact=False):
+        self.df = pd.DataFrame(games_data)
+        with metrics.span("preprocess") as span:
+            self._preprocess_data()
+            span.add(rows=len(self.df))
+        # 태그 역색인과 숫자 열 범위 색인 (범위 색인은 처음 필요할 때 만듭니다)
+        self.tag_index = TagIndex.from_tags(self.df['tags'])
+        self._column_indexes = {}
+        # 압축 모드에서는 tags가 self.df 대신 self.tags(TagArray)에 들어 있습니다.
+        self.tags = None
+        self.is_compact = False
+        if compact:
+            self.compact()
+    
+    def _preprocess_data(self):
+        """데이터 전처리를 수행합니다. 행마다 파이썬 함수를 호출하지 않고 열 단위로 처리합니다."""
+        # 랭킹 설정 (수집할 때 구간 위치로 정한 순위가 있으면 그대로 씁니다)
+        ranks = pd.to_numeric(self.df['rank'], errors='coerce') if 'rank' in self.df else None
+        if ranks is not None and len(ranks) and (ranks > 0).all():
+            self.df['rank'] = ranks.astype(np.int64)
+        else:
+            self.df['rank'] = np.arange(1, len(self.df) + 1)
+        
+        # 가격 정보 정리 (통화 기호와 지역별 구분자를 해석해 통화의 기본 단위 금액으로 바꿉니다)
+        prices = price_normalize.normalize_prices(self.df['price'])
+        self.df['price_numeric'] = self._clean_price_column(self.df['price'], prices)
+        self.df['original_price_numeric'] = self._clean_price_column(self.df['original_price'])
+        self.df['price_currency'] = prices['currency']
+        
+        # 리뷰 점수 수치화: 범주형으로 바꾼 뒤 범주별 점수를 코드로 조회합니다.
+        review_scores = pd.Categorical(self.df['review_score'])
+        score_by_code = np.array(
+            [REVIEW_SCORE_MAP.get(category, 0) for category in review_scores.categories] + [0],
+            dtype=np.int64,
+        )
+        self.df['review_score'] = review_scores
+        # 코드 -1(결측값)은 마지막 원소인 0을 가리킵니다.
+        self.df['review_score_numeric'] = score_by_code[review_scores.codes]
+    
+    def _clean_price_column(self, prices, normalized=None):
+        """
+        가격 문자열 열 전체를 통화의 기본 단위 금액(예: 19.99)으로 변환합니다.
+        
+        고유값만 파싱하는 price_normalize를 쓰며, 이미 normalize_prices한 결과가 있으면 넘겨서
+        다시 계산하지 않습니다. 무료와 가격을 알 수 없는 값은 0입니다.
+        """
+        if normalized is None:
+            normalized = price_normalize.normalize_prices(prices)
+        return price_normalize.to_major(normalized).fillna(0.0).to_numpy(dtype=np.float64)
+    
+    def get_top_games(self, n=10, sort_by='rank'):
+        """상위 N개 게임을 반환합니다."""
+        if sort_by == 'rank':
+            return self.df.head(n)
+        elif sort_by == 'review_score':
+            return self.df.sort_values(['review_score_numeric', 'review_count'], 
+                                     ascending=False).head(n)
+        elif sort_by == 'price':
+            return self.df.sort_values('price_numeric').head(n)
+    
+    def get_statistics(self):
+        """
+        데이터 통계를 반환합니다.
+
+        price_numeric은 행마다 자기 통화의 금액이므로 통화끼리 섞어 평균하지 않습니다.
+        avg_price는 유료 게임에서 가장 많은 통화(price_currency)의 게임과 무료 게임으로 계산하고,
+        avg_price_by_currency에 통화별 유료 게임 평균 가격을 따로 둡니다.
+        """
+        paid = self.df[self.df['price_numeric'] > 0]
+        by_currency = paid.groupby('price_currency', observed=True)['price_numeric']
+        currency = by_currency.size().idxmax() if by_currency.ngroups else None
+        same_currency = (self.df['price_currency'] == currency) | (self.df['price_numeric'] == 0)
+        stats = {
+            "total_games": len(self.df),
+            "free_games": len(self.df[self.df['price_numeric'] == 0]),
+            "paid_games": len(paid),
+            "games_on_sale": len(self.df[self.df['discount'] > 0]),
+            "avg_price": self.df.loc[same_currency, 'price_numeric'].mean(),
+            "price_currency": currency,
+            "avg_price_by_currency": by_currency.mean().to_dict(),
+            "avg_discount": self.df['discount'].mean(),
+            "avg_review_score": self.df['review_score_numeric'].mean(),
+            "most_common_tags": self._get_most_common_tags()
+        }
+        return stats
+    
+    def _get_most_common_tags(self):
+        """가장 흔한 태그들을 반환합니다."""
+        return self.tag_index.most_common(5)
+    
+    def get_tag_counts(self, n=None):
+        """태그별 게임 수를 많은 순으로 반환합니다."""
+        counts = self.tag_index.counts
+        return (counts if n is None else counts.head(n)).to_dict()
+    
+    def _column_index(self, column):
+        index = self._column_indexes.get(column)
+        if index is None:
+            index = self._column_indexes[column] = SortedColumnIndex(self.df[column])
+        return index
+    
+    def find_games_by_tags(self, tags, match="all", max_price=None, min_price=None,
+                           min_discount=None, min_review_score=None):
+        """
+        태그와 조건으로 게임을 찾습니다. 색인의 비트맵만으로 계산하고 결과 행만 꺼냅니다.
+        
+        Parameters:
+        -----------
+        tags : list
+            찾을 태그 목록
+        match : str
+            'all'이면 모든 태그, 'any'이면 하나 이상의 태그가 붙은 게임
+        max_price : float
+            이 가격 미만인 게임만 (예: 10이면 $10 미만)
+        min_price : float
+            이 가격 이상인 게임만
+        min_discount : int
+            이 할인율(%) 이상인 게임만
+        min_review_score : int
+            이 리뷰 점수 이상인 게임만
+        
+        Returns:
+        --------
+        DataFrame: 조건에 맞는 게임 (랭킹 순)
+        """
+        if match == "all":
+            bitmap = self.tag_index.match_all(tags)
+        elif match == "any":
+            bitmap = self.tag_index.match_any(tags)
+        else:
+            raise ValueError("match는 'all' 또는 'any'여야 합니다.")
+        
+        conditions = [
+            ('price_numeric', min_price, max_price, False),
+            ('discount', min_discount, None, True),
+            ('review_score_numeric', min_review_score, None, True),
+        ]
+        for column, low, high, include_high in conditions:
+            if bitmap and (low is not None or high is not None):
+                bitmap &= self._column_index(column).range(low, high, include_high)
+        
+        return self.df.iloc[bitmap_to_positions(bitmap, len(self.df))]
+    
+    def compact(self):
+        """DataFrame을 범주형 문자열, 축소된 정수 타입, offsets 기반 태그 배열로 바꿉니다."""
+        if not self.is_compact:
+            self.df, self.tags = compact_frame(self.df)
+            self.is_compact = True
+        return self
+    
+    def to_frame(self):
+        """원래 열 구성(tags 리스트, url, image_url 포함)의 DataFrame을 반환합니다."""
+        if self.is_compact:
+            return expand_frame(self.df, self.tags)
+        return self.df
+    
+    def memory_report(self):
+        """열별 메모리 사용량을 압축 전(before_bytes)과 후(after_bytes)로 비교해 반환합니다."""
+        if self.is_compact:
+            return memory_report(self.to_frame(), self.df, self.tags)
+        compact, tags = compact_frame(self.df)
+        return memory_report(self.df, compact, tags)
+    
+    def save_data(self, filename="steam_games_ranking.csv", output_dir="./output"):
+        """데이터를 CSV 파일로 저장합니다."""
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        
+        filepath = os.path.join(output_dir, filename)
+        with metrics.span("save") as span:
+            self.to_frame().to_csv(filepath, index=False, encoding='utf-8-sig')
+            span.add(rows=len(self.df))
+        print(f"데이터가 {filepath}에 저장되었습니다.")
+        return filepath
+    
+    def save_snapshot(self, category, store=None, captured_at=None):
+        """데이터를 카테고리/날짜로 파티션된 Parquet 스냅샷 저장소에 추가합니다."""
+        from snapshot_store import SnapshotStore
+        
+        store = store or SnapshotStore()
+        with metrics.span("save") as span:
+            filepath = store.append(self.to_frame(), category, captured_at)
+            span.add(rows=len(self.df))
+        print(f"스냅샷이 {filepath}에 저장되었습니다.")
+        return filepath
+    
+    def save_delta(self, category, store=None, captured_at=None):
+        """
+        지난 상태와 달라진 행만 변경분으로 저장합니다.
+        
+        저장된 상태가 없거나 전체 스냅샷 주기가 되면 전체 스냅샷을 저장합니다.
+        
+        Returns:
+        --------
+        dict: DeltaStore.record()의 결과
+        """
+        from delta_store import DeltaStore
+        
+        store = store or DeltaStore()
+        with metrics.span("save") as span:
+            result = store.record(self.to_frame(), category, captured_at)
+            span.add(rows=len(self.df))
+        changes = result["changes"]
+        if result["mode"] == "full":
+            print(f"전체 스냅샷이 {result['path']}에 저장되었습니다.")
+        elif result["mode"] == "delta":
+            print(f"변경분({changes.summary()})이 {result['path']}에 저장되었습니다.")
+        else:
+            print("지난 수집 이후 바뀐 순위가 없어 저장하지 않았습니다.")
+        return result
+    
+    def save_history(self, category, region="US", history=None, captured_at=None):
+        """순위를 app_id 기준 랭킹 이력 데이터베이스에 기록합니다."""
+        from history_db import RankingHistory
+        
+        history = history or RankingHistory()
+        with metrics.span("save") as span:
+            count = history.record(self.df, category, region, captured_at)
+            span.add(rows=count)
+        print(f"랭킹 이력 {count}건이 {history.path}에 기록되었습니다.")
+        return count
+    
+    def create_visualizations(self, output_dir="./output", dpi=300, fmt="png", workers=None,
+                              force=False):
+        """
+        데이터 시각화를 생성합니다.
+        
+        입력 데이터가 지난번과 같은 차트는 다시 그리지 않고, 나머지는 프로세스 풀에서
+        동시에 그립니다. (자세한 내용은 charts.render_charts 참고)
+        """
+        from charts import render_charts
+        
+        with metrics.span("render"):
+            results = render_charts(self.df, output_dir=output_dir, dpi=dpi, fmt=fmt,
+                                    workers=workers, force=force)
+        skipped = sum(1 for result in results.values() if not result["rendered"])
+        if skipped:
+            print(f"변경되지 않은 차트 {skipped}개는 다시 그리지 않았습니다.")
+        print(f"시각화 파일들이 {output_dir}에 저장되었습니다.")
+        return results
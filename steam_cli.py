@@ -0,0 +1,227 @@
+"""스팀 랭킹 수집기의 명령줄 진입점입니다.
+
+cron처럼 자주 실행되는 환경을 위해 모듈을 import할 때는 표준 라이브러리만 불러오고,
+스크래퍼(requests)는 수집 단계에서, pandas와 matplotlib은 분석/차트 단계에서 처음 불러옵니다.
+
+사용법:
+    python steam_cli.py -c topsellers -p 3                # 수집 + 분석 + 차트
+    python steam_cli.py -c specials --bulk 1000 --no-analysis   # 수집만 (JSON Lines 저장)
+    python steam_cli.py -c topsellers specials free --no-charts  # 여러 카테고리 동시 수집
+    python steam_cli.py -c topsellers --incremental --no-charts  # 바뀐 순위만 저장
+    python steam_cli.py -c topsellers --bulk 500 --enrich  # 빠진 가격을 appdetails로 보완
+    python steam_cli.py -c topsellers --metrics-dir ./output/metrics  # 단계별 시간 보고서 저장
+    python steam_cli.py --import-report                   # 단계별 import 시간 측정
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+CATEGORIES = ("topsellers", "specials", "popularnew", "free")
+RAW_OUTPUT_DIR = "./output/raw"
+
+# import 시간 측정 대상: 이름 → (설명, 실행할 import 문)
+IMPORT_PROFILES = {
+    "cli": ("명령줄 진입점 (--help)", "import steam_cli"),
+    "scrape": ("수집만 (--no-analysis)", "import rank3"),
+    "analysis": ("분석 (pandas)", "import steam_analyzer"),
+    "charts": ("차트 (matplotlib)", "import matplotlib; matplotlib.use('Agg'); import matplotlib.pyplot"),
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="스팀 인기 게임 랭킹을 수집하고 분석합니다.")
+    parser.add_argument("-c", "--category", nargs="+", choices=CATEGORIES, default=["topsellers"],
+                        help="수집할 카테고리. 여러 개를 주면 한 프로세스에서 동시에 수집합니다 "
+                             "(기본값: topsellers)")
+    parser.add_argument("-p", "--pages", type=int, default=1,
+                        help="수집할 검색 페이지 수 (기본값: 1)")
+    parser.add_argument("--bulk", type=int, metavar="N",
+                        help="검색 결과 엔드포인트로 N개를 한꺼번에 수집합니다 (--pages 무시)")
+    parser.add_argument("--parser", default="auto",
+                        help="HTML 파서 백엔드 ('auto', 'lxml', 'selectolax', 'html.parser')")
+    parser.add_argument("--no-analysis", action="store_true",
+                        help="분석과 차트 없이 수집 결과만 JSON Lines로 저장합니다")
+    parser.add_argument("--no-charts", action="store_true",
+                        help="분석과 저장은 하되 차트는 그리지 않습니다")
+    parser.add_argument("--enrich", action="store_true",
+                        help="가격이 빠진 게임을 appdetails API로 묶어서 보완합니다")
+    parser.add_argument("--incremental", action="store_true",
+                        help="전체 스냅샷 대신 지난 상태와 달라진 행만 저장합니다 "
+                             "(전체 스냅샷은 하루에 한 번 저장)")
+    parser.add_argument("--output", metavar="PATH",
+                        help="--no-analysis일 때 저장할 파일 경로. 카테고리가 여러 개이면 폴더로 쓰거나 "
+                             "'{category}'가 들어간 경로 템플릿으로 씁니다")
+    parser.add_argument("--metrics-dir", metavar="DIR",
+                        help="단계별 시간/처리량을 DIR에 JSON 보고서와 Prometheus textfile로 저장합니다")
+    parser.add_argument("--import-report", action="store_true",
+                        help="단계별 import 시간을 측정해 출력하고 종료합니다")
+    parser.add_argument("--top", type=int, default=8,
+                        help="--import-report에서 단계별로 보여줄 모듈 수 (기본값: 8)")
+    return parser
+
+
+def parse_importtime(stderr):
+    """
+    `python -X importtime` 출력을 (모듈 이름, 깊이, 자체 시간, 누적 시간) 리스트로 바꿉니다.
+
+    시간 단위는 마이크로초이고, 깊이 0은 실행한 import 문이 직접 불러온 모듈입니다.
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # 머리글 줄
+        stripped = name.lstrip(" ")
+        depth = (len(name) - len(stripped) - 1) // 2
+        entries.append((stripped, depth, int(self_us), int(cumulative_us)))
+    return entries
+
+
+def measure_imports(statement):
+    """새 인터프리터에서 statement를 실행해 (import 목록, 실행 시간(초))을 반환합니다."""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return parse_importtime(result.stderr), elapsed
+
+
+def print_import_report(top=8):
+    """실행 단계별로 import 시간과 가장 무거운 모듈을 출력합니다."""
+    print("⏱️ 단계별 import 시간 (각각 새 인터프리터에서 측정)")
+    for name, (label, statement) in IMPORT_PROFILES.items():
+        try:
+            entries, elapsed = measure_imports(statement)
+        except RuntimeError as e:
+            print(f"\n[{name}] {label}: 측정 실패 ({e})")
+            continue
+
+        # 인터프리터 시작 때 불러온 모듈(site와 그 하위 모듈, site보다 먼저 출력됨)은 뺍니다.
+        startup = [i for i, entry in enumerate(entries) if entry[:2] == ("site", 0)]
+        if startup:
+            entries = entries[startup[0] + 1:]
+        top_level = [entry for entry in entries if entry[1] == 0]
+        import_ms = sum(entry[3] for entry in top_level) / 1000
+        print(f"\n[{name}] {label}: import {import_ms:.1f}ms, 프로세스 전체 {elapsed * 1000:.0f}ms "
+              f"({len(entries)}개 모듈)")
+
+        heaviest = sorted((entry for entry in entries if entry[1] <= 1),
+                          key=lambda entry: entry[3], reverse=True)[:top]
+        for module, depth, _, cumulative_us in heaviest:
+            print(f"  {'  ' * depth}{module:<40} {cumulative_us / 1000:8.1f}ms")
+
+
+def save_raw(games_data, category, path=None):
+    """
+    수집 결과를 pandas 없이 JSON Lines 파일로 저장합니다.
+
+    path에 '{category}'가 있으면 카테고리 이름으로 바꾸고, 없으면 RAW_OUTPUT_DIR에 저장합니다.
+    """
+    if path is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(RAW_OUTPUT_DIR, f"{category}_{timestamp}.jsonl")
+    elif "{category}" in path:
+        path = path.replace("{category}", category)
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    with open(path, "w", encoding="utf-8") as f:
+        for game in games_data:
+            f.write(json.dumps(game, ensure_ascii=False) + "\n")
+    print(f"수집 결과가 {path}에 저장되었습니다.")
+    return path
+
+
+def run(args):
+    categories = list(dict.fromkeys(args.category))
+    if len(categories) > 1:
+        return run_many(args, categories)
+    category = categories[0]
+
+    # 수집 단계에서 처음으로 스크래퍼(requests, HTML 파서)를 불러옵니다.
+    import rank3
+
+    scraper = rank3.SteamGameScraper(parser=args.parser)
+    if args.bulk:
+        print(f"📊 '{category}' 카테고리에서 {args.bulk}개 수집 시작...")
+        games_data = scraper.get_top_games_bulk(total=args.bulk, category=category)
+    else:
+        print(f"📊 '{category}' 카테고리에서 {args.pages}페이지 수집 시작...")
+        games_data = scraper.get_top_games(page_count=args.pages, category=category,
+                                           async_mode=args.pages > 1)
+
+    if not games_data:
+        print("❌ 데이터를 수집할 수 없습니다.")
+        return 1
+    print(f"✅ {len(games_data)}개 게임 정보 수집 완료!")
+
+    if args.enrich:
+        import app_details
+        app_details.enrich(games_data, base_url=scraper.base_url)
+
+    if args.no_analysis:
+        save_raw(games_data, category, args.output)
+    else:
+        rank3.analyze_and_save(games_data, category, visualize=not args.no_charts,
+                               incremental=args.incremental, region=scraper.region)
+    return 0
+
+
+def run_many(args, categories):
+    """여러 카테고리를 collect_job으로 동시에 수집해 하나의 스냅샷으로 저장합니다."""
+    import collect_job
+    import rank3
+
+    # 수집과 appdetails 보완이 같은 스토어 주소/지역을 쓰도록 스크래퍼를 하나 만들어 넘깁니다.
+    scraper = rank3.SteamGameScraper(parser=args.parser)
+    if not args.no_analysis:
+        result = collect_job.run(categories, page_count=args.pages, total=args.bulk,
+                                 incremental=args.incremental, enrich=args.enrich, scraper=scraper)
+        return 0 if result.records else 1
+
+    result = collect_job.collect(categories, page_count=args.pages, total=args.bulk, scraper=scraper)
+    if not result.records:
+        print("❌ 데이터를 수집할 수 없습니다.")
+        return 1
+    if args.enrich:
+        import app_details
+        app_details.enrich(list(result.records.values()), base_url=scraper.base_url,
+                           region=scraper.region)
+    output = args.output
+    if output and "{category}" not in output:
+        # 카테고리마다 파일이 따로 생기므로 --output은 저장 폴더로 봅니다.
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = os.path.join(output, f"{{category}}_{timestamp}.jsonl")
+    for category, games in result.rankings.items():
+        save_raw(games, category, output)
+    return 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.import_report:
+        print_import_report(args.top)
+        return 0
+
+    import metrics
+    try:
+        return run(args)
+    finally:
+        metrics.print_summary()
+        if args.metrics_dir:
+            categories = ",".join(dict.fromkeys(args.category))
+            report_path, prom_path = metrics.export(args.metrics_dir, categories=categories)
+            print(f"실행 보고서: {report_path}, Prometheus: {prom_path}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""태그 역색인입니다.
+
+태그마다 그 태그가 붙은 행 위치 목록(posting list)과 개수를 미리 만들어 두고,
+여러 태그의 교집합이나 가격 같은 조건과의 결합은 비트맵(파이썬 정수) AND로 계산합니다.
+DataFrame을 행마다 훑지 않고 태그 통계와 필터링을 할 수 있습니다.
+"""
+import numpy as np
+import pandas as pd
+
+
+def positions_to_bitmap(positions, size):
+    """행 위치 배열을 비트맵(파이썬 정수)으로 바꿉니다. i번째 비트가 i번째 행입니다."""
+    mask = np.zeros(size, dtype=bool)
+    mask[positions] = True
+    return int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+
+
+def bitmap_to_positions(bitmap, size):
+    """비트맵을 오름차순 행 위치 배열로 바꿉니다."""
+    if bitmap == 0 or size == 0:
+        return np.empty(0, dtype=np.int64)
+    raw = np.frombuffer(bitmap.to_bytes((size + 7) // 8, "little"), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(raw, bitorder="little")[:size])
+
+
+class TagIndex:
+    """태그 → 행 위치 역색인과 태그별 개수를 보관합니다."""
+
+    def __init__(self, postings, size):
+        self.postings = postings
+        self.size = size
+        self.counts = pd.Series({tag: len(rows) for tag, rows in postings.items()},
+                                dtype="int64").sort_values(ascending=False, kind="stable")
+        self._bitmaps = {}
+
+    @classmethod
+    def from_tags(cls, tags):
+        """행마다 태그 리스트가 들어 있는 Series로 색인을 만듭니다."""
+        size = len(tags)
+        lists = pd.Series([value if isinstance(value, (list, tuple)) else [] for value in tags])
+        exploded = lists.explode()
+        codes, vocabulary = pd.factorize(exploded, use_na_sentinel=True)
+        rows = exploded.index.to_numpy()
+
+        valid = codes >= 0
+        codes, rows = codes[valid], rows[valid]
+
+        # 태그 코드 순으로 정렬한 뒤 태그별 구간으로 잘라 posting list를 만듭니다.
+        order = np.argsort(codes, kind="stable")
+        codes, rows = codes[order], rows[order]
+        boundaries = np.cumsum(np.bincount(codes, minlength=len(vocabulary)))[:-1]
+        postings = {
+            tag: np.unique(positions)
+            for tag, positions in zip(vocabulary, np.split(rows, boundaries))
+        }
+        return cls(postings, size)
+
+    def most_common(self, n=5):
+        """가장 많이 쓰인 태그 n개를 {태그: 개수}로 반환합니다."""
+        return self.counts.head(n).to_dict()
+
+    def bitmap(self, tag):
+        """태그가 붙은 행들의 비트맵을 반환합니다."""
+        bitmap = self._bitmaps.get(tag)
+        if bitmap is None:
+            rows = self.postings.get(tag)
+            bitmap = 0 if rows is None else positions_to_bitmap(rows, self.size)
+            self._bitmaps[tag] = bitmap
+        return bitmap
+
+    def match_all(self, tags):
+        """모든 태그가 붙은 행들의 비트맵을 반환합니다."""
+        tags = list(tags)
+        if not tags:
+            return (1 << self.size) - 1
+        # 개수가 적은 태그부터 AND하면 빨리 0이 되어 일찍 끝낼 수 있습니다.
+        tags.sort(key=lambda tag: len(self.postings.get(tag, ())))
+        result = self.bitmap(tags[0])
+        for tag in tags[1:]:
+            if not result:
+                break
+            result &= self.bitmap(tag)
+        return result
+
+    def match_any(self, tags):
+        """태그 중 하나라도 붙은 행들의 비트맵을 반환합니다."""
+        result = 0
+        for tag in tags:
+            result |= self.bitmap(tag)
+        return result
+
+
+class SortedColumnIndex:
+    """숫자 열을 정렬해 두고 범위 조건을 비트맵으로 바꿔 주는 색인입니다."""
+
+    def __init__(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        self.size = len(values)
+        self.order = np.argsort(values, kind="stable")
+        self.sorted_values = values[self.order]
+
+    def range(self, low=None, high=None, include_high=True):
+        """low <= 값 <= high(include_high=False이면 < high)인 행들의 비트맵을 반환합니다."""
+        start = 0 if low is None else np.searchsorted(self.sorted_values, low, side="left")
+        side = "right" if include_high else "left"
+        stop = self.size if high is None else np.searchsorted(self.sorted_values, high, side=side)
+        return positions_to_bitmap(self.order[start:stop], self.size)
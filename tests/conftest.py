@@ -0,0 +1,45 @@
+"""테스트 공통 설정입니다.
+
+수집기는 benchmarks/stand_in_server.py의 로컬 서버에 요청하므로 실제 스토어에 접속하지 않습니다.
+"""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import http_client  # noqa: E402
+import stand_in_server  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def stand_in():
+    """로컬 서버를 한 번 띄우고 (서버, base_url)을 반환합니다."""
+    # 테스트끼리 HTTP 캐시를 나눠 쓰지 않도록 끕니다.
+    http_client.configure_cache(enabled=False)
+    server, base_url = stand_in_server.start(catalog_size=1000)
+    yield server, base_url
+    server.shutdown()
+
+
+@pytest.fixture
+def handler(stand_in):
+    """요청 수와 추가 리뷰를 비운 서버 핸들러 클래스입니다."""
+    handler = stand_in[0].RequestHandlerClass
+    handler.request_counts.clear()
+    handler.extra_reviews.clear()
+    return handler
+
+
+@pytest.fixture
+def base_url(stand_in, handler):
+    return stand_in[1]
+
+
+@pytest.fixture(autouse=True)
+def _work_dir(tmp_path, monkeypatch):
+    # 기본 경로(./output 등)에 쓰는 코드가 저장소를 더럽히지 않도록 임시 폴더에서 실행합니다.
+    monkeypatch.chdir(tmp_path)
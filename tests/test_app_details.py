@@ -0,0 +1,60 @@
+import math
+
+from app_details import AppDetailsCache, AppDetailsEnricher, needs_details
+from rank3 import SteamGameScraper
+
+
+def _games(base_url, total=300):
+    scraper = SteamGameScraper()
+    scraper.base_url = base_url
+    return scraper.get_top_games_bulk(total=total, rate=1000)
+
+
+def _enricher(base_url, tmp_path, **options):
+    return AppDetailsEnricher(base_url=base_url, cache=AppDetailsCache(str(tmp_path / "details.sqlite")),
+                              rate=1000, **options)
+
+
+def test_complete_rows_send_no_requests(base_url, handler, tmp_path):
+    games = _games(base_url)
+    assert not any(needs_details(game) for game in games)
+
+    filled = _enricher(base_url, tmp_path).enrich(games, details=True)
+
+    assert filled["requests"] == 0
+    assert handler.request_counts.get("/api/appdetails", 0) == 0
+
+
+def test_missing_prices_are_batched(base_url, handler, tmp_path):
+    games = _games(base_url)
+    paid = [game for game in games if game["price"].startswith("$")][:150]
+    expected = {game["app_id"]: game["price"] for game in paid}
+    for game in paid:
+        game["price"] = "N/A"
+
+    enricher = _enricher(base_url, tmp_path, batch_size=40)
+    filled = enricher.enrich(games)
+
+    assert filled == {"price": 150, "details": 0, "requests": math.ceil(150 / 40)}
+    assert handler.request_counts["/api/appdetails"] == math.ceil(150 / 40)
+    assert all(game["price"] == expected[game["app_id"]] for game in paid)
+
+    # 같은 캐시로 다시 보완하면 요청하지 않습니다.
+    for game in paid:
+        game["price"] = "N/A"
+    assert enricher.enrich(games)["requests"] == 0
+
+
+def test_details_fill_genres_without_touching_tags(base_url, handler, tmp_path):
+    games = _games(base_url, total=100)
+    targets = games[:5]
+    tags = {game["app_id"]: list(game["tags"]) for game in games}
+    for game in targets:
+        game["release_date"] = "N/A"
+
+    filled = _enricher(base_url, tmp_path).enrich(games, details=True)
+
+    assert filled == {"price": 0, "details": 5, "requests": 5}
+    assert all(game["release_date"] != "N/A" and game["genres"] for game in targets)
+    assert all(game["tags"] == tags[game["app_id"]] for game in games)
+    assert not any("genres" in game for game in games[5:])
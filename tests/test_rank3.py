@@ -0,0 +1,33 @@
+from rank3 import SteamGameScraper
+
+
+def _scraper(base_url):
+    scraper = SteamGameScraper()
+    scraper.base_url = base_url
+    return scraper
+
+
+def test_bulk_ranks_follow_catalog_order(base_url):
+    games = _scraper(base_url).get_top_games_bulk(total=250, rate=1000)
+
+    assert [game["rank"] for game in games] == list(range(1, 251))
+
+
+def test_failed_window_keeps_later_ranks(base_url, monkeypatch):
+    expected = {game["app_id"]: game["rank"]
+                for game in _scraper(base_url).get_top_games_bulk(total=400, rate=1000)}
+
+    scraper = _scraper(base_url)
+    fetch = scraper._fetch_bulk_games
+
+    def failing(start, count, category, records=None):
+        if start == 200:
+            raise ConnectionError("stand-in failure")
+        return fetch(start, count, category, records)
+
+    monkeypatch.setattr(scraper, "_fetch_bulk_games", failing)
+    games = scraper.get_top_games_bulk(total=400, rate=1000)
+
+    ranks = [game["rank"] for game in games]
+    assert ranks == [*range(1, 201), *range(301, 401)]
+    assert all(expected[game["app_id"]] == game["rank"] for game in games)
@@ -0,0 +1,28 @@
+import region_matrix
+from rank3 import SteamGameScraper
+
+
+def test_regions_share_catalog_ranks(base_url):
+    rankings = region_matrix.collect_regions(["US", "KR"], total=250, rate=1000, base_url=base_url)
+
+    for games in rankings.values():
+        assert [game["rank"] for game in games] == list(range(1, 251))
+    assert ([game["app_id"] for game in rankings["US"]]
+            == [game["app_id"] for game in rankings["KR"]])
+
+
+def test_failed_region_window_keeps_later_ranks(base_url, monkeypatch):
+    fetch = SteamGameScraper._fetch_bulk_games
+
+    def failing(self, start, count, category, records=None):
+        if self.region == "KR" and start == 100:
+            raise ConnectionError("stand-in failure")
+        return fetch(self, start, count, category, records)
+
+    monkeypatch.setattr(SteamGameScraper, "_fetch_bulk_games", failing)
+    rankings = region_matrix.collect_regions(["US", "KR"], total=300, rate=1000, base_url=base_url)
+
+    assert [game["rank"] for game in rankings["US"]] == list(range(1, 301))
+    assert [game["rank"] for game in rankings["KR"]] == [*range(1, 101), *range(201, 301)]
+    us_ids = {game["rank"]: game["app_id"] for game in rankings["US"]}
+    assert all(us_ids[game["rank"]] == game["app_id"] for game in rankings["KR"])
@@ -0,0 +1,45 @@
+from review_ingest import ReviewIngester, ReviewStore
+from stand_in_server import build_reviews
+
+APP_ID = 10
+
+
+def _ingester(base_url, tmp_path, max_pages):
+    store = ReviewStore(str(tmp_path / "reviews.sqlite"))
+    return ReviewIngester(base_url=base_url, store=store, rate=1000, max_pages=max_pages, page_size=20)
+
+
+def _stored(ingester):
+    return len(list(ingester.store.reviews(APP_ID)))
+
+
+def test_backfill_converges_with_one_page_per_run(base_url, handler, tmp_path):
+    ingester = _ingester(base_url, tmp_path, max_pages=1)
+    total = len(build_reviews(APP_ID))
+    runs = 0
+    while ingester.store.state(APP_ID)["backfill_cursor"] is not None or runs == 0:
+        result = ingester.refresh([APP_ID])[APP_ID]
+        runs += 1
+        assert runs <= total // 20 + 2
+
+    assert result["complete"]
+    assert _stored(ingester) == total
+    # 요청 수는 작업 스레드가 아니라 이벤트 루프에서 세므로 서버가 받은 수와 같습니다.
+    assert ingester.requests_sent == handler.request_counts[f"/appreviews/{APP_ID}"]
+
+
+def test_new_reviews_arrive_while_backfill_is_pending(base_url, handler, tmp_path):
+    ingester = _ingester(base_url, tmp_path, max_pages=1)
+    ingester.refresh([APP_ID])
+    assert ingester.store.state(APP_ID)["backfill_cursor"] is not None
+
+    handler.extra_reviews[APP_ID] = 5
+    result = ingester.refresh([APP_ID])[APP_ID]
+    newest = build_reviews(APP_ID, 5)[-1]["timestamp_created"]
+    assert ingester.store.state(APP_ID)["newest"] == newest
+    assert result["new"] >= 5
+
+    for _ in range(len(build_reviews(APP_ID, 5)) // 20 + 2):
+        if ingester.refresh([APP_ID])[APP_ID]["complete"]:
+            break
+    assert _stored(ingester) == len(build_reviews(APP_ID, 5))